@@ -4,6 +4,7 @@ Ce fichier définit des 'fixtures' réutilisables pour les tests.
 """
 
 import pytest
+import triangulator.app as app_module
 from triangulator.app import app as flask_app
 
 
@@ -32,4 +33,17 @@ def client(app):
     'scope="function"' signifie qu'un nouveau client est créé pour chaque test.
     """
     # Crée un client de test à partir de l'application
-    return app.test_client()
\ No newline at end of file
+    return app.test_client()
+
+
+@pytest.fixture(autouse=True)
+def vider_caches():
+    """Vide les caches de l'application avant chaque test.
+
+    Les tests réutilisent le même UUID avec des PointSetManager simulés
+    différents : une entrée laissée par un test fausserait le suivant.
+    """
+    app_module.POINTSET_CACHE.clear()
+    app_module.RESULT_CACHE.clear()
+    app_module.JOB_RESULTS.clear()
+    yield
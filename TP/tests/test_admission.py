@@ -0,0 +1,111 @@
+"""Tests Unitaires pour le contrôle d'admission."""
+
+import pytest
+from triangulator.admission import (
+    DEFAULT_MAX_COST,
+    EAR_CLIPPING_COST,
+    SECONDS_PER_COST,
+    SYNC_TIMEOUT_SHARE,
+    AdmissionPolicy,
+    AsyncRequiredError,
+    TooExpensiveError,
+    estimate_cost,
+    sync_cost_limit,
+)
+
+
+def test_cout_par_moteur():
+    """Vérifie le modèle de coût : Ear Clipping possible, sauf en Delaunay."""
+    ear_clipping = EAR_CLIPPING_COST * 1024 ** 2
+    assert estimate_cost(1024, "polygon", sweep_threshold=2000) == (
+        pytest.approx(ear_clipping)
+    )
+    # Au-delà du seuil, le balayage est tenté avant l'Ear Clipping
+    assert estimate_cost(1024, "polygon", sweep_threshold=1000) == (
+        pytest.approx(ear_clipping + 1024 * 10)
+    )
+    assert estimate_cost(1024, "sweep") == pytest.approx(ear_clipping + 1024 * 10)
+    assert estimate_cost(1024, "delaunay") == 1024 * 10
+    assert estimate_cost(0, "polygon") > 0
+
+
+def test_nuage_non_simple_refuse():
+    """Vérifie qu'un grand ensemble non simple est refusé, même en tâche."""
+    policy = AdmissionPolicy()
+
+    # Un nuage d'un million de points, donné au moteur "polygon", finirait
+    # en Ear Clipping : des heures de calcul
+    with pytest.raises(TooExpensiveError):
+        policy.check(1_000_000, "polygon", 1000, sync=False)
+    with pytest.raises(TooExpensiveError):
+        policy.check(1_000_000, "sweep", 1000, sync=False)
+    policy.check(1_000_000, "delaunay", 1000, sync=False)
+    assert estimate_cost(1_000_000, "polygon") > DEFAULT_MAX_COST
+
+
+def test_politique_limites():
+    """Vérifie les deux limites, et qu'une limite à 0 est désactivée."""
+    policy = AdmissionPolicy(
+        sync_max_cost=EAR_CLIPPING_COST * 100.5 ** 2,
+        max_cost=EAR_CLIPPING_COST * 1000.5 ** 2,
+    )
+
+    policy.check(100, "polygon", 1000)  # admis
+    with pytest.raises(AsyncRequiredError):
+        policy.check(101, "polygon", 1000)
+    policy.check(101, "polygon", 1000, sync=False)
+    with pytest.raises(TooExpensiveError) as exc_info:
+        policy.check(1001, "polygon", 2000, sync=False)
+    assert exc_info.value.count == 1001
+
+    AdmissionPolicy(sync_max_cost=0, max_cost=0).check(10**9, "polygon", 10**9)
+
+
+def test_limite_absolue_deduite_du_delai_des_taches():
+    """Vérifie qu'un calcul qui ne tiendrait pas dans une tâche est refusé."""
+    policy = AdmissionPolicy(max_cost=0, async_timeout=60.0)
+    assert policy.absolute_limit == sync_cost_limit(60.0)
+
+    policy.check(100_000, "delaunay", 1000, sync=False)
+    with pytest.raises(TooExpensiveError) as exc_info:
+        policy.check(20_000, "polygon", 50_000, sync=False)
+    assert exc_info.value.limit == sync_cost_limit(60.0)
+    # Refusé d'emblée, sans redirection vers une tâche vouée à l'échec
+    with pytest.raises(TooExpensiveError):
+        policy.check(20_000, "polygon", 50_000, timeout=30.0)
+
+    # La plus petite des deux limites s'applique
+    assert AdmissionPolicy(max_cost=1.0, async_timeout=60.0).absolute_limit == 1.0
+
+
+@pytest.mark.parametrize("timeout", [1.0, 30.0, 120.0])
+def test_limite_synchrone_deduite_du_delai(timeout):
+    """Vérifie qu'un calcul admis en synchrone tient dans le délai."""
+    policy = AdmissionPolicy(max_cost=0)
+
+    def admitted(count):
+        try:
+            policy.check(count, "delaunay", 1000, timeout=timeout)
+        except AsyncRequiredError:
+            return False
+        return True
+
+    # Plus grand nombre de points admis (le coût croît avec count)
+    low, high = 3, 10**9
+    while low < high:
+        middle = (low + high + 1) // 2
+        low, high = (middle, high) if admitted(middle) else (low, middle - 1)
+
+    def duration(count):
+        return estimate_cost(count, "delaunay") * SECONDS_PER_COST
+
+    assert duration(low) <= timeout * SYNC_TIMEOUT_SHARE < duration(low + 1)
+    assert sync_cost_limit(timeout) == pytest.approx(
+        timeout * SYNC_TIMEOUT_SHARE / SECONDS_PER_COST
+    )
+    # Sans échéance, seule une limite fixée explicitement s'applique
+    assert admitted(low + 1) is False
+    policy.check(low + 1, "delaunay", 1000)
+    # Délai écoulé : plus rien n'est admis en synchrone
+    with pytest.raises(AsyncRequiredError):
+        policy.check(3, "delaunay", 1000, timeout=0.0)
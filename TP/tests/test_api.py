@@ -4,11 +4,25 @@ Ce fichier teste le service Flask (app.py)
 en simulant (mockant) sa seule dépendance externe : le PointSetManager.
 """
 
+import json
 import struct
+import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from urllib.error import HTTPError, URLError
 from uuid import UUID
 
+import pytest
+import triangulator.admission as admission
+import triangulator.app as app_module
+import triangulator.binary_utils as binary_utils
+import triangulator.core as core
+import triangulator.profiling as profiling
+import triangulator.workers as workers
 from triangulator.binary_utils import BinaryFormatError
+from triangulator.deadline import DeadlineExceeded
+from triangulator.store import TriangulationStore
 
 # UUID de test valide
 VALID_UUID = UUID("123e4567-e89b-12d3-a456-426614174000")
@@ -46,8 +60,8 @@ def test_api_triangulate_success(client, mocker):
     )
     # Mock la désérialisation
     mocker.patch(
-        "triangulator.app.binary_utils.binary_to_pointset",
-        return_value=[(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)]
+        "triangulator.app.binary_utils.binary_to_coords",
+        return_value=array("f", [0.0, 0.0, 1.0, 0.0, 1.0, 1.0, 0.0, 1.0])
     )
     # mock le calcul (le "cerveau")
     mocker.patch(
@@ -57,11 +71,11 @@ def test_api_triangulate_success(client, mocker):
             [(0, 1, 2), (0, 2, 3)]  # triangles
         )
     )
-    # Mock la sérialisation
-    mocker.patch(
-        "triangulator.app.binary_utils.triangles_to_binary",
-        return_value=FAKE_TRIANGLES_BYTES
-    )
+    # Espionner la sérialisation : sommets inchangés, la partie Vertices
+    # est reprise du PointSet reçu et seuls les indices sont encodés
+    spy_vertices = mocker.spy(binary_utils, "vertices_section")
+    spy_triangles = mocker.spy(binary_utils, "triangles_section_to_binary")
+    spy_mesh = mocker.spy(binary_utils, "mesh_to_binary")
 
     response = client.get(f"/triangulation/{VALID_UUID}")
 
@@ -69,11 +83,870 @@ def test_api_triangulate_success(client, mocker):
     assert response.status_code == 200
     assert response.mimetype == "application/octet-stream"
     assert response.data == FAKE_TRIANGLES_BYTES
+    spy_vertices.assert_called_once_with(FAKE_POINTSET_BYTES, 4)
+    assert list(spy_triangles.call_args.args[0]) == [0, 1, 2, 0, 2, 3]
+    spy_mesh.assert_not_called()
+
+
+def test_api_triangulate_moteur_delaunay(client, mocker):
+    """Teste le choix du moteur via le paramètre de requête 'engine'."""
+    mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        return_value=FAKE_POINTSET_BYTES
+    )
+    mock_compute = mocker.patch(
+        "triangulator.app.core.compute_triangulation",
+        return_value=(
+            [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)],
+            [(0, 1, 2), (0, 2, 3)]
+        )
+    )
+
+    response = client.get(f"/triangulation/{VALID_UUID}?engine=delaunay")
+
+    assert response.status_code == 200
+    assert mock_compute.call_args.kwargs["engine"] == "delaunay"
+
+
+def test_api_entete_chemin_de_calcul(client, mocker):
+    """Teste l'en-tête X-Triangulation-Path (pipeline réel, carré convexe)."""
+    mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        return_value=FAKE_POINTSET_BYTES
+    )
+
+    response = client.get(f"/triangulation/{VALID_UUID}")
+
+    assert response.status_code == 200
+    assert response.headers["X-Triangulation-Path"] == "convex"
+    assert response.data == FAKE_TRIANGLES_BYTES
+
+
+def test_api_moteur_balayage(client, mocker):
+    """Teste engine=sweep et le seuil configuré (pipeline réel)."""
+    mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        return_value=FAKE_POINTSET_BYTES
+    )
+    mock_seuil = mocker.patch("triangulator.app.SWEEP_THRESHOLD", 1234)
+    spy = mocker.spy(core, "compute_triangulation")
+
+    response = client.get(f"/triangulation/{VALID_UUID}?engine=sweep")
+
+    assert response.status_code == 200
+    assert response.headers["X-Triangulation-Path"] == "sweep"
+    assert spy.call_args.kwargs["sweep_threshold"] == mock_seuil
+
+
+def test_api_nuage_au_dela_du_seuil(client, mocker):
+    """Teste un nuage au-delà du seuil du balayage : repli, pas d'erreur 500."""
+    import random
+
+    rng = random.Random(2000)
+    coords = [rng.uniform(0.0, 1000.0) for _ in range(2 * 2000)]
+    mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        return_value=struct.pack("!I", 2000) + struct.pack("!4000f", *coords)
+    )
+
+    response = client.get(f"/triangulation/{VALID_UUID}")
+
+    assert response.status_code == 200
+    assert response.headers["X-Triangulation-Path"] == "earclipping"
+
+
+def test_api_reprise_des_octets_du_pointset(client, mocker):
+    """Teste la reprise telle quelle de la partie Vertices (aucun doublon)."""
+    mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        return_value=FAKE_POINTSET_BYTES
+    )
+    spy = mocker.spy(binary_utils, "triangles_to_binary")
+
+    response = client.get(f"/triangulation/{VALID_UUID}")
+
+    assert response.status_code == 200
+    assert response.data == FAKE_TRIANGLES_BYTES
+    assert response.content_length == len(FAKE_TRIANGLES_BYTES)
+    assert all(isinstance(chunk, bytes) for chunk in response.response)
+    spy.assert_not_called()
+
+
+def test_api_doublons_reencodes(client, mocker):
+    """Teste le repli sur la sérialisation complète si des doublons sont retirés."""
+    mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        return_value=FAKE_POINTSET_BYTES
+    )
+    # Désérialisation simulée : 5 points, dont un doublon du 4e
+    mocker.patch(
+        "triangulator.app.binary_utils.binary_to_coords",
+        return_value=array(
+            "f", [0.0, 0.0, 1.0, 0.0, 1.0, 1.0, 0.0, 1.0, 0.0, 1.0]
+        )
+    )
+    spy = mocker.spy(binary_utils, "triangles_to_binary")
+
+    response = client.get(f"/triangulation/{VALID_UUID}")
+
+    assert response.status_code == 200
+    assert response.data == FAKE_TRIANGLES_BYTES
+    spy.assert_called_once()
+
+
+def test_api_cache_pointset(client, mocker):
+    """Teste qu'un PointSet déjà récupéré est resservi sans appel réseau."""
+    mock_fetch = mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        return_value=FAKE_POINTSET_BYTES
+    )
+
+    first = client.get(f"/triangulation/{VALID_UUID}")
+    second = client.get(f"/triangulation/{VALID_UUID}?engine=delaunay")
+
+    assert first.status_code == second.status_code == 200
+    mock_fetch.assert_called_once()
+
+
+def test_api_cache_resultat_et_etag(client, mocker):
+    """Teste l'ETag fort et le cache des réponses déjà sérialisées."""
+    mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        return_value=FAKE_POINTSET_BYTES
+    )
+    spy = mocker.spy(core, "compute_triangulation")
+
+    first = client.get(f"/triangulation/{VALID_UUID}")
+    second = client.get(f"/triangulation/{VALID_UUID}")
+    other = client.get(f"/triangulation/{VALID_UUID}?engine=delaunay")
+
+    etag, weak = first.get_etag()
+    assert etag and not weak
+    assert second.get_etag() == (etag, False)
+    assert second.data == first.data == FAKE_TRIANGLES_BYTES
+    assert second.headers["X-Triangulation-Path"] == "convex"
+    assert other.get_etag()[0] != etag
+    assert spy.call_count == 2  # polygon puis delaunay, pas de recalcul
+
+
+def test_api_reponse_en_flux(client, mocker):
+    """Teste le mode flux : mêmes octets, sans Content-Length (chunked)."""
+    mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        return_value=FAKE_POINTSET_BYTES
+    )
+    mocker.patch.object(app_module, "STREAM_THRESHOLD_BYTES", 0)
+
+    first = client.get(f"/triangulation/{VALID_UUID}")
+    second = client.get(f"/triangulation/{VALID_UUID}")  # depuis le cache
+
+    assert first.status_code == 200
+    assert "Content-Length" not in first.headers
+    assert first.data == second.data == FAKE_TRIANGLES_BYTES
+
+
+def test_api_if_none_match_304(client, mocker):
+    """Teste le Cas 304 : ni PointSetManager ni calcul."""
+    mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        return_value=FAKE_POINTSET_BYTES
+    )
+    etag = client.get(f"/triangulation/{VALID_UUID}").get_etag()[0]
+    mock_fetch = mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager"
+    )
+    spy = mocker.spy(core, "compute_triangulation")
+
+    response = client.get(
+        f"/triangulation/{VALID_UUID}",
+        headers={"If-None-Match": f'"autre", "{etag}"'}
+    )
+
+    assert response.status_code == 304
+    assert response.data == b""
+    assert response.get_etag() == (etag, False)
+    mock_fetch.assert_not_called()
+    spy.assert_not_called()
+
+
+def test_api_stockage_disque(client, mocker, tmp_path):
+    """Teste le service d'un résultat depuis le disque après redémarrage."""
+    mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        return_value=FAKE_POINTSET_BYTES
+    )
+    mocker.patch(
+        "triangulator.app.TRIANGULATION_STORE",
+        TriangulationStore(str(tmp_path), 1024 * 1024)
+    )
+    client.get(f"/triangulation/{VALID_UUID}")
+    # Redémarrage simulé : caches mémoire vides, disque conservé
+    app_module.POINTSET_CACHE.clear()
+    app_module.RESULT_CACHE.clear()
+    spy = mocker.spy(core, "compute_triangulation")
+
+    response = client.get(f"/triangulation/{VALID_UUID}")
+
+    assert response.status_code == 200
+    assert response.data == FAKE_TRIANGLES_BYTES
+    assert response.content_length == len(FAKE_TRIANGLES_BYTES)
+    assert response.headers["X-Triangulation-Path"] == "convex"
+    spy.assert_not_called()
+
+
+
+def test_api_stockage_disque_en_echec(client, mocker, tmp_path):
+    """Teste qu'un échec d'écriture sur disque ne fait pas échouer la requête."""
+    mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        return_value=FAKE_POINTSET_BYTES
+    )
+    store = TriangulationStore(str(tmp_path), 1024 * 1024)
+    mocker.patch.object(store, "put", side_effect=OSError(28, "No space left"))
+    mocker.patch("triangulator.app.TRIANGULATION_STORE", store)
+    errors = app_module.STORE_ERRORS.value()
+
+    response = client.get(f"/triangulation/{VALID_UUID}")
+
+    assert response.status_code == 200
+    assert response.data == FAKE_TRIANGLES_BYTES
+    assert app_module.STORE_ERRORS.value() == errors + 1
+
+
+# Requêtes concurrentes regroupées
+
+
+def _fetch_lent(result, count=4):
+    """Faux fetch qui ne répond qu'une fois `count` requêtes regroupées."""
+    shared_before = app_module.FLIGHTS.shared
+
+    def slow_fetch(*args, **kwargs):
+        while app_module.FLIGHTS.shared - shared_before < count - 1:
+            threading.Event().wait(0.001)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return slow_fetch
+
+
+def _requetes_concurrentes(app, count=4):
+    """Envoie `count` requêtes identiques en parallèle."""
+    with ThreadPoolExecutor(count) as executor:
+        futures = [
+            executor.submit(app.test_client().get, f"/triangulation/{VALID_UUID}")
+            for _ in range(count)
+        ]
+        return [f.result(timeout=10) for f in futures]
+
+
+def test_api_requetes_concurrentes_regroupees(app, mocker):
+    """Teste qu'un seul calcul sert des requêtes concurrentes identiques."""
+    mock_fetch = mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        side_effect=_fetch_lent(FAKE_POINTSET_BYTES)
+    )
+    spy = mocker.spy(core, "compute_triangulation")
+
+    responses = _requetes_concurrentes(app)
+
+    assert [r.status_code for r in responses] == [200] * 4
+    assert all(r.data == FAKE_TRIANGLES_BYTES for r in responses)
+    assert mock_fetch.call_count == 1
+    assert spy.call_count == 1
+
+
+def test_api_requetes_concurrentes_erreur_partagee(app, mocker):
+    """Teste que l'erreur du calcul partagé est traduite pour chaque requête."""
+    mock_fetch = mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        side_effect=_fetch_lent(
+            HTTPError("http://fake-url", 404, "Not Found", {}, None)
+        )
+    )
+
+    responses = _requetes_concurrentes(app)
+
+    assert [r.status_code for r in responses] == [404] * 4
+    assert all(r.json["code"] == "POINTSET_NOT_FOUND" for r in responses)
+    assert mock_fetch.call_count == 1
+
+
+def test_api_requete_regroupee_echeance_propre(app, mocker):
+    """Teste qu'une requête au délai court ne fait pas échouer celles regroupées."""
+    started = threading.Event()
+    shared_before = app_module.FLIGHTS.shared
+
+    def fetch(*args, **kwargs):
+        if not started.is_set():
+            # Premier appel (délai de 0.1 s) : attendre la seconde requête,
+            # puis dépasser le délai
+            started.set()
+            while app_module.FLIGHTS.shared == shared_before:
+                threading.Event().wait(0.001)
+            time.sleep(0.15)
+        return FAKE_POINTSET_BYTES
+
+    mock_fetch = mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        side_effect=fetch,
+    )
+    spy = mocker.spy(core, "compute_triangulation")
+
+    with ThreadPoolExecutor(1) as executor:
+        short = executor.submit(
+            app.test_client().get, f"/triangulation/{VALID_UUID}",
+            headers={"X-Request-Timeout": "0.1"},
+        )
+        assert started.wait(5)
+        response = app.test_client().get(f"/triangulation/{VALID_UUID}")
+        short_response = short.result(timeout=10)
+
+    assert short_response.status_code == 504
+    assert response.status_code == 200
+    assert response.data == FAKE_TRIANGLES_BYTES
+    # Calcul relancé sous le délai de la seconde requête, avec le PointSet
+    # déjà récupéré (cache) par la première
+    assert mock_fetch.call_count == 1
+    assert spy.call_count == 1
+
+
+# Tâches asynchrones
+
+
+def _attendre_job(response):
+    """Attend la fin du job créé par `response` (202) et renvoie son id."""
+    job_id = response.json["jobId"]
+    assert app_module.JOBS.get(UUID(job_id)).wait(5)
+    return job_id
+
+
+def test_api_job_asynchrone(client, mocker):
+    """Teste le cycle POST /jobs, GET /jobs/{id}, GET /jobs/{id}/result."""
+    mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        return_value=FAKE_POINTSET_BYTES
+    )
+
+    created = client.post(f"/triangulation/{VALID_UUID}/jobs")
+    assert created.status_code == 202
+    assert created.json["pointSetId"] == str(VALID_UUID)
+    assert created.headers["Location"] == f"/jobs/{created.json['jobId']}"
+    job_id = _attendre_job(created)
+
+    state = client.get(f"/jobs/{job_id}")
+    result = client.get(f"/jobs/{job_id}/result")
+
+    assert state.status_code == 200
+    assert state.json["status"] == "done"
+    assert state.json["progress"] == 1.0
+    assert result.status_code == 200
+    assert result.data == FAKE_TRIANGLES_BYTES
+    assert result.get_etag() == client.get(
+        f"/triangulation/{VALID_UUID}"
+    ).get_etag()
+
+
+def test_api_job_en_cours(client, mocker):
+    """Teste le Cas 409 : résultat demandé avant la fin du job."""
+    release = threading.Event()
+
+    def bloque(*args, **kwargs):
+        release.wait(5)
+        return FAKE_POINTSET_BYTES
+
+    mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        side_effect=bloque
+    )
+
+    created = client.post(f"/triangulation/{VALID_UUID}/jobs")
+    job_id = created.json["jobId"]
+    response = client.get(f"/jobs/{job_id}/result")
+    release.set()
+    _attendre_job(created)
+
+    assert response.status_code == 409
+    assert response.json["code"] == "JOB_NOT_FINISHED"
+    assert client.get(f"/jobs/{job_id}/result").status_code == 200
+
+
+def test_api_job_en_echec(client, mocker):
+    """Teste qu'un job échoué porte l'erreur de GET /triangulation/{id}."""
+    mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        side_effect=HTTPError(
+            url="http://fake-url", code=404, msg="Not Found", hdrs={}, fp=None
+        )
+    )
+
+    job_id = _attendre_job(client.post(f"/triangulation/{VALID_UUID}/jobs"))
+
+    state = client.get(f"/jobs/{job_id}")
+    result = client.get(f"/jobs/{job_id}/result")
+
+    assert state.json["status"] == "failed"
+    assert state.json["error"]["code"] == "POINTSET_NOT_FOUND"
+    assert result.status_code == 404
+    assert result.json["code"] == "POINTSET_NOT_FOUND"
+
+
+def test_api_job_delai_depasse(client, mocker):
+    """Teste qu'un job plus long que JOB_TIMEOUT échoue en TIMEOUT (504)."""
+    mocker.patch.object(app_module, "JOB_TIMEOUT", 0.05)
+
+    def slow_fetch(*args, **kwargs):
+        time.sleep(0.1)
+        return FAKE_POINTSET_BYTES
+
+    mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        side_effect=slow_fetch
+    )
+    mock_compute = mocker.patch("triangulator.app.core.compute_triangulation")
+
+    job_id = _attendre_job(client.post(f"/triangulation/{VALID_UUID}/jobs"))
+
+    state = client.get(f"/jobs/{job_id}")
+    result = client.get(f"/jobs/{job_id}/result")
+
+    assert state.json["status"] == "failed"
+    assert state.json["error"]["code"] == "TIMEOUT"
+    assert result.status_code == 504
+    assert result.json["code"] == "TIMEOUT"
+    mock_compute.assert_not_called()
+
+
+def test_api_job_repris_et_file_pleine(client, mocker):
+    """Teste la reprise d'une tâche identique et le 503 si la file est pleine."""
+    from triangulator.jobs import JobManager
+
+    release = threading.Event()
+
+    def fetch_bloque(*args, **kwargs):
+        release.wait(5)
+        return FAKE_POINTSET_BYTES
+
+    mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        side_effect=fetch_bloque
+    )
+    manager = JobManager(workers=1, ttl=60, max_pending=1)
+    mocker.patch.object(app_module, "JOBS", manager)
+
+    first = client.post(f"/triangulation/{VALID_UUID}/jobs")
+    again = client.post(f"/triangulation/{VALID_UUID}/jobs")
+    other = client.post(f"/triangulation/{UUID(int=1)}/jobs")
+    release.set()
+
+    assert first.status_code == again.status_code == 202
+    assert again.json["jobId"] == first.json["jobId"]
+    assert other.status_code == 503
+    assert other.json["code"] == "OVERLOADED"
+    assert other.headers["Retry-After"] == str(app_module.RETRY_AFTER_SECONDS)
+    assert manager.get(UUID(first.json["jobId"])).wait(5)
+    manager.shutdown()
+
+
+def test_api_job_resultat_evince(client, mocker):
+    """Teste qu'un résultat de job évincé de la mémoire est recalculé."""
+    mock_fetch = mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        return_value=FAKE_POINTSET_BYTES
+    )
+    job_id = _attendre_job(client.post(f"/triangulation/{VALID_UUID}/jobs"))
+    app_module.JOB_RESULTS.clear()
+    app_module.POINTSET_CACHE.clear()
+    app_module.RESULT_CACHE.clear()
+
+    response = client.get(f"/jobs/{job_id}/result")
+
+    assert response.status_code == 200
+    assert response.data == FAKE_TRIANGLES_BYTES
+    assert mock_fetch.call_count == 2
+
+
+def test_api_job_resultat_sur_disque(client, mocker, tmp_path):
+    """Teste qu'un résultat de job stocké sur disque n'est pas gardé en mémoire."""
+    mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        return_value=FAKE_POINTSET_BYTES
+    )
+    mocker.patch(
+        "triangulator.app.TRIANGULATION_STORE",
+        TriangulationStore(str(tmp_path), 1024 * 1024)
+    )
+    client.get(f"/triangulation/{VALID_UUID}")
+    app_module.RESULT_CACHE.clear()
+
+    job_id = _attendre_job(client.post(f"/triangulation/{VALID_UUID}/jobs"))
+    response = client.get(f"/jobs/{job_id}/result")
+
+    assert len(app_module.JOB_RESULTS) == 0
+    assert response.status_code == 200
+    assert response.data == FAKE_TRIANGLES_BYTES
+    assert response.headers["X-Triangulation-Path"] == "convex"
+
+
+def test_api_job_inconnu(client):
+    """Teste le Cas 404 d'un job inconnu (ou expiré)."""
+    response = client.get(f"/jobs/{VALID_UUID}")
+
+    assert response.status_code == 404
+    assert response.json["code"] == "JOB_NOT_FOUND"
+
+
+# Triangulation par lots
+
+
+def test_api_lot(client, mocker):
+    """Teste POST /triangulation/batch : résultats et erreurs par élément."""
+    missing = UUID("00000000-0000-0000-0000-000000000001")
+
+    def fetch(base_url, point_set_id, **kwargs):
+        if point_set_id == missing:
+            raise HTTPError("http://fake-url", 404, "Not Found", {}, None)
+        return FAKE_POINTSET_BYTES
+
+    mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        side_effect=fetch
+    )
+
+    response = client.post(
+        "/triangulation/batch", json=[str(VALID_UUID), str(missing)]
+    )
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/octet-stream"
+    (first_id, first_status, first_data), (second_id, second_status, error) = (
+        binary_utils.binary_to_batch(response.data)
+    )
+    assert (first_id, first_status) == (VALID_UUID, 200)
+    assert first_data == client.get(f"/triangulation/{VALID_UUID}").data
+    assert (second_id, second_status) == (missing, 404)
+    assert json.loads(error)["code"] == "POINTSET_NOT_FOUND"
+
+
+def test_api_lot_pool_de_processus(client, mocker):
+    """Teste qu'un lot confie ses calculs au pool de processus configuré."""
+    mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        return_value=FAKE_POINTSET_BYTES
+    )
+    ids = [UUID(int=i) for i in range(1, 4)]
+    pool = workers.ComputePool(workers=2, max_pending=4)
+    mocker.patch.object(app_module, "COMPUTE_POOL", pool)
+    spy = mocker.spy(pool, "triangulate")
+    try:
+        # Réponse en flux : les calculs ont lieu pendant sa lecture
+        response = client.post("/triangulation/batch", json=[str(i) for i in ids])
+        items = binary_utils.binary_to_batch(response.data)
+    finally:
+        pool.shutdown()
+
+    assert spy.call_count == len(ids)
+    assert items == [(i, 200, FAKE_TRIANGLES_BYTES) for i in ids]
+
+
+def test_api_lot_client_deconnecte(mocker):
+    """Teste qu'un lot abandonné par le client n'est pas calculé en entier."""
+    mocker.patch("triangulator.app.BATCH_WORKERS", 2)
+    calls = []
+
+    def item(point_set_id, engine, deadline):
+        calls.append(point_set_id)
+        return 200, [b"x"], 1
+
+    mocker.patch("triangulator.app._batch_item", side_effect=item)
+    ids = [UUID(int=i) for i in range(50)]
+
+    frames = app_module._batch_frames(ids, "polygon")
+    next(frames)  # nombre d'éléments
+    next(frames)  # cadre du premier élément
+    frames.close()
+    time.sleep(0.05)
+
+    # Fenêtre de 2 * BATCH_WORKERS éléments, plus celui soumis à la place
+    # du premier : le reste est annulé
+    assert len(calls) <= 5
+
+
+def test_api_lot_vide(client):
+    """Teste un lot vide : en-tête seul."""
+    response = client.post("/triangulation/batch", json=[])
+
+    assert response.status_code == 200
+    assert binary_utils.binary_to_batch(response.data) == []
+
+
+@pytest.mark.parametrize("body", [
+    {"ids": []},
+    ["pas-un-uuid"],
+    [42],
+    None,
+])
+def test_api_lot_invalide(client, body):
+    """Teste le Cas 400 d'un corps de lot invalide."""
+    response = client.post("/triangulation/batch", json=body)
+
+    assert response.status_code == 400
+    assert response.json["code"] == "INVALID_BATCH"
+
+
+# Envoi direct du PointSet
+
+
+def test_api_envoi_direct(client, mocker):
+    """Teste POST /triangulation : même résultat, sans PointSetManager."""
+    mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        return_value=FAKE_POINTSET_BYTES
+    )
+    expected = client.get(f"/triangulation/{VALID_UUID}").data
+    mock_fetch = mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager"
+    )
+
+    response = client.post(
+        "/triangulation", data=FAKE_POINTSET_BYTES,
+        content_type="application/octet-stream",
+    )
+
+    assert response.status_code == 200
+    assert response.data == expected
+    assert response.headers["X-Triangulation-Path"] == "convex"
+    mock_fetch.assert_not_called()
+
+
+def test_api_envoi_direct_trop_gros(client, mocker):
+    """Teste le Cas 413 (corps, ou taille annoncée par le header, trop gros)."""
+    mocker.patch.object(app_module, "MAX_UPLOAD_BYTES", 20)
+    # Corps court, mais header annonçant 1000 points
+    announced = struct.pack("!I", 1000) + struct.pack("!ff", 0.0, 0.0)
+
+    too_long = client.post(
+        "/triangulation", data=FAKE_POINTSET_BYTES,
+        content_type="application/octet-stream",
+    )
+    too_many = client.post(
+        "/triangulation", data=announced,
+        content_type="application/octet-stream",
+    )
+
+    assert too_long.status_code == too_many.status_code == 413
+    assert too_many.json["code"] == "PAYLOAD_TOO_LARGE"
+
+
+@pytest.mark.parametrize("body", [b"\x00\x00", FAKE_POINTSET_BYTES[:-1]])
+def test_api_envoi_direct_tronque(client, body):
+    """Teste le Cas 400 d'un PointSet envoyé tronqué."""
+    response = client.post(
+        "/triangulation", data=body, content_type="application/octet-stream"
+    )
+
+    assert response.status_code == 400
+    assert response.json["code"] == "INVALID_BINARY_DATA"
+
+
+def test_api_envoi_direct_mauvais_type(client):
+    """Teste le Cas 415 d'un corps qui n'est pas application/octet-stream."""
+    response = client.post("/triangulation", json=[0, 0])
+
+    assert response.status_code == 415
+    assert response.json["code"] == "UNSUPPORTED_MEDIA_TYPE"
+
+
+# Contrôle d'admission
+
+
+def test_api_admission_redirige_vers_un_job(client, mocker):
+    """Teste qu'un PointSet trop coûteux en synchrone devient une tâche."""
+    mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        return_value=FAKE_POINTSET_BYTES
+    )
+    # Carré : coût estimé 1,28 (16 * EAR_CLIPPING_COST) en Ear Clipping
+    mocker.patch.object(
+        app_module, "ADMISSION", admission.AdmissionPolicy(sync_max_cost=1)
+    )
+
+    response = client.get(f"/triangulation/{VALID_UUID}")
+    job_id = _attendre_job(response)
+
+    assert response.status_code == 202
+    assert response.headers["Location"] == f"/jobs/{job_id}"
+    assert client.get(f"/jobs/{job_id}/result").data == FAKE_TRIANGLES_BYTES
+
+
+def test_api_admission_selon_le_delai(client, mocker):
+    """Teste que la limite synchrone suit le délai de la requête."""
+    mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        return_value=FAKE_POINTSET_BYTES
+    )
+    # Carré : coût estimé 1,28, soit 12,8 s de calcul à 10 s par unité
+    mocker.patch.object(admission, "SECONDS_PER_COST", 10.0)
+
+    court = client.get(
+        f"/triangulation/{VALID_UUID}", headers={"X-Request-Timeout": "10"}
+    )
+    _attendre_job(court)
+    app_module.RESULT_CACHE.clear()  # résultat calculé par la tâche
+    long = client.get(
+        f"/triangulation/{VALID_UUID}", headers={"X-Request-Timeout": "60"}
+    )
+
+    assert court.status_code == 202
+    assert long.status_code == 200
+    assert long.data == FAKE_TRIANGLES_BYTES
+
+
+def test_api_admission_refus(client, mocker):
+    """Teste le Cas 413 au-delà de la limite absolue, sans calcul."""
+    mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        return_value=FAKE_POINTSET_BYTES
+    )
+    mocker.patch.object(
+        app_module, "ADMISSION", admission.AdmissionPolicy(max_cost=1)
+    )
+    spy = mocker.spy(core, "compute_triangulation")
+
+    response = client.get(f"/triangulation/{VALID_UUID}")
+    uploaded = client.post(
+        "/triangulation", data=FAKE_POINTSET_BYTES,
+        content_type="application/octet-stream",
+    )
+
+    assert response.status_code == uploaded.status_code == 413
+    assert response.json["code"] == uploaded.json["code"] == "POINTSET_TOO_LARGE"
+    spy.assert_not_called()
+
+
+
+def test_api_admission_nuage_refuse(client, mocker):
+    """Teste le Cas 413 d'un grand nuage de points avec le moteur par défaut."""
+    import random
+
+    count = 200_000
+    rng = random.Random(count)
+    coords = array("f", (rng.uniform(0, 1000) for _ in range(2 * count)))
+    coords.byteswap()
+    mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        return_value=struct.pack("!I", count) + coords.tobytes()
+    )
+    spy = mocker.spy(core, "compute_triangulation")
+
+    response = client.get(f"/triangulation/{VALID_UUID}")
+
+    # Le balayage échouerait, et l'Ear Clipping prendrait des heures
+    assert response.status_code == 413
+    assert response.json["code"] == "POINTSET_TOO_LARGE"
+    spy.assert_not_called()
+
+
+# Métriques et profilage
+
+
+def test_api_metriques(client, mocker):
+    """Teste /metrics : durées par étape, accès aux caches, erreurs, volumes."""
+    mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        return_value=FAKE_POINTSET_BYTES
+    )
+    computed = app_module.COMPUTE_SECONDS.count
+    requests = app_module.REQUEST_SECONDS.count
+    hits = app_module.CACHE_HITS.value("result")
+    vertices = app_module.INPUT_VERTICES.value()
+    triangles = app_module.OUTPUT_TRIANGLES.value()
+    timeouts = app_module.ERRORS.value("TIMEOUT")
+
+    client.get(f"/triangulation/{VALID_UUID}")
+    client.get(f"/triangulation/{VALID_UUID}")  # servi par le cache
+    mocker.patch(
+        "triangulator.app.core.compute_triangulation",
+        side_effect=DeadlineExceeded("Délai de 1 s dépassé.")
+    )
+    client.get(f"/triangulation/{VALID_UUID}?engine=sweep")
+
+    assert app_module.COMPUTE_SECONDS.count == computed + 2
+    assert app_module.REQUEST_SECONDS.count == requests + 3
+    assert app_module.CACHE_HITS.value("result") == hits + 1
+    assert app_module.INPUT_VERTICES.value() == vertices + 4
+    assert app_module.OUTPUT_TRIANGLES.value() == triangles + 2
+    assert app_module.ERRORS.value("TIMEOUT") == timeouts + 1
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.mimetype == "text/plain"
+    text = response.get_data(as_text=True)
+    for name in ("fetch", "decode", "compute", "serialize", "request"):
+        assert f"# TYPE triangulator_{name}_seconds histogram" in text
+    assert 'triangulator_errors_total{code="TIMEOUT"}' in text
+    assert 'triangulator_cache_hits_total{cache="result"}' in text
+
+
+def test_api_server_timing(client, mocker):
+    """Teste l'en-tête Server-Timing : étapes exécutées, puis total."""
+    mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        return_value=FAKE_POINTSET_BYTES
+    )
+
+    response = client.get(f"/triangulation/{VALID_UUID}")
+    cached = client.get(f"/triangulation/{VALID_UUID}")
+
+    stages = [
+        entry.split(";")[0]
+        for entry in response.headers["Server-Timing"].split(", ")
+    ]
+    assert stages == ["fetch", "decode", "compute", "serialize", "total"]
+    # Résultat en cache : aucune étape exécutée
+    assert cached.headers["Server-Timing"].startswith("total;dur=")
+
+
+def test_api_profilage_par_en_tete(client, mocker, tmp_path):
+    """Teste le profilage d'une requête désignée par X-Debug-Profile."""
+    mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        return_value=FAKE_POINTSET_BYTES
+    )
+    mocker.patch.object(
+        app_module, "PROFILER", profiling.SamplingProfiler(str(tmp_path))
+    )
+
+    client.get(f"/triangulation/{VALID_UUID}?engine=sweep")
+    assert list(tmp_path.iterdir()) == []
+
+    response = client.get(
+        f"/triangulation/{VALID_UUID}", headers={"X-Debug-Profile": "1"}
+    )
+
+    assert response.status_code == 200
+    (profile,) = tmp_path.iterdir()
+    assert profile.name.startswith(f"{VALID_UUID}-4v-")
 
 
 # Scénarios d'erreurs
 
 
+def test_api_moteur_inconnu(client, mocker):
+    """Teste le Cas 400 (moteur de triangulation inconnu)."""
+    mock_fetch = mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        return_value=FAKE_POINTSET_BYTES
+    )
+
+    response = client.get(f"/triangulation/{VALID_UUID}?engine=magique")
+
+    # Le moteur est validé avant tout appel au PointSetManager
+    assert response.status_code == 400
+    assert response.json["code"] == "INVALID_ENGINE"
+    mock_fetch.assert_not_called()
+
+
 def test_api_pointset_id_not_found(client, mocker):
     """Teste le Cas 404 (ID inconnu)."""
     #mock l'appel pour qu'il lève une erreur HTTP 404
@@ -130,11 +1003,11 @@ def test_api_pointsetmanager_donnees_corrompues(client, mocker):
     )
     # Mock la désérialisation pour qu'elle lève l'erreur attendue
     mocker.patch(
-        "triangulator.app.binary_utils.binary_to_pointset",
+        "triangulator.app.binary_utils.binary_to_coords",
         side_effect=BinaryFormatError("Données corrompues")
     )
 
-    # L'app doit attraper l'erreur de 'binary_to_pointset'
+    # L'app doit attraper l'erreur de 'binary_to_coords'
     response = client.get(f"/triangulation/{VALID_UUID}")
 
     # Vérification
@@ -150,8 +1023,8 @@ def test_api_triangulation_interne_echoue(client, mocker):
         return_value=FAKE_POINTSET_BYTES
     )
     mocker.patch(
-        "triangulator.app.binary_utils.binary_to_pointset",
-        return_value=[(1.0, 1.0)]
+        "triangulator.app.binary_utils.binary_to_coords",
+        return_value=array("f", [1.0, 1.0])
     )
     # mock le "cerveau" pour qu'il lève une exception
     mocker.patch(
@@ -166,6 +1039,84 @@ def test_api_triangulation_interne_echoue(client, mocker):
     assert response.json["code"] == "INTERNAL_ERROR"
 
 
+def test_api_pool_de_calcul_sature(client, mocker):
+    """Teste le Cas 503 immédiat quand le pool de calcul est saturé."""
+    mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        return_value=FAKE_POINTSET_BYTES
+    )
+    # Aucune place dans le pool : toute demande de calcul est refusée
+    pool = workers.ComputePool(0, max_pending=1)
+    pool._slots.acquire()
+    mocker.patch.object(app_module, "COMPUTE_POOL", pool)
+    spy = mocker.spy(core, "compute_triangulation")
+
+    response = client.get(f"/triangulation/{VALID_UUID}")
+
+    assert response.status_code == 503
+    assert response.json["code"] == "OVERLOADED"
+    assert response.headers["Retry-After"] == str(app_module.RETRY_AFTER_SECONDS)
+    spy.assert_not_called()
+
+
+def test_api_delai_depasse_504(client, mocker):
+    """Teste le Cas 504 : délai de la requête écoulé avant le calcul."""
+    def slow_fetch(*args, **kwargs):
+        time.sleep(0.1)
+        return FAKE_POINTSET_BYTES
+
+    mock_fetch = mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        side_effect=slow_fetch,
+    )
+    spy = mocker.spy(core, "compute_triangulation")
+
+    response = client.get(
+        f"/triangulation/{VALID_UUID}",
+        headers={"X-Request-Timeout": "0.05"},
+    )
+
+    assert response.status_code == 504
+    assert response.json["code"] == "TIMEOUT"
+    # Le délai restant borne les timeouts de l'appel au PointSetManager
+    assert 0 < mock_fetch.call_args.kwargs["timeout"] <= 0.05
+    spy.assert_not_called()
+
+
+def test_api_delai_calcul_interrompu(client, mocker):
+    """Teste le Cas 504 quand le moteur abandonne le calcul."""
+    mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        return_value=FAKE_POINTSET_BYTES
+    )
+    mocker.patch(
+        "triangulator.app.core.compute_triangulation",
+        side_effect=DeadlineExceeded("Délai de 1 s dépassé.")
+    )
+
+    response = client.get(f"/triangulation/{VALID_UUID}")
+
+    assert response.status_code == 504
+    assert response.json["code"] == "TIMEOUT"
+
+
+@pytest.mark.parametrize("value", ["abc", "0", "-1", "nan"])
+def test_api_delai_invalide(client, mocker, value):
+    """Teste le Cas 400 (en-tête X-Request-Timeout invalide)."""
+    mock_fetch = mocker.patch(
+        "triangulator.app.manager_client.fetch_pointset_from_manager",
+        return_value=FAKE_POINTSET_BYTES
+    )
+
+    response = client.get(
+        f"/triangulation/{VALID_UUID}", headers={"X-Request-Timeout": value}
+    )
+
+    assert response.status_code == 400
+    assert response.json["code"] == "INVALID_TIMEOUT"
+    mock_fetch.assert_not_called()
+
+
 def test_api_invalid_uuid_format(client):
     """Teste le Cas 400 (ID mal formé).
 
@@ -175,4 +1126,4 @@ def test_api_invalid_uuid_format(client):
     response = client.get("/triangulation/ID-PAS-UN-UUID")
 
     # Vérification (Flask renvoie 404, pas 400, pour un type d'URL)
-    assert response.status_code == 404
\ No newline at end of file
+    assert response.status_code == 404
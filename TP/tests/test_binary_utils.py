@@ -4,13 +4,30 @@ Ce fichier teste les fonctions de (dé)sérialisation pour s'assurer
 qu'ils lisent et écrivent le format binaire correctement.
 """
 
+import io
 import struct
+import tracemalloc
+from array import array
+from uuid import UUID
 
 import pytest
 from triangulator.binary_utils import (
+    CHUNK_SIZE,
     BinaryFormatError,
+    PointSetDecoder,
+    PointSetTooLargeError,
+    TrianglesStream,
+    batch_frame_header,
+    batch_header,
+    binary_to_batch,
+    binary_to_coords,
+    binary_to_mesh,
     binary_to_pointset,
+    iter_triangles_binary,
+    mesh_to_binary,
+    triangles_section_to_binary,
     triangles_to_binary,
+    vertices_section,
 )
 from triangulator.core import Point, Triangle
 
@@ -55,9 +72,137 @@ def test_binary_to_pointset_malforme_data_incomplet():
         binary_to_pointset(invalid_data)
 
 
+def test_binary_to_coords_tableau_plat():
+    """Teste la lecture en bloc vers un tableau plat de coordonnées."""
+    data = struct.pack("!I", 2) + struct.pack("!ffff", 1.0, 2.0, -3.5, 4.25)
+
+    coords = binary_to_coords(data)
+
+    assert isinstance(coords, array)
+    assert coords.typecode == "f"
+    assert coords.tolist() == [1.0, 2.0, -3.5, 4.25]
+
+
+def test_binary_to_coords_memoryview_et_octets_en_trop():
+    """Teste la lecture depuis une memoryview, octets surnuméraires ignorés."""
+    data = bytearray(struct.pack("!I", 1) + struct.pack("!ff", 0.5, 8.0))
+    data += b"\x00\x00"
+
+    coords = binary_to_coords(memoryview(data))
+
+    assert coords.tolist() == [0.5, 8.0]
+
+
+def test_mesh_aller_retour_binaire():
+    """Teste PointSet -> Mesh -> 'Triangles', identique au chemin par tuples."""
+    data = struct.pack("!I", 3) + struct.pack("!6f", 0, 0, 1, 0, 0, 1)
+
+    mesh = binary_to_mesh(data)
+    mesh.triangles.append(0)
+    mesh.triangles.extend([1, 2])
+
+    assert mesh.points() == binary_to_pointset(data)
+    assert mesh_to_binary(mesh) == triangles_to_binary(
+        mesh.points(), [(0, 1, 2)]
+    )
+    # La partie Vertices est celle du PointSet d'origine, octet pour octet
+    assert mesh_to_binary(mesh).startswith(data)
+
+
+def test_binary_to_coords_malforme():
+    """Teste les mêmes erreurs que binary_to_pointset."""
+    with pytest.raises(BinaryFormatError):
+        binary_to_coords(b"\x00\x01")
+    with pytest.raises(BinaryFormatError):
+        binary_to_coords(struct.pack("!I", 3) + struct.pack("!ff", 1.0, 2.0))
+
+
 # Triangles (Écriture / Sérialisation)
 
 
+
+class _FluxMorcele(io.RawIOBase):
+    """Flux qui ne rend que `step` octets par lecture (réception morcelée)."""
+
+    def __init__(self, data: bytes, step: int):
+        self._data = io.BytesIO(data)
+        self._step = step
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        chunk = self._data.read(min(self._step, len(buffer)))
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+
+@pytest.mark.parametrize("step", [1, 3, 8, 1000])
+def test_decodeur_incremental(step):
+    """Teste le décodage en flux, quel que soit le découpage des lectures."""
+    points = [(float(i), -i / 3) for i in range(100)]
+    data = struct.pack("!I", 100) + b"".join(struct.pack("!ff", *p) for p in points)
+    decoder = PointSetDecoder(chunk_size=64)
+
+    coords = decoder.readfrom(_FluxMorcele(data + b"\x00", step), len(data) + 1)
+
+    assert coords == binary_to_coords(data)
+    assert decoder.data == data
+    # PointSet reconstitué à la taille exacte : repris sans copie
+    assert vertices_section(decoder.data, 100) is decoder.data
+
+
+def test_decodeur_incremental_sans_preallocation():
+    """Teste qu'un header annonçant un énorme PointSet n'alloue rien d'avance."""
+    # 50 millions de points annoncés (400 Mo), flux coupé après 2 points
+    data = struct.pack("!I", 50_000_000) + struct.pack("!ffff", 1, 2, 3, 4)
+
+    tracemalloc.start()
+    try:
+        with pytest.raises(BinaryFormatError):
+            PointSetDecoder().readfrom(io.BytesIO(data))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak < 4 * CHUNK_SIZE
+
+
+def test_decodeur_incremental_tronque():
+    """Teste le rejet d'un flux tronqué, dès que c'est détectable."""
+    data = struct.pack("!I", 2) + struct.pack("!ffff", 1, 2, 3, 4)
+
+    with pytest.raises(BinaryFormatError):
+        PointSetDecoder().readfrom(io.BytesIO(data[:-1]))
+    with pytest.raises(BinaryFormatError):
+        PointSetDecoder().readfrom(io.BytesIO(data[:2]))
+    # Content-Length trop court : rejeté sans lire au-delà du header
+    stream = io.BytesIO(data)
+    with pytest.raises(BinaryFormatError):
+        PointSetDecoder().readfrom(stream, len(data) - 1)
+    assert stream.tell() == 4
+
+
+def test_decodeur_incremental_admission():
+    """Teste que `admit` reçoit le nombre de points avant leur lecture."""
+    data = struct.pack("!I", 2) + struct.pack("!ffff", 1, 2, 3, 4)
+    stream = io.BytesIO(data)
+
+    def admit(count):
+        raise RuntimeError(count)
+
+    with pytest.raises(RuntimeError, match="2"):
+        PointSetDecoder(admit=admit).readfrom(stream)
+    assert stream.tell() == 4
+
+def test_decodeur_incremental_trop_gros():
+    """Teste le rejet d'un PointSet annonçant plus de max_bytes."""
+    data = struct.pack("!I", 1000)
+
+    with pytest.raises(PointSetTooLargeError):
+        PointSetDecoder(max_bytes=100).readfrom(io.BytesIO(data))
+
+
 def test_triangles_to_binary_simple():
     """Teste la sérialisation d'un objet Triangles valide (3 points, 1 triangle)."""
     vertices: list[Point] = [(1.0, 2.0), (3.0, 4.0), (5.0, 6.0)]
@@ -96,3 +241,104 @@ def test_triangles_to_binary_no_triangles():
     expected_bytes = part1_header + part1_data + part2_header + part2_data
 
     assert result_bytes == expected_bytes
+
+
+def test_triangles_to_binary_tableau_plat():
+    """Teste la sérialisation depuis un tableau plat, sans le modifier."""
+    coords = array("f", [1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+    vertices: list[Point] = [(1.0, 2.0), (3.0, 4.0), (5.0, 6.0)]
+    triangles: list[Triangle] = [(0, 1, 2)]
+
+    result_bytes = triangles_to_binary(coords, triangles)
+
+    assert result_bytes == triangles_to_binary(vertices, triangles)
+    assert coords.tolist() == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+
+
+
+def test_triangles_indices_tableau_plat():
+    """Teste la sérialisation d'indices donnés en tableau plat, sans le modifier."""
+    vertices: list[Point] = [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)]
+    triangles: list[Triangle] = [(0, 1, 2), (0, 2, 3)]
+    indices = array("I", [0, 1, 2, 0, 2, 3])
+
+    assert triangles_to_binary(vertices, indices) == (
+        triangles_to_binary(vertices, triangles)
+    )
+    assert triangles_section_to_binary(indices) == (
+        triangles_section_to_binary(triangles)
+    )
+    assert indices.tolist() == [0, 1, 2, 0, 2, 3]
+
+
+@pytest.mark.parametrize("chunk_size", [4, 12, 64, 4096])
+def test_serialisation_en_flux(chunk_size):
+    """Teste que les tranches, de taille fixe, recomposent la réponse entière."""
+    vertices: list[Point] = [(float(i), float(-i)) for i in range(50)]
+    triangles: list[Triangle] = [(i, i + 1, i + 2) for i in range(48)]
+    flat_vertices = array("f", [c for p in vertices for c in p])
+    flat_indices = array("I", [i for t in triangles for i in t])
+    expected = triangles_to_binary(vertices, triangles)
+
+    for args in ((vertices, triangles), (flat_vertices, flat_indices)):
+        chunks = list(iter_triangles_binary(*args, chunk_size=chunk_size))
+        assert b"".join(chunks) == expected
+        assert all(len(chunk) == chunk_size for chunk in chunks[:-1])
+    assert flat_indices.tolist()[:3] == [0, 1, 2]  # tableaux non modifiés
+
+
+def test_triangles_stream_reiterable():
+    """Teste TrianglesStream : taille connue d'avance, itérable plusieurs fois."""
+    vertices: list[Point] = [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0)]
+    triangles: list[Triangle] = [(0, 1, 2)]
+    stream = TrianglesStream(vertices, triangles, chunk_size=8)
+    expected = triangles_to_binary(vertices, triangles)
+
+    assert len(stream) == len(expected)
+    assert b"".join(stream) == b"".join(stream) == expected
+
+def test_sections_concatenees_identiques():
+    """Teste que PointSet repris tel quel + partie 2 == sérialisation complète."""
+    pointset = struct.pack("!I", 3) + struct.pack("!ffffff", 1, 2, 3, 4, 5, 6)
+    vertices: list[Point] = [(1.0, 2.0), (3.0, 4.0), (5.0, 6.0)]
+    triangles: list[Triangle] = [(0, 1, 2)]
+
+    section = vertices_section(pointset, 3)
+
+    assert section is pointset  # aucune copie
+    assert section + triangles_section_to_binary(triangles) == (
+        triangles_to_binary(vertices, triangles)
+    )
+    # Octets surnuméraires du PointSet : tronqués
+    assert vertices_section(pointset + b"\x00", 3) == pointset
+    # Tampon bytearray : copie en bytes (corps de réponse WSGI)
+    copied = vertices_section(bytearray(pointset), 3)
+    assert type(copied) is bytes
+    assert copied == pointset
+
+
+def test_lot_aller_retour():
+    """Teste la (dé)sérialisation d'une réponse par lots."""
+    first = UUID("123e4567-e89b-12d3-a456-426614174000")
+    second = UUID("00000000-0000-0000-0000-000000000001")
+    data = (
+        batch_header(2)
+        + batch_frame_header(first, 200, 3) + b"abc"
+        + batch_frame_header(second, 404, 0)
+    )
+
+    assert len(batch_frame_header(first, 200, 3)) == 22
+    assert binary_to_batch(data) == [(first, 200, b"abc"), (second, 404, b"")]
+
+
+def test_lot_tronque():
+    """Teste le rejet d'une réponse par lots tronquée ou trop longue."""
+    item_id = UUID("123e4567-e89b-12d3-a456-426614174000")
+    data = batch_header(1) + batch_frame_header(item_id, 200, 3) + b"abc"
+
+    with pytest.raises(BinaryFormatError):
+        binary_to_batch(data[:-1])
+    with pytest.raises(BinaryFormatError):
+        binary_to_batch(data + b"\x00")
+    with pytest.raises(BinaryFormatError):
+        binary_to_batch(b"\x00")
\ No newline at end of file
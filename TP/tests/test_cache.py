@@ -0,0 +1,71 @@
+"""Tests Unitaires pour le cache LRU borné en octets."""
+
+from triangulator.cache import ByteLRUCache
+
+
+def test_cache_hit_et_miss():
+    """Vérifie les compteurs de hits et de misses."""
+    cache = ByteLRUCache(100)
+
+    assert cache.get("a") is None
+    cache.put("a", b"1234")
+
+    assert cache.get("a") == b"1234"
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_cache_eviction_lru_par_octets():
+    """Vérifie l'éviction des moins récemment utilisés selon la taille."""
+    cache = ByteLRUCache(10)
+    cache.put("a", b"aaaa")
+    cache.put("b", b"bbbb")
+    cache.get("a")  # "b" devient le moins récemment utilisé
+
+    cache.put("c", b"cccc")
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.current_bytes == 8
+    assert cache.evictions == 1
+
+
+def test_cache_remplacement_et_valeur_trop_grande():
+    """Vérifie le remplacement d'une clé et le refus d'une valeur géante."""
+    cache = ByteLRUCache(10)
+    cache.put("a", b"aaaa")
+    cache.put("a", b"aa")
+
+    cache.put("g", b"x" * 11)
+
+    assert cache.get("a") == b"aa"
+    assert cache.current_bytes == 2
+    assert "g" not in cache
+    assert len(cache) == 1
+
+
+def test_cache_clear():
+    """Vérifie que clear vide le cache et ses compteurs."""
+    cache = ByteLRUCache(10)
+    cache.put("a", b"a")
+    cache.get("a")
+
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.stats() == {
+        "entries": 0, "bytes": 0, "max_bytes": 10,
+        "hits": 0, "misses": 0, "evictions": 0,
+    }
+
+
+def test_cache_taille_explicite():
+    """Vérifie qu'une valeur quelconque compte pour la taille donnée."""
+    cache = ByteLRUCache(10)
+    cache.put("a", (["morceau"], "convex"), size=6)
+    cache.put("b", (["morceau"], "monotone"), size=6)
+
+    assert "a" not in cache
+    assert cache.get("b") == (["morceau"], "monotone")
+    assert cache.current_bytes == 6
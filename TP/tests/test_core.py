@@ -1,11 +1,17 @@
 """Tests Unitaires pour la fonction 'compute_triangulation'."""
 
+import pytest
+import triangulator.core as core
 from triangulator.core import (
+    SPATIAL_INDEX_THRESHOLD,
     Point,
+    _all_collinear,
+    _convex_flags,
     _cross_product_2d,
     _is_collinear,
     _is_convex_vertex,
     _is_point_in_triangle,
+    _is_valid_triangulation,
     _polygon_area_signed,
     compute_triangulation,
 )
@@ -215,3 +221,338 @@ def test_triangulation_hexagone_regulier():
 
     assert len(vertices) == 6
     assert len(triangles) == 4  # 6 - 2 = 4
+
+
+# Tests de l'Ear Clipping chaîné - Validité géométrique
+
+
+def _triangles_area(vertices, triangles):
+    """Somme des aires (absolues) des triangles produits."""
+    return sum(
+        abs(_cross_product_2d(vertices[a], vertices[b], vertices[c])) / 2.0
+        for a, b, c in triangles
+    )
+
+
+def _assert_covers_polygon(vertices, triangles):
+    """Vérifie n - 2 triangles non plats, bordant chaque arête du polygone."""
+    n = len(vertices)
+    assert len(triangles) == n - 2
+    assert all(
+        abs(_cross_product_2d(vertices[a], vertices[b], vertices[c])) > 1e-9
+        for a, b, c in triangles
+    )
+    edges = {
+        frozenset(edge)
+        for a, b, c in triangles for edge in ((a, b), (b, c), (c, a))
+    }
+    assert all(frozenset((i, (i + 1) % n)) in edges for i in range(n))
+    assert abs(
+        _triangles_area(vertices, triangles) - abs(_polygon_area_signed(vertices))
+    ) < 1e-6
+
+
+def _comb(teeth: int) -> list[Point]:
+    """Peigne de `teeth` dents : base en bas, dents vers le haut."""
+    width = 2.0 * teeth
+    points: list[Point] = [(0.0, 0.0), (width, 0.0)]
+    for i in range(teeth):
+        x = width - 2.0 * i
+        points += [(x, 10.0), (x - 1.0, 10.0), (x - 1.0, 1.0), (x - 2.0, 1.0)]
+    return points
+
+
+def test_triangulation_peigne_concave():
+    """Vérifie qu'un peigne très concave est entièrement couvert."""
+    vertices, triangles = compute_triangulation(_comb(20))
+
+    assert len(triangles) == len(vertices) - 2
+    assert abs(
+        _triangles_area(vertices, triangles) - abs(_polygon_area_signed(vertices))
+    ) < 1e-6
+
+
+def test_triangulation_peigne_index_spatial():
+    """Vérifie un grand peigne, où le test de contenance passe par l'index."""
+    points = _comb(300)
+    assert len(points) // 2 > SPATIAL_INDEX_THRESHOLD  # assez de réflexes
+
+    # Seuil relevé pour rester sur l'Ear Clipping (et non le balayage)
+    vertices, triangles = compute_triangulation(
+        points, sweep_threshold=len(points)
+    )
+
+    assert len(triangles) == len(vertices) - 2
+    assert abs(
+        _triangles_area(vertices, triangles) - abs(_polygon_area_signed(vertices))
+    ) < 1e-6
+
+
+def test_triangulation_grand_polygone_convexe():
+    """Vérifie qu'un polygone convexe de 2000 sommets donne n-2 triangles."""
+    import math
+
+    n = 2000
+    points: list[Point] = [
+        (math.cos(2 * math.pi * i / n), math.sin(2 * math.pi * i / n))
+        for i in range(n)
+    ]
+
+    vertices, triangles = compute_triangulation(points)
+
+    assert len(triangles) == n - 2
+    # Chaque triangle référence des indices valides et distincts
+    assert all(len({a, b, c}) == 3 for a, b, c in triangles)
+    assert all(0 <= i < n for t in triangles for i in t)
+
+
+def test_triangulation_moteur_inconnu():
+    """Vérifie qu'un moteur inconnu lève une ValueError."""
+    with pytest.raises(ValueError):
+        compute_triangulation([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)], engine="x")
+
+
+
+# Tests des prédicats vectorisés (NumPy) - comparés au Python pur
+
+
+def _random_polygon(n: int) -> list[Point]:
+    """Polygone étoilé aléatoire (rayons bruités, angles croissants)."""
+    import math
+    import random
+
+    rng = random.Random(n)
+    return [
+        (r * math.cos(2 * math.pi * i / n), r * math.sin(2 * math.pi * i / n))
+        for i, r in ((i, rng.uniform(50.0, 100.0)) for i in range(n))
+    ]
+
+
+def test_predicats_vectorises_identiques(monkeypatch):
+    """Vérifie que les versions NumPy et Python pur donnent le même résultat."""
+    pytest.importorskip("numpy")
+    points = _random_polygon(500)
+    collinear = [(float(i), 2.0 * i + 1.0) for i in range(500)]
+
+    vectorized = (
+        _polygon_area_signed(points),
+        _convex_flags(points, clockwise=False),
+        _all_collinear(points),
+        _all_collinear(collinear),
+    )
+    monkeypatch.setattr(core, "np", None)
+    pure = (
+        _polygon_area_signed(points),
+        _convex_flags(points, clockwise=False),
+        _all_collinear(points),
+        _all_collinear(collinear),
+    )
+
+    assert abs(vectorized[0] - pure[0]) < 1e-6
+    assert vectorized[1:] == pure[1:]
+
+
+def test_triangulation_sans_numpy(monkeypatch):
+    """Vérifie le repli en Python pur quand NumPy n'est pas installé."""
+    points = _random_polygon(300)
+    expected = compute_triangulation(points)
+
+    monkeypatch.setattr(core, "np", None)
+
+    assert compute_triangulation(points) == expected
+
+
+
+@pytest.mark.parametrize("with_numpy", [True, False])
+def test_triangulation_tableau_plat(monkeypatch, with_numpy):
+    """Vérifie qu'un tableau plat array('f') équivaut à la liste de tuples."""
+    from array import array
+
+    coords = array("f", [c for p in _random_polygon(300) for c in p])
+    it = iter(coords)
+    points = list(zip(it, it, strict=True))
+    if not with_numpy:
+        monkeypatch.setattr(core, "np", None)
+
+    assert compute_triangulation(coords) == compute_triangulation(points)
+
+
+def test_triangulation_mesh():
+    """Vérifie `triangulate_mesh` : même résultat, sommets repris sans copie."""
+    from triangulator.geometry import Mesh
+
+    points = _random_polygon(300)
+    mesh = Mesh.from_tuples(points)
+
+    result, path = core.triangulate_mesh(mesh)
+
+    vertices, triangles = compute_triangulation(mesh)
+    assert result.vertices is mesh.vertices
+    assert result.points() == vertices
+    assert result.triangle_tuples() == triangles
+    assert path in core.PATHS
+
+    # Doublon retiré : nouveau tableau de sommets
+    duplicated = Mesh.from_tuples([(0.0, 0.0), (0.0, 0.0), (1.0, 0.0), (0.0, 1.0)])
+    result, _ = core.triangulate_mesh(duplicated)
+    assert result.vertices is not duplicated.vertices
+    assert result.points() == [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)]
+    assert result.triangle_count == 1
+
+
+# Tests de la pré-classification (convexe / monotone / général)
+
+
+@pytest.mark.parametrize(("points", "engine", "expected_path"), [
+    ([(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)], "polygon", "convex"),
+    ([(0.0, 0.0), (2.0, 1.0), (0.0, 2.0), (1.0, 1.0)], "polygon", "monotone"),
+    ([(0.0, 1.0), (0.4, 0.4), (1.0, 0.0), (0.6, 0.4), (1.0, 1.0), (0.6, 0.6),
+      (0.5, 1.0), (0.4, 0.6)], "polygon", "earclipping"),
+    ([(0.0, 0.0), (1.0, 1.0), (2.0, 2.0)], "polygon", "degenerate"),
+    ([(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)], "sweep", "sweep"),
+    ([(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)], "delaunay", "delaunay"),
+])
+def test_triangulation_chemin_de_calcul(points, engine, expected_path):
+    """Vérifie le chemin de calcul rapporté dans 'info'."""
+    info: dict = {}
+
+    compute_triangulation(points, engine=engine, info=info)
+
+    assert info["path"] == expected_path
+
+
+def test_triangulation_monotone_zigzag():
+    """Vérifie un polygone y-monotone en zigzag (chaînes irrégulières)."""
+    # Chaîne droite en zigzag vers le haut, chaîne gauche droite vers le bas
+    right = [(10.0 + (3.0 if i % 2 else 0.0), float(i)) for i in range(1, 20)]
+    left = [(-5.0 + (2.0 if i % 3 else 0.0), float(i) + 0.5)
+            for i in range(18, 0, -1)]
+    points: list[Point] = [(0.0, 0.0), *right, (0.0, 20.0), *left]
+    info: dict = {}
+
+    vertices, triangles = compute_triangulation(points, info=info)
+
+    assert info["path"] == "monotone"
+    _assert_covers_polygon(vertices, triangles)
+
+
+@pytest.mark.parametrize("points", [
+    # Carré avec les milieux de ses arêtes
+    [(0.0, 0.0), (1.0, 0.0), (2.0, 0.0), (2.0, 1.0), (2.0, 2.0), (1.0, 2.0),
+     (0.0, 2.0), (0.0, 1.0)],
+    # Rectangle avec plusieurs points sur chaque arête
+    [(0.0, 0.0), (1.0, 0.0), (2.0, 0.0), (3.0, 0.0), (3.0, 1.0), (3.0, 2.0),
+     (2.0, 2.0), (1.0, 2.0), (0.0, 2.0), (0.0, 1.0), (0.0, 0.5), (0.0, 0.25)],
+    # Chaîne oblique de sommets alignés
+    [(0.0, 0.0), (4.0, 0.0), (3.0, 1.0), (2.0, 2.0), (1.0, 3.0), (0.0, 4.0)],
+])
+def test_triangulation_monotone_sommets_alignes(points):
+    """Vérifie qu'aucun triangle plat n'est produit sur des sommets alignés."""
+    info: dict = {}
+
+    vertices, triangles = compute_triangulation(points, info=info)
+
+    assert info["path"] == "monotone"
+    _assert_covers_polygon(vertices, triangles)
+    _assert_covers_polygon(*compute_triangulation(points[::-1]))
+
+
+def test_triangulation_verification():
+    """Vérifie le contrôle des triangulations (plats, arêtes, orientation)."""
+    polygon = [(0.0, 0.0), (1.0, 0.0), (2.0, 0.0), (2.0, 2.0)]
+
+    assert _is_valid_triangulation(polygon, [(0, 1, 3), (1, 2, 3)], False)
+    # Triangle plat : l'arête (0, 1) n'est pas bordée par un vrai triangle
+    assert not _is_valid_triangulation(polygon, [(0, 1, 2), (0, 2, 3)], False)
+    # Orientation opposée au polygone
+    assert not _is_valid_triangulation(polygon, [(0, 3, 1), (1, 3, 2)], False)
+    # Nombre de triangles incorrect
+    assert not _is_valid_triangulation(polygon, [(0, 1, 3)], False)
+
+
+def test_triangulation_monotone_repli(monkeypatch):
+    """Vérifie le repli sur l'Ear Clipping si l'algorithme à pile échoue."""
+    points: list[Point] = [(0.0, 0.0), (2.0, 1.0), (0.0, 2.0), (1.0, 1.0)]
+    monkeypatch.setattr(
+        core, "_monotone_triangulation", lambda *args: [(0, 1, 1), (1, 2, 3)]
+    )
+    info: dict = {}
+
+    vertices, triangles = compute_triangulation(points, info=info)
+
+    assert info["path"] == "earclipping"
+    _assert_covers_polygon(vertices, triangles)
+
+
+# Tests de la décomposition monotone par balayage
+
+
+@pytest.mark.parametrize("points", [
+    _comb(40),
+    _comb(40)[::-1],
+    [(y, -x) for x, y in _comb(40)],
+    _random_polygon(500),
+])
+def test_triangulation_balayage_valide(points):
+    """Vérifie que le moteur 'sweep' recouvre exactement le polygone."""
+    info: dict = {}
+
+    vertices, triangles = compute_triangulation(points, engine="sweep", info=info)
+
+    assert info["path"] == "sweep"
+    _assert_covers_polygon(vertices, triangles)
+
+
+def test_triangulation_balayage_sommets_alignes():
+    """Vérifie le balayage sur des arêtes horizontales et sommets alignés."""
+    # Créneaux : nombreux sommets à la même ordonnée, de type split/merge
+    points: list[Point] = [(0.0, 0.0), (12.0, 0.0), (12.0, 4.0)]
+    for x in range(11, -1, -1):
+        points.append((float(x), 2.0 if x % 2 else 4.0))
+    info: dict = {}
+
+    vertices, triangles = compute_triangulation(points, engine="sweep", info=info)
+
+    assert info["path"] == "sweep"
+    _assert_covers_polygon(vertices, triangles)
+
+
+def test_triangulation_balayage_grand_peigne():
+    """Vérifie un peigne orthogonal au-delà du seuil (moteur par défaut)."""
+    points = _comb(300)
+    assert len(points) > core.SWEEP_THRESHOLD
+    info: dict = {}
+
+    vertices, triangles = compute_triangulation(points, info=info)
+
+    assert info["path"] == "sweep"
+    _assert_covers_polygon(vertices, triangles)
+
+
+@pytest.mark.parametrize("engine", ["polygon", "sweep"])
+def test_triangulation_balayage_nuage_repli(engine):
+    """Vérifie le repli sur l'Ear Clipping pour un nuage (non simple)."""
+    import random
+
+    rng = random.Random(1001)
+    points = [(rng.uniform(0.0, 1000.0), rng.uniform(0.0, 1000.0))
+              for _ in range(1001)]
+    info: dict = {}
+
+    vertices, triangles = compute_triangulation(points, engine=engine, info=info)
+
+    assert info["path"] == "earclipping"
+    assert len(vertices) == len(points)
+    assert all(0 <= i < len(vertices) for t in triangles for i in t)
+
+
+def test_triangulation_balayage_seuil_automatique():
+    """Vérifie le choix automatique du balayage au-delà du seuil."""
+    points = _comb(30)
+    info: dict = {}
+
+    compute_triangulation(points, info=info, sweep_threshold=len(points) - 1)
+    assert info["path"] == "sweep"
+
+    compute_triangulation(points, info=info, sweep_threshold=len(points))
+    assert info["path"] == "earclipping"
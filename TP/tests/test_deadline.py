@@ -0,0 +1,87 @@
+"""Tests Unitaires pour le délai des requêtes (échéances)."""
+
+import random
+import time
+
+import pytest
+from triangulator import core
+from triangulator.deadline import CHECK_EVERY, Deadline, DeadlineExceeded
+from triangulator.geometry import Mesh
+from triangulator.workers import ComputePool
+
+
+def _comb(teeth: int) -> list[core.Point]:
+    """Peigne de `teeth` dents (polygone concave, passe par l'Ear Clipping)."""
+    width = 2.0 * teeth
+    points: list[core.Point] = [(0.0, 0.0), (width, 0.0)]
+    for i in range(teeth):
+        x = width - 2.0 * i
+        points += [(x, 10.0), (x - 1.0, 10.0), (x - 1.0, 1.0), (x - 2.0, 1.0)]
+    return points
+
+
+def test_echeance():
+    """Vérifie le temps restant et l'expiration."""
+    deadline = Deadline(60)
+    assert 0 < deadline.remaining() <= 60
+    assert not deadline.expired()
+    deadline.check()
+
+    expired = Deadline(-1)
+    assert expired.remaining() == 0.0
+    assert expired.expired()
+    with pytest.raises(DeadlineExceeded, match="Délai"):
+        expired.check()
+
+
+@pytest.mark.parametrize("engine", core.ENGINES)
+def test_moteurs_interrompus(engine):
+    """Vérifie que chaque moteur abandonne un calcul dont l'échéance est passée."""
+    points = _comb(CHECK_EVERY // 2)
+    if engine == core.ENGINE_DELAUNAY:
+        rng = random.Random(0)
+        points = [(rng.random(), rng.random()) for _ in range(2 * CHECK_EVERY)]
+
+    with pytest.raises(DeadlineExceeded):
+        core.compute_triangulation(
+            points, engine=engine, deadline=Deadline(-1),
+            sweep_threshold=10 * len(points),
+        )
+
+
+def test_ear_clipping_nuage_interrompu_a_temps():
+    """Vérifie que l'Ear Clipping d'un nuage s'arrête peu après l'échéance."""
+    rng = random.Random(0)
+    points = [(rng.random(), rng.random()) for _ in range(20_000)]
+    deadline = Deadline(0.2)
+
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        core.compute_triangulation(
+            points, engine=core.ENGINE_POLYGON, deadline=deadline,
+            sweep_threshold=10 * len(points),
+        )
+    # Sans contrôle à chaque étape, l'abandon survenait après 1,7 s
+    assert time.monotonic() - start < 0.5
+
+
+def test_sans_echeance_resultat_inchange():
+    """Vérifie qu'une échéance lointaine ne change pas le résultat."""
+    points = _comb(50)
+    assert core.compute_triangulation(points, deadline=Deadline(60)) == (
+        core.compute_triangulation(points)
+    )
+
+
+def test_pool_transmet_l_echeance():
+    """Vérifie que le pool de calcul transmet le temps restant au calcul."""
+    pool = ComputePool(0, max_pending=1)
+    mesh = Mesh.from_tuples(_comb(CHECK_EVERY // 2))
+    deadline = Deadline(0.01)
+    time.sleep(0.02)
+
+    with pytest.raises(DeadlineExceeded):
+        pool.triangulate(mesh, core.ENGINE_POLYGON, 10**6, deadline)
+    # La place est rendue malgré l'abandon
+    triangle = Mesh.from_tuples([(0, 0), (1, 0), (0, 1)])
+    pool.triangulate(triangle, core.ENGINE_POLYGON, 10)
@@ -0,0 +1,88 @@
+"""Tests Unitaires pour le moteur de Delaunay (delaunay.py)."""
+
+import random
+
+from triangulator.core import Point, _cross_product_2d, compute_triangulation
+from triangulator.delaunay import delaunay_triangulation
+
+
+def _convex_hull_size(points: list[Point]) -> int:
+    """Nombre de sommets de l'enveloppe convexe (chaîne monotone)."""
+    pts = sorted(points)
+    hull: list[Point] = []
+    for chain in (pts, pts[::-1]):
+        start = len(hull)
+        for p in chain:
+            while (len(hull) >= start + 2
+                   and _cross_product_2d(hull[-2], hull[-1], p) <= 0):
+                hull.pop()
+            hull.append(p)
+        hull.pop()
+    return len(hull)
+
+
+def _in_circumcircle(a: Point, b: Point, c: Point, p: Point) -> bool:
+    """Vérifie si P est strictement dans le cercle circonscrit à A-B-C."""
+    if _cross_product_2d(a, b, c) < 0:
+        b, c = c, b
+    ax, ay = a[0] - p[0], a[1] - p[1]
+    bx, by = b[0] - p[0], b[1] - p[1]
+    cx, cy = c[0] - p[0], c[1] - p[1]
+    det = ((ax * ax + ay * ay) * (bx * cy - cx * by)
+           - (bx * bx + by * by) * (ax * cy - cx * ay)
+           + (cx * cx + cy * cy) * (ax * by - bx * ay))
+    return det > 1e-6
+
+
+def test_delaunay_carre():
+    """Vérifie qu'un carré produit 2 triangles."""
+    points: list[Point] = [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)]
+
+    triangles = delaunay_triangulation(points)
+
+    assert len(triangles) == 2
+
+
+def test_delaunay_points_colineaires():
+    """Vérifie que des points alignés ne produisent aucun triangle."""
+    points: list[Point] = [(0.0, 0.0), (1.0, 1.0), (2.0, 2.0), (3.0, 3.0)]
+
+    assert delaunay_triangulation(points) == []
+
+
+def test_delaunay_nombre_triangles():
+    """Vérifie le nombre de triangles : 2n - 2 - h (h = taille de l'enveloppe)."""
+    rng = random.Random(1)
+    points = list({(rng.uniform(0, 1000), rng.uniform(0, 1000))
+                   for _ in range(1000)})
+
+    triangles = delaunay_triangulation(points)
+
+    assert len(triangles) == 2 * len(points) - 2 - _convex_hull_size(points)
+
+
+def test_delaunay_cercle_vide():
+    """Vérifie qu'aucun point n'est dans le cercle circonscrit d'un triangle."""
+    rng = random.Random(7)
+    points = list({(rng.uniform(0, 100), rng.uniform(0, 100))
+                   for _ in range(80)})
+
+    triangles = delaunay_triangulation(points)
+
+    for a, b, c in triangles:
+        for i, p in enumerate(points):
+            if i in (a, b, c):
+                continue
+            assert not _in_circumcircle(points[a], points[b], points[c], p)
+
+
+def test_compute_triangulation_moteur_delaunay():
+    """Vérifie que compute_triangulation délègue au moteur Delaunay."""
+    # Nuage non ordonné : en polygone, ces points s'auto-intersectent
+    points: list[Point] = [(0.0, 0.0), (1.0, 1.0), (1.0, 0.0), (0.0, 1.0),
+                           (0.0, 0.0)]
+
+    vertices, triangles = compute_triangulation(points, engine="delaunay")
+
+    assert len(vertices) == 4
+    assert len(triangles) == 2
@@ -0,0 +1,44 @@
+"""Tests Unitaires pour le conteneur géométrique compact (Mesh)."""
+
+import pickle
+from array import array
+
+from triangulator.geometry import INDEX_TYPECODE, Mesh
+
+
+def test_mesh_depuis_et_vers_les_tuples():
+    """Vérifie l'adaptateur listes de tuples <-> tableaux plats."""
+    points = [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)]
+    triangles = [(0, 1, 2), (0, 2, 3)]
+
+    mesh = Mesh.from_tuples(points, triangles)
+
+    assert mesh.vertices.typecode == "f"
+    assert mesh.triangles.typecode == INDEX_TYPECODE
+    assert mesh.vertices.tolist() == [0, 0, 1, 0, 1, 1, 0, 1]
+    assert (mesh.vertex_count, mesh.triangle_count) == (4, 2)
+    assert mesh.points() == points
+    assert mesh.triangle_tuples() == triangles
+
+
+def test_mesh_sans_copie():
+    """Vérifie que les tableaux donnés sont repris tels quels."""
+    coords = array("f", [1.0, 2.0, 3.0, 4.0])
+
+    mesh = Mesh(coords)
+
+    assert mesh.vertices is coords
+    assert mesh.triangle_count == 0
+    assert Mesh().vertex_count == 0
+
+
+def test_mesh_egalite_et_pickle():
+    """Vérifie l'égalité et l'aller-retour pickle (pool de processus)."""
+    mesh = Mesh.from_tuples([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)], [(0, 1, 2)])
+
+    copy = pickle.loads(pickle.dumps(mesh))
+
+    assert copy == mesh
+    assert copy != Mesh(mesh.vertices)
+    assert not hasattr(mesh, "__dict__")
+    assert repr(mesh) == "Mesh(sommets=3, triangles=1)"
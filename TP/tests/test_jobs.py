@@ -0,0 +1,105 @@
+"""Tests Unitaires pour les tâches de triangulation asynchrones."""
+
+import threading
+
+import pytest
+from triangulator import jobs
+from triangulator.jobs import JobManager, JobQueueFullError
+
+
+def test_job_termine_avec_resultat():
+    """Vérifie l'exécution en arrière-plan et le résultat conservé."""
+    manager = JobManager(workers=1, ttl=60)
+    job = manager.submit("ps", "polygon", lambda job: "resultat")
+
+    assert job.wait(5)
+    assert job.status == jobs.DONE
+    assert job.result == "resultat"
+    assert job.progress == 1.0
+    assert manager.get(job.id) is job
+    manager.shutdown()
+
+
+def test_job_suivi_des_etapes():
+    """Vérifie l'état 'running' et la progression par étape."""
+    manager = JobManager(workers=1, ttl=60)
+    in_step = threading.Event()
+    release = threading.Event()
+
+    def compute(job):
+        job.set_step("triangulate")
+        in_step.set()
+        release.wait(5)
+        return None
+
+    job = manager.submit("ps", "polygon", compute)
+    assert in_step.wait(5)
+
+    state = job.to_dict()
+    assert state["status"] == jobs.RUNNING
+    assert state["step"] == "triangulate"
+    assert state["progress"] == 0.5  # 2 étapes sur 4 terminées
+
+    release.set()
+    assert job.wait(5)
+    manager.shutdown()
+
+
+def test_job_en_echec_garde_l_erreur():
+    """Vérifie qu'une exception du calcul marque la tâche en échec."""
+    manager = JobManager(workers=1, ttl=60)
+
+    def compute(job):
+        raise ValueError("echec")
+
+    job = manager.submit("ps", "polygon", compute)
+
+    assert job.wait(5)
+    assert job.status == jobs.FAILED
+    assert isinstance(job.error, ValueError)
+    manager.shutdown()
+
+
+def test_job_expire_apres_ttl():
+    """Vérifie qu'une tâche terminée est oubliée après le TTL."""
+    manager = JobManager(workers=1, ttl=0)
+    job = manager.submit("ps", "polygon", lambda job: None)
+    assert job.wait(5)
+
+    assert manager.get(job.id) is None
+    assert len(manager) == 0
+    manager.shutdown()
+
+
+def test_job_file_pleine():
+    """Vérifie le refus au-delà de max_pending tâches non terminées."""
+    manager = JobManager(workers=1, ttl=60, max_pending=1)
+    release = threading.Event()
+
+    first = manager.submit("ps", "polygon", lambda job: release.wait(5))
+    with pytest.raises(JobQueueFullError):
+        manager.submit("autre", "polygon", lambda job: None)
+
+    release.set()
+    assert first.wait(5)
+    # La place est libérée une fois la tâche terminée
+    assert manager.submit("autre", "polygon", lambda job: None).wait(5)
+    manager.shutdown()
+
+
+def test_job_meme_cle_reprise():
+    """Vérifie qu'une tâche non terminée de même clé est reprise."""
+    manager = JobManager(workers=1, ttl=60, max_pending=1)
+    release = threading.Event()
+
+    first = manager.submit("ps", "polygon", lambda job: release.wait(5), key="k")
+    # Même clé : aucune nouvelle tâche (et pas de refus, la file est pleine)
+    assert manager.submit("ps", "polygon", lambda job: None, key="k") is first
+
+    release.set()
+    assert first.wait(5)
+    # Tâche terminée : une nouvelle soumission crée une nouvelle tâche
+    second = manager.submit("ps", "polygon", lambda job: None, key="k")
+    assert second is not first
+    assert second.wait(5)
+    manager.shutdown()
@@ -1,16 +1,23 @@
 """Tests Unitaires pour le module manager_client.
 
 Ce fichier teste la fonction fetch_pointset_from_manager en mockant
-directement urllib.request.urlopen pour couvrir tous les cas.
+directement urllib.request.urlopen pour couvrir tous les cas. Le pool de
+connexions est testé contre un petit serveur HTTP/1.1 local.
 """
 
 import struct
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock, patch
 from urllib.error import HTTPError, URLError
 from uuid import UUID
 
 import pytest
-from triangulator.manager_client import fetch_pointset_from_manager
+from triangulator.binary_utils import BinaryFormatError, PointSetDecoder
+from triangulator.manager_client import (
+    ConnectionPool,
+    fetch_pointset_from_manager,
+)
 
 # UUID de test
 TEST_UUID = UUID("123e4567-e89b-12d3-a456-426614174000")
@@ -115,3 +122,164 @@ def test_fetch_pointset_unexpected_status():
 
         assert exc_info.value.code == 204
         assert "Réponse inattendue" in exc_info.value.reason
+
+
+# Pool de connexions persistantes (serveur local keep-alive)
+
+
+class _PointSetHandler(BaseHTTPRequestHandler):
+    """Sert TEST_POINTSET_BYTES en HTTP/1.1 (keep-alive)."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802
+        """Répond 200 sur /pointset/<TEST_UUID>, 404 sinon."""
+        self.server.connections.add(self.client_address)
+        if self.path == f"/pointset/{TEST_UUID}":
+            body, status = self.server.body, 200
+        else:
+            body, status = b"", 404
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        # Fermeture silencieuse (sans "Connection: close") : socket périmée
+        # côté client, comme après un timeout d'inactivité du serveur
+        self.close_connection = self.server.drop_after_response
+
+    def log_message(self, *args):
+        """Pas de logs sur la sortie des tests."""
+
+
+@pytest.fixture
+def manager_server():
+    """Démarre un PointSetManager factice, renvoie son URL de base."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _PointSetHandler)
+    server.connections = set()
+    server.drop_after_response = False
+    server.body = TEST_POINTSET_BYTES
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield server, f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_pool_reutilise_la_connexion(manager_server):
+    """Teste que deux appels successifs partagent la même connexion TCP."""
+    server, base_url = manager_server
+    pool = ConnectionPool()
+
+    first = fetch_pointset_from_manager(base_url, TEST_UUID, pool=pool)
+    second = fetch_pointset_from_manager(base_url, TEST_UUID, pool=pool)
+
+    assert first == second == TEST_POINTSET_BYTES
+    assert len(server.connections) == 1
+    pool.close()
+
+
+def test_pool_http_404(manager_server):
+    """Teste qu'un statut non 200 lève une HTTPError, comme urlopen."""
+    _, base_url = manager_server
+    pool = ConnectionPool()
+
+    with pytest.raises(HTTPError) as exc_info:
+        fetch_pointset_from_manager(
+            base_url, UUID(int=0), pool=pool
+        )
+
+    assert exc_info.value.code == 404
+    pool.close()
+
+
+def test_pool_reconnexion_socket_perimee(manager_server):
+    """Teste la reprise transparente quand le serveur a fermé la socket."""
+    server, base_url = manager_server
+    server.drop_after_response = True
+    pool = ConnectionPool()
+
+    fetch_pointset_from_manager(base_url, TEST_UUID, pool=pool)
+    result = fetch_pointset_from_manager(base_url, TEST_UUID, pool=pool)
+
+    assert result == TEST_POINTSET_BYTES
+    assert len(server.connections) == 2
+    pool.close()
+
+
+def test_pool_eviction_inactives(manager_server):
+    """Teste qu'une connexion inactive trop longtemps n'est pas reprise."""
+    server, base_url = manager_server
+    pool = ConnectionPool(idle_timeout=-1.0)  # tout est déjà expiré
+
+    fetch_pointset_from_manager(base_url, TEST_UUID, pool=pool)
+    fetch_pointset_from_manager(base_url, TEST_UUID, pool=pool)
+
+    assert len(server.connections) == 2
+    pool.close()
+
+
+def test_pool_taille_maximale(manager_server):
+    """Teste que le pool ne garde pas plus de `size` connexions inactives."""
+    _, base_url = manager_server
+    pool = ConnectionPool(size=0)
+
+    fetch_pointset_from_manager(base_url, TEST_UUID, pool=pool)
+
+    assert all(not idle for idle in pool._idle.values())
+
+
+def test_pool_connexion_refusee():
+    """Teste qu'un hôte injoignable lève une URLError."""
+    pool = ConnectionPool(timeout=1.0)
+
+    with pytest.raises(URLError):
+        # Port 9 (discard) : fermé sur la machine de test
+        fetch_pointset_from_manager("http://127.0.0.1:9", TEST_UUID, pool=pool)
+
+
+def test_pool_decodage_pendant_la_reception(manager_server):
+    """Teste le décodage incrémental, octets surnuméraires ignorés."""
+    server, base_url = manager_server
+    server.body = TEST_POINTSET_BYTES + b"\x00\x00"
+    pool = ConnectionPool()
+    decoder = PointSetDecoder()
+
+    result = fetch_pointset_from_manager(
+        base_url, TEST_UUID, pool=pool, decoder=decoder
+    )
+    # Reste de la réponse vidé : la connexion est réutilisable
+    fetch_pointset_from_manager(base_url, TEST_UUID, pool=pool)
+
+    assert result == TEST_POINTSET_BYTES
+    assert decoder.coords.tolist() == [1.0, 2.0, 3.0, 4.0]
+    assert len(server.connections) == 1
+    pool.close()
+
+
+def test_pool_decodage_pointset_tronque(manager_server):
+    """Teste le rejet immédiat d'un PointSet tronqué, connexion fermée."""
+    server, base_url = manager_server
+    server.body = TEST_POINTSET_BYTES[:-1]
+    pool = ConnectionPool()
+
+    with pytest.raises(BinaryFormatError):
+        fetch_pointset_from_manager(
+            base_url, TEST_UUID, pool=pool, decoder=PointSetDecoder()
+        )
+
+    assert all(not idle for idle in pool._idle.values())
+
+
+def test_pool_timeout_par_appel(manager_server):
+    """Teste qu'un timeout plus court s'applique à la connexion réutilisée."""
+    _, base_url = manager_server
+    pool = ConnectionPool(timeout=5.0)
+    fetch_pointset_from_manager(base_url, TEST_UUID, pool=pool)
+
+    fetch_pointset_from_manager(base_url, TEST_UUID, pool=pool, timeout=0.5)
+
+    ((conn, _),) = next(iter(pool._idle.values()))
+    assert conn.timeout == conn.sock.gettimeout() == 0.5
+    pool.close()
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""Tests Unitaires pour les métriques (format texte de Prometheus)."""
+
+import pytest
+from triangulator.metrics import (
+    Counter,
+    Histogram,
+    Registry,
+    start_timings,
+    stop_timings,
+)
+
+
+def test_compteur_etiquete():
+    """Vérifie les totaux par valeur d'étiquette."""
+    counter = Counter("erreurs_total", "Erreurs.", label="code")
+    counter.inc(label_value="TIMEOUT")
+    counter.inc(2, label_value="TIMEOUT")
+    counter.inc(label_value='A"B')
+
+    assert counter.value("TIMEOUT") == 3
+    assert counter.value("AUTRE") == 0
+    assert list(counter.samples()) == [
+        ("", '{code="A\\"B"}', 1),
+        ("", '{code="TIMEOUT"}', 3),
+    ]
+
+
+def test_histogramme_classes_cumulees():
+    """Vérifie les classes cumulées (bornes inclusives), la somme et l'effectif."""
+    histogram = Histogram("duree_seconds", "Durée.", buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+
+    assert histogram.count == 4
+    assert list(histogram.samples()) == [
+        ("_bucket", '{le="0.1"}', 2),
+        ("_bucket", '{le="1.0"}', 3),
+        ("_bucket", '{le="+Inf"}', 4),
+        ("_sum", "", 2.65),
+        ("_count", "", 4),
+    ]
+
+
+def test_histogramme_mesure_un_bloc():
+    """Vérifie que `time()` enregistre la durée, même en cas d'exception."""
+    histogram = Histogram("duree_seconds", "Durée.")
+
+    with histogram.time():
+        pass
+    with pytest.raises(ValueError), histogram.time():
+        raise ValueError
+
+    assert histogram.count == 2
+
+
+def test_releve_des_etapes_de_la_requete():
+    """Vérifie le relevé par étape nommée, limité à la requête suivie."""
+    histogram = Histogram("duree_seconds", "Durée.")
+    with histogram.time("fetch"):
+        pass  # hors relevé
+
+    timings = start_timings()
+    with histogram.time("fetch"):
+        pass
+    with histogram.time("fetch"):
+        pass
+    with histogram.time():
+        pass  # étape sans nom : histogramme seulement
+    stop_timings()
+    with histogram.time("compute"):
+        pass
+
+    assert list(timings) == ["fetch"]
+    assert timings["fetch"] > 0
+    assert histogram.count == 5
+
+
+def test_registre_rendu_prometheus():
+    """Vérifie le texte rendu et le refus d'un nom déjà enregistré."""
+    registry = Registry()
+    requests = registry.counter("requetes_total", "Requêtes reçues.")
+    histogram = registry.histogram("duree_seconds", "Durée.", buckets=(1.0,))
+    requests.inc()
+    histogram.observe(0.5)
+
+    assert registry.render() == (
+        "# HELP requetes_total Requêtes reçues.\n"
+        "# TYPE requetes_total counter\n"
+        "requetes_total 1.0\n"
+        "# HELP duree_seconds Durée.\n"
+        "# TYPE duree_seconds histogram\n"
+        'duree_seconds_bucket{le="1.0"} 1.0\n'
+        'duree_seconds_bucket{le="+Inf"} 1.0\n'
+        "duree_seconds_sum 0.5\n"
+        "duree_seconds_count 1.0\n"
+    )
+    with pytest.raises(ValueError):
+        registry.counter("requetes_total", "Doublon.")
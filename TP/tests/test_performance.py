@@ -4,12 +4,25 @@ Tous les tests ici sont marqués avec '@pytest.mark.perf' pour être
 exécutés séparément.
 """
 
+import math
 import random
 import struct
+import time
+import tracemalloc
+from array import array
 
 import pytest
-from triangulator.binary_utils import binary_to_pointset, triangles_to_binary
+import triangulator.core as core
+from triangulator.admission import SECONDS_PER_COST, estimate_cost
+from triangulator.binary_utils import (
+    binary_to_coords,
+    binary_to_pointset,
+    iter_triangles_binary,
+    triangles_to_binary,
+)
 from triangulator.core import Point, Triangle, compute_triangulation
+from triangulator.geometry import Mesh
+from triangulator.metrics import Histogram
 
 
 def _generate_large_pointset(count: int) -> list[Point]:
@@ -49,6 +62,11 @@ def _generate_valid_binary_pointset(count: int) -> bytes:
 
 # Tests de Performance
 # Note: L'algorithme Ear Clipping a une complexité O(n²), 
+# Les nuages aléatoires ne sont pas des polygones simples. Le moteur par
+# défaut ("polygon") les traite quand même comme un anneau : au-delà du
+# seuil du balayage, celui-ci détecte l'incohérence et se rabat sur l'Ear
+# Clipping. Seul le moteur "delaunay", demandé explicitement, les
+# triangule en O(n log n).
 
 
 @pytest.mark.perf
@@ -67,16 +85,122 @@ def test_perf_triangulation_100_points():
 
 @pytest.mark.perf
 def test_perf_triangulation_10000_points():
-    """Mesure le temps de calcul pour 10 000 points."""
+    """Mesure le temps de calcul pour 10 000 points (moteur par défaut)."""
     points = _generate_large_pointset(10000)
-    compute_triangulation(points)
+    info: dict = {}
+
+    compute_triangulation(points, info=info)
+
+    # Anneau non simple : le balayage se rabat sur l'Ear Clipping
+    assert info["path"] == "earclipping"
 
 
 @pytest.mark.perf
-def test_perf_triangulation_100k_points():
-    """Mesure le temps de calcul pour 100 000 points."""
-    points = _generate_large_pointset(100000)
-    compute_triangulation(points)
+@pytest.mark.parametrize("count", [10000, 100000])
+def test_perf_triangulation_delaunay(count):
+    """Mesure le moteur "delaunay" sur un nuage de 10k et 100k points."""
+    points = _generate_large_pointset(count)
+    vertices, triangles = compute_triangulation(points, engine="delaunay")
+
+    # Un nuage de n points donne au plus 2n - 5 triangles
+    assert len(vertices) - 2 <= len(triangles) <= 2 * len(vertices) - 5
+
+
+def _generate_star_polygon(count: int) -> list[Point]:
+    """Génère un polygone simple étoilé (rayons bruités) de 'count' sommets."""
+    points = []
+    for i in range(count):
+        angle = 2 * math.pi * i / count
+        radius = 10000.0 * (1 + 0.002 * random.random())
+        points.append((radius * math.cos(angle), radius * math.sin(angle)))
+    return points
+
+
+def _time_predicates(points: list[Point]) -> float:
+    """Chronomètre les prédicats O(n) de core sur un polygone."""
+    start = time.perf_counter()
+    # Comme compute_triangulation : une seule conversion vers NumPy
+    source = core._as_array(points) if core._use_numpy(len(points)) else points
+    clockwise = core._polygon_area_signed(source) < 0
+    core._convex_flags(source, clockwise)
+    core._all_collinear(source)
+    return time.perf_counter() - start
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("count", [10000, 100000])
+def test_perf_predicats_vectorises(count, monkeypatch):
+    """Compare les prédicats NumPy au Python pur (10k et 100k sommets)."""
+    pytest.importorskip("numpy")
+    points = _generate_star_polygon(count)
+
+    vectorized = _time_predicates(points)
+    monkeypatch.setattr(core, "np", None)
+    pure = _time_predicates(points)
+
+    print(f"\n{count} sommets: NumPy {vectorized * 1000:.1f} ms, "
+          f"Python pur {pure * 1000:.1f} ms (x{pure / vectorized:.1f})")
+    assert vectorized < pure
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("count", [10000, 100000])
+def test_perf_triangulation_polygone(count):
+    """Mesure le moteur "polygon" sur un polygone simple de 10k et 100k sommets."""
+    points = _generate_star_polygon(count)
+
+    vertices, triangles = compute_triangulation(points)
+
+    assert len(triangles) == len(vertices) - 2
+
+
+def _generate_spiky_polygon(count: int) -> list[Point]:
+    """Génère une étoile à pics profonds (un sommet sur deux rentrant)."""
+    points = []
+    for i in range(count):
+        angle = 2 * math.pi * i / count
+        radius = (10000.0 if i % 2 else 3000.0) * (1 + 0.05 * random.random())
+        points.append((radius * math.cos(angle), radius * math.sin(angle)))
+    return points
+
+
+@pytest.mark.perf
+def test_perf_balayage_contre_ear_clipping():
+    """Compare le balayage monotone à l'Ear Clipping (20k sommets)."""
+    points = _generate_spiky_polygon(20000)
+
+    start = time.perf_counter()
+    compute_triangulation(points, sweep_threshold=len(points))
+    ear_clipping = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vertices, triangles = compute_triangulation(points, engine="sweep")
+    sweep = time.perf_counter() - start
+
+    print(f"\nEar Clipping {ear_clipping * 1000:.1f} ms, "
+          f"balayage {sweep * 1000:.1f} ms (x{ear_clipping / sweep:.1f})")
+    assert len(triangles) == len(vertices) - 2
+    assert sweep < ear_clipping
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize(("engine", "generate", "count"), [
+    ("delaunay", _generate_large_pointset, 100000),
+    ("polygon", _generate_spiky_polygon, 20000),
+    # Nuage au-delà du seuil : balayage en échec, puis Ear Clipping
+    ("polygon", _generate_large_pointset, 4000),
+])
+def test_perf_calibration_admission(engine, generate, count):
+    """Vérifie que SECONDS_PER_COST majore la durée réelle des calculs."""
+    points = generate(count)
+
+    start = time.perf_counter()
+    compute_triangulation(points, engine=engine)
+    per_cost = (time.perf_counter() - start) / estimate_cost(count, engine)
+
+    print(f"\n{engine}, {count} points: {per_cost * 1e6:.2f} µs par unité "
+          f"(admission: {SECONDS_PER_COST * 1e6:.2f} µs)")
+    assert per_cost <= SECONDS_PER_COST
 
 
 @pytest.mark.perf
@@ -87,6 +211,36 @@ def test_perf_serialisation_large():
     triangles_to_binary(points, triangles)
 
 
+def _triangles_to_binary_par_element(vertices: list[Point],
+                                     triangles: list[Triangle]) -> bytes:
+    """Ancienne sérialisation (un struct.pack par élément, puis join)."""
+    chunks = [struct.pack("!I", len(vertices))]
+    chunks.extend(struct.pack("!ff", x, y) for x, y in vertices)
+    chunks.append(struct.pack("!I", len(triangles)))
+    chunks.extend(struct.pack("!III", *t) for t in triangles)
+    return b"".join(chunks)
+
+
+@pytest.mark.perf
+def test_perf_serialisation_preallouee():
+    """Compare l'écriture en bloc à l'écriture par élément (100k / 200k)."""
+    points, triangles = _generate_large_triangles(100000)
+
+    start = time.perf_counter()
+    expected = _triangles_to_binary_par_element(points, triangles)
+    per_element = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = triangles_to_binary(points, triangles)
+    bulk = time.perf_counter() - start
+
+    print(f"\n100k points / 200k triangles: par élément "
+          f"{per_element * 1000:.1f} ms, en bloc {bulk * 1000:.1f} ms "
+          f"(x{per_element / bulk:.1f})")
+    assert result == expected
+    assert bulk < per_element
+
+
 @pytest.mark.perf
 def test_perf_deserialisation_large():
     """Mesure le temps de désérialisation pour 100k points."""
@@ -97,3 +251,91 @@ def test_perf_deserialisation_large():
 
     # Vérifie que la désérialisation a bien fonctionné
     assert len(result) == 100000
+
+
+def _binary_to_pointset_par_point(data: bytes) -> list[Point]:
+    """Ancienne désérialisation (une tranche et un unpack par point)."""
+    count = struct.unpack("!I", data[:4])[0]
+    return [struct.unpack("!ff", data[4 + 8 * i : 12 + 8 * i])
+            for i in range(count)]
+
+
+@pytest.mark.perf
+def test_perf_deserialisation_en_bloc():
+    """Compare la lecture en bloc (memoryview) à la lecture point par point."""
+    valid_binary_data = _generate_valid_binary_pointset(100000)
+
+    start = time.perf_counter()
+    expected = _binary_to_pointset_par_point(valid_binary_data)
+    per_point = time.perf_counter() - start
+
+    start = time.perf_counter()
+    coords = binary_to_coords(valid_binary_data)
+    bulk = time.perf_counter() - start
+
+    print(f"\n100k points: par point {per_point * 1000:.1f} ms, "
+          f"en bloc {bulk * 1000:.1f} ms (x{per_point / bulk:.1f})")
+    assert binary_to_pointset(valid_binary_data) == expected
+    assert len(coords) == 2 * len(expected)
+    assert bulk < per_point
+
+
+@pytest.mark.perf
+def test_perf_serialisation_en_flux_memoire():
+    """Compare le pic mémoire de la sérialisation en flux et en un bloc."""
+    count = 500000
+    coords = array("f", (random.uniform(0, 1000) for _ in range(2 * count)))
+    indices = array("I", (random.randrange(count) for _ in range(6 * count)))
+
+    tracemalloc.start()
+    size = len(triangles_to_binary(coords, indices))
+    whole = tracemalloc.get_traced_memory()[1]
+    tracemalloc.reset_peak()
+    streamed_size = sum(map(len, iter_triangles_binary(coords, indices)))
+    streamed = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print(f"\n{size / 1e6:.0f} Mo: pic en un bloc {whole / 1e6:.1f} Mo, "
+          f"en flux {streamed / 1e6:.1f} Mo")
+    assert streamed_size == size
+    assert streamed < 4 * 1024 * 1024 < whole
+
+
+@pytest.mark.perf
+def test_perf_enregistrement_metrique():
+    """Vérifie le coût d'une mesure de durée (quelques µs au plus)."""
+    histogram = Histogram("perf_seconds", "Test.")
+    count = 100000
+
+    start = time.perf_counter()
+    for _ in range(count):
+        with histogram.time():
+            pass
+    per_sample = (time.perf_counter() - start) / count
+
+    print(f"\nMesure d'une étape: {per_sample * 1e6:.2f} µs")
+    assert histogram.count == count
+    assert per_sample < 10e-6
+
+
+@pytest.mark.perf
+def test_perf_memoire_mesh_contre_tuples():
+    """Compare la mémoire d'un Mesh et des listes de tuples équivalentes."""
+    count = 100000
+    points = _generate_large_pointset(count)
+    triangles = [(i, i + 1, i + 2) for i in range(count - 2)]
+
+    tracemalloc.start()
+    as_tuples = ([(x, y) for x, y in points], [tuple(t) for t in triangles])
+    tuples_size = tracemalloc.get_traced_memory()[0]
+    del as_tuples
+    tracemalloc.reset_peak()
+    start = tracemalloc.get_traced_memory()[0]
+    mesh = Mesh.from_tuples(points, triangles)
+    mesh_size = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+
+    print(f"\n{count} points et triangles: tuples {tuples_size / count:.0f} "
+          f"o/élément, Mesh {mesh_size / count:.0f} o/élément")
+    assert mesh.vertex_count == count
+    assert mesh_size * 3 < tuples_size
\ No newline at end of file
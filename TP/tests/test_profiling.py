@@ -0,0 +1,58 @@
+"""Tests Unitaires pour le profilage échantillonné des requêtes."""
+
+import os
+import pstats
+
+from triangulator.profiling import SamplingProfiler
+
+
+def test_profilage_desactive_sans_repertoire():
+    """Vérifie que rien n'est profilé sans répertoire, même forcé."""
+    profiler = SamplingProfiler(None, every=1)
+
+    assert profiler.start() is None
+    assert profiler.start(forced=True) is None
+
+
+def test_profilage_une_requete_sur_n(tmp_path):
+    """Vérifie l'échantillonnage (une requête sur every) et le forçage."""
+    profiler = SamplingProfiler(str(tmp_path), every=3)
+
+    sampled = []
+    for _ in range(6):
+        profile = profiler.start()
+        sampled.append(profile is not None)
+        if profile is not None:
+            profiler.stop(profile, "ps", 10)
+
+    assert sampled == [False, False, True, False, False, True]
+    forced = profiler.start(forced=True)
+    assert forced is not None
+    profiler.stop(forced, "ps", None)
+
+
+def test_profilage_une_requete_a_la_fois(tmp_path):
+    """Vérifie qu'une seule requête est profilée à la fois."""
+    profiler = SamplingProfiler(str(tmp_path))
+    profile = profiler.start(forced=True)
+
+    assert profiler.start(forced=True) is None
+    profiler.stop(profile, "ps", 10)
+    second = profiler.start(forced=True)
+    assert second is not None
+    profiler.stop(second, "ps", 10)
+
+
+def test_profilage_fichier_ecrit(tmp_path):
+    """Vérifie le nom du fichier (identifiant, sommets) et son contenu."""
+    profiler = SamplingProfiler(str(tmp_path / "profils"))
+    profile = profiler.start(forced=True)
+    sorted(range(1000))
+
+    path = profiler.stop(profile, "ps", 1000)
+
+    assert os.path.basename(path).startswith("ps-1000v-")
+    assert path.endswith(".prof")
+    stats = pstats.Stats(path)
+    assert any(name == "<built-in method builtins.sorted>"
+               for _, _, name in stats.stats)
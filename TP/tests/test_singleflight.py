@@ -0,0 +1,116 @@
+"""Tests Unitaires pour le regroupement des calculs concurrents."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from triangulator.deadline import Deadline, DeadlineExceeded
+from triangulator.singleflight import SingleFlight
+
+
+def _concurrent_calls(flight, fn, count=8):
+    """Lance `count` appels concurrents de même clé, fn bloquée au départ."""
+    release = threading.Event()
+
+    def blocked():
+        release.wait(5)
+        return fn()
+
+    with ThreadPoolExecutor(count) as executor:
+        futures = [executor.submit(flight.do, "cle", blocked)
+                   for _ in range(count)]
+        # Attendre que tous les appelants soient entrés dans `do`
+        while flight.shared < count - 1:
+            threading.Event().wait(0.001)
+        release.set()
+        return futures
+
+
+def test_singleflight_partage_le_resultat():
+    """Vérifie qu'un seul calcul est fait pour des appels concurrents."""
+    flight = SingleFlight()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return "resultat"
+
+    futures = _concurrent_calls(flight, compute)
+
+    assert [f.result() for f in futures] == ["resultat"] * 8
+    assert len(calls) == 1
+
+
+def test_singleflight_partage_l_erreur():
+    """Vérifie que l'exception du calcul est propagée à tous les appelants."""
+    flight = SingleFlight()
+
+    def compute():
+        raise ValueError("echec")
+
+    futures = _concurrent_calls(flight, compute)
+
+    for future in futures:
+        with pytest.raises(ValueError, match="echec"):
+            future.result()
+
+
+def test_singleflight_appels_successifs_recalcules():
+    """Vérifie qu'un appel après la fin du calcul relance la fonction."""
+    flight = SingleFlight()
+    calls = []
+
+    flight.do("cle", lambda: calls.append(1))
+    flight.do("cle", lambda: calls.append(1))
+
+    assert len(calls) == 2
+    assert flight.shared == 0
+
+
+def test_singleflight_attente_bornee_par_l_echeance():
+    """Vérifie que l'attente du calcul d'un autre est bornée par l'échéance."""
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+
+    def compute():
+        started.set()
+        release.wait(5)
+        return "resultat"
+
+    with ThreadPoolExecutor(1) as executor:
+        leader = executor.submit(flight.do, "cle", compute)
+        assert started.wait(5)
+        with pytest.raises(DeadlineExceeded):
+            flight.do("cle", compute, Deadline(0.05))
+        release.set()
+        # Le calcul en vol n'est pas interrompu par le départ de l'appelant
+        assert leader.result(5) == "resultat"
+
+
+def test_singleflight_echeance_du_premier_appelant():
+    """Vérifie qu'un calcul abandonné à l'échéance du premier est relancé."""
+    flight = SingleFlight()
+    started = threading.Event()
+    calls = []
+
+    def short_compute():
+        calls.append("court")
+        started.set()
+        # Attendre l'arrivée du second appelant, puis dépasser l'échéance
+        while flight.shared < 1:
+            threading.Event().wait(0.001)
+        raise DeadlineExceeded("Délai de 0.1 s dépassé.")
+
+    def compute():
+        calls.append("long")
+        return "resultat"
+
+    with ThreadPoolExecutor(1) as executor:
+        leader = executor.submit(flight.do, "cle", short_compute, Deadline(0.1))
+        assert started.wait(5)
+        assert flight.do("cle", compute, Deadline(5)) == "resultat"
+        with pytest.raises(DeadlineExceeded):
+            leader.result(5)
+
+    assert calls == ["court", "long"]
+
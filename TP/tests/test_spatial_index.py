@@ -0,0 +1,44 @@
+"""Tests Unitaires pour l'index spatial de Morton (spatial_index.py)."""
+
+import random
+
+from triangulator.spatial_index import MortonIndex
+
+
+def _brute_force(points, start, min_x, min_y, max_x, max_y):
+    """Référence : tous les points de la boîte (hors `start`)."""
+    return {
+        i for i, (x, y) in enumerate(points)
+        if i != start and min_x <= x <= max_x and min_y <= y <= max_y
+    }
+
+
+def test_morton_query_identique_force_brute():
+    """Vérifie que la requête renvoie exactement les points de la boîte."""
+    rng = random.Random(42)
+    points = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(500)]
+    index = MortonIndex(points)
+
+    for start in range(0, 500, 25):
+        sx, sy = points[start]
+        box = (sx - 10.0, sy - 5.0, sx + 7.0, sy + 12.0)
+
+        assert set(index.query(start, *box)) == _brute_force(points, start, *box)
+
+
+def test_morton_remove():
+    """Vérifie qu'un sommet retiré n'est plus renvoyé par les requêtes."""
+    points = [(0.0, 0.0), (1.0, 1.0), (2.0, 2.0), (3.0, 3.0)]
+    index = MortonIndex(points)
+
+    index.remove(2)
+
+    assert set(index.query(0, 0.0, 0.0, 3.0, 3.0)) == {1, 3}
+
+
+def test_morton_points_confondus():
+    """Vérifie l'index sur une boîte englobante de taille nulle."""
+    points = [(5.0, 5.0), (5.0, 5.0), (5.0, 5.0)]
+    index = MortonIndex(points)
+
+    assert set(index.query(1, 5.0, 5.0, 5.0, 5.0)) == {0, 2}
@@ -0,0 +1,66 @@
+"""Tests Unitaires pour le stockage disque des triangulations."""
+
+import os
+import time
+
+import pytest
+from triangulator.store import TriangulationStore
+
+
+def test_store_aller_retour(tmp_path):
+    """Vérifie l'écriture puis la relecture (mmap) d'un résultat."""
+    store = TriangulationStore(str(tmp_path), 1024)
+
+    store.put("abc", [b"0123", b"456789"], "convex")
+    stored = store.get("abc")
+
+    assert stored is not None
+    assert stored.path == "convex"
+    assert len(stored) == 10
+    assert b"".join(stored.iter_chunks(chunk_size=3)) == b"0123456789"
+    assert store.get("absent") is None
+
+
+def test_store_ecriture_atomique(tmp_path):
+    """Vérifie qu'aucun fichier temporaire ne subsiste, même après échec."""
+    store = TriangulationStore(str(tmp_path), 1024)
+
+    def morceaux():
+        yield b"debut"
+        raise RuntimeError("calcul interrompu")
+
+    store.put("ok", [b"data"])
+    with pytest.raises(RuntimeError):
+        store.put("ko", morceaux())
+
+    assert sorted(os.listdir(tmp_path)) == ["ok.tri"]
+
+
+def test_store_eviction_par_taille(tmp_path):
+    """Vérifie l'éviction des fichiers les moins récemment lus."""
+    store = TriangulationStore(str(tmp_path), 25)
+    store.put("a", [b"x" * 10])
+    store.put("b", [b"y" * 10])
+    # "a" est relu : "b" devient le plus ancien
+    past = time.time() - 60
+    os.utime(tmp_path / "b.tri", (past, past))
+    store.get("a").close()
+
+    store.put("c", [b"z" * 10])
+
+    assert store.get("b") is None
+    assert store.get("a") is not None
+    assert store.get("c") is not None
+    assert store.current_bytes <= 25
+
+
+def test_store_persistant(tmp_path):
+    """Vérifie qu'une nouvelle instance retrouve les résultats existants."""
+    TriangulationStore(str(tmp_path), 1024).put("abc", [b"data"], "sweep")
+    (tmp_path / "interrompu.tmp").write_bytes(b"...")
+
+    store = TriangulationStore(str(tmp_path), 1024)
+
+    assert store.current_bytes == os.path.getsize(tmp_path / "abc.tri")
+    assert not (tmp_path / "interrompu.tmp").exists()
+    assert b"".join(store.get("abc").iter_chunks()) == b"data"
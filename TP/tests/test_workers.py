@@ -0,0 +1,115 @@
+"""Tests Unitaires pour le pool de calcul des triangulations."""
+
+import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from triangulator import workers
+from triangulator.geometry import Mesh
+from triangulator.workers import (
+    ComputePool,
+    PoolSaturatedError,
+    triangulate_compact,
+)
+
+# Carré (4 sommets distincts) et le même avec un doublon consécutif
+CARRE = Mesh(array("f", [0.0, 0.0, 1.0, 0.0, 1.0, 1.0, 0.0, 1.0]))
+CARRE_DOUBLON = Mesh(
+    array("f", [0.0, 0.0, 1.0, 0.0, 1.0, 0.0, 1.0, 1.0, 0.0, 1.0])
+)
+
+
+def test_triangulate_compact_sans_doublon():
+    """Vérifie que les sommets inchangés ne sont pas renvoyés."""
+    vertices, indices, path = triangulate_compact(CARRE, "polygon", 1000)
+
+    assert vertices is None
+    assert isinstance(indices, array)
+    assert len(indices) == 6  # 2 triangles
+    assert path is not None
+
+
+def test_triangulate_compact_avec_doublon():
+    """Vérifie que les sommets dédoublonnés sont renvoyés à plat."""
+    vertices, indices, _ = triangulate_compact(CARRE_DOUBLON, "polygon", 1000)
+
+    assert vertices.tolist() == CARRE.vertices.tolist()
+    assert len(indices) == 6
+
+
+def test_pool_processus_meme_resultat():
+    """Vérifie qu'un calcul fait dans un processus donne le même résultat."""
+    pool = ComputePool(workers=1, max_pending=2)
+    try:
+        result = pool.triangulate(CARRE_DOUBLON, "polygon", 1000)
+    finally:
+        pool.shutdown()
+
+    vertices, indices, path = triangulate_compact(
+        CARRE_DOUBLON, "polygon", 1000
+    )
+    assert result == (Mesh(vertices, indices), path)
+
+
+def test_pool_reprend_les_sommets_inchanges():
+    """Vérifie que le résultat partage le tableau de sommets de l'entrée."""
+    pool = ComputePool(workers=0, max_pending=1)
+
+    mesh, _ = pool.triangulate(CARRE, "polygon", 1000)
+
+    assert mesh.vertices is CARRE.vertices
+    assert mesh.triangle_count == 2
+
+
+def test_pool_sature_refuse_immediatement(monkeypatch):
+    """Vérifie le refus immédiat au-delà de max_pending, puis la reprise."""
+    release = threading.Event()
+    started = threading.Event()
+    compute = workers.triangulate_compact
+
+    def blocked(*args):
+        started.set()
+        release.wait(5)
+        return compute(*args)
+
+    monkeypatch.setattr(workers, "triangulate_compact", blocked)
+    pool = ComputePool(workers=0, max_pending=1)
+
+    with ThreadPoolExecutor(1) as executor:
+        first = executor.submit(pool.triangulate, CARRE, "polygon", 1000)
+        assert started.wait(5)
+        with pytest.raises(PoolSaturatedError):
+            pool.triangulate(CARRE, "polygon", 1000)
+        release.set()
+        assert first.result()[0].triangle_count == 2
+
+    # La place est libérée une fois le calcul terminé
+    assert pool.triangulate(CARRE, "polygon", 1000)[0].triangle_count == 2
+
+
+def test_pool_sans_limite(monkeypatch):
+    """Vérifie que max_pending=0 n'impose aucune limite (pas de refus)."""
+    release = threading.Event()
+    started = threading.Barrier(3)
+    compute = workers.triangulate_compact
+
+    def blocked(*args):
+        if threading.current_thread() is not threading.main_thread():
+            started.wait(5)
+            release.wait(5)
+        return compute(*args)
+
+    monkeypatch.setattr(workers, "triangulate_compact", blocked)
+    pool = ComputePool(workers=0, max_pending=0)
+
+    with ThreadPoolExecutor(2) as executor:
+        futures = [
+            executor.submit(pool.triangulate, CARRE, "polygon", 1000)
+            for _ in range(2)
+        ]
+        started.wait(5)
+        # Deux calculs en cours : un troisième est encore accepté
+        assert pool.triangulate(CARRE, "polygon", 1000)[0].triangle_count == 2
+        release.set()
+        assert all(f.result()[0].triangle_count == 2 for f in futures)
@@ -0,0 +1,168 @@
+"""Module Admission - Contrôle d'admission d'après la taille des PointSets.
+
+Le nombre de points est le premier champ d'un PointSet (4 bytes) : le
+coût d'une triangulation peut donc être estimé avant de télécharger ou de
+calculer quoi que ce soit. Une requête trop coûteuse pour une réponse
+synchrone est redirigée vers les tâches asynchrones ; au-delà de la limite
+absolue, elle est refusée.
+
+La limite synchrone est déduite du délai de la requête (`sync_cost_limit`) :
+un calcul admis doit pouvoir se terminer avant l'échéance, sans quoi il
+vaut mieux le confier à une tâche que répondre 504. De même, la limite
+absolue tient compte du délai des tâches, s'il est fixé.
+"""
+
+import math
+
+from . import core
+
+# Limite absolue par défaut, en unités de coût (voir `estimate_cost`) :
+# environ 40 millions de points en O(n log n), 110 000 sommets si l'Ear
+# Clipping est possible
+DEFAULT_MAX_COST = 1e9
+
+# Durée d'une unité de coût, en secondes. Mesuré : 1,8 à 2 µs (Delaunay
+# sur 100 000 points, coût 1,7e6, en ~3 s ; balayage sur 20 000 sommets),
+# avec une marge de 25 %. Voir tests/test_performance.py
+SECONDS_PER_COST = 2.5e-6
+
+# Coût de l'Ear Clipping par n², en unités. Pire cas mesuré : un nuage de
+# points traité comme un anneau (sommets presque tous rentrants), de 100 à
+# 155 ns par n², soit 0,04 à 0,06 unité ; avec une marge de 25 %
+EAR_CLIPPING_COST = 0.08
+
+# Part du délai d'une requête synchrone réservée au calcul, le reste
+# allant à la récupération, au décodage et à la sérialisation
+SYNC_TIMEOUT_SHARE = 0.5
+
+
+class AdmissionError(Exception):
+    """Requête refusée par le contrôle d'admission."""
+
+    def __init__(self, count: int, cost: float, limit: float) -> None:
+        """Enregistre le nombre de points, le coût estimé et la limite."""
+        super().__init__(
+            f"{count} points (coût estimé {cost:.3g}, limite {limit:.3g})."
+        )
+        self.count = count
+        self.cost = cost
+        self.limit = limit
+
+
+class TooExpensiveError(AdmissionError):
+    """Coût au-delà de la limite absolue : la requête est refusée."""
+
+    pass
+
+
+class AsyncRequiredError(AdmissionError):
+    """Coût au-delà de la limite synchrone : passer par une tâche."""
+
+    pass
+
+
+def sync_cost_limit(timeout: float) -> float:
+    """Renvoie le coût maximal calculable dans un délai de timeout secondes.
+
+    Args:
+        timeout: Le temps (restant) de la requête ou de la tâche, en
+            secondes.
+
+    Returns:
+        Le coût dont la durée estimée (`SECONDS_PER_COST` par unité) tient
+        dans la part `SYNC_TIMEOUT_SHARE` de ce délai.
+
+    """
+    return max(timeout, 0.0) * SYNC_TIMEOUT_SHARE / SECONDS_PER_COST
+
+
+def estimate_cost(count: int, engine: str,
+                  sweep_threshold: int = core.SWEEP_THRESHOLD) -> float:
+    """Renvoie le coût estimé (pire cas) d'une triangulation.
+
+    Seul le moteur "delaunay" est en O(n log n) quelle que soit l'entrée.
+    Les moteurs "polygon" et "sweep" finissent en Ear Clipping,
+    quadratique, dès que le balayage échoue (polygone non simple, nuage
+    de points) : ce qui ne se sait qu'une fois le calcul commencé. Leur
+    coût est donc celui de l'Ear Clipping, plus celui du balayage tenté
+    d'abord (moteur "sweep", ou au-delà de `sweep_threshold` sommets).
+
+    Args:
+        count: Le nombre de points annoncé par le header du PointSet.
+        engine: Le moteur de triangulation.
+        sweep_threshold: Voir `core.compute_triangulation`.
+
+    Returns:
+        Une estimation du nombre d'opérations élémentaires.
+
+    """
+    n = max(count, 2)
+    sweep = n * math.log2(n)
+    if engine == core.ENGINE_DELAUNAY:
+        return sweep
+    cost = EAR_CLIPPING_COST * n * n
+    if engine == core.ENGINE_SWEEP or count > sweep_threshold:
+        cost += sweep
+    return cost
+
+
+class AdmissionPolicy:
+    """Limites de coût, synchrone et absolue (0 pour désactiver une limite)."""
+
+    def __init__(self, sync_max_cost: float = 0,
+                 max_cost: float = DEFAULT_MAX_COST,
+                 async_timeout: float = 0) -> None:
+        """Crée la politique.
+
+        Args:
+            sync_max_cost: Coût maximal d'une réponse synchrone, en plus
+                de la limite déduite de son délai ; 0 (par défaut) pour
+                ne garder que cette dernière.
+            max_cost: Coût maximal d'un calcul, même asynchrone.
+            async_timeout: Délai d'une tâche asynchrone, en secondes : un
+                calcul qui n'y tiendrait pas (`sync_cost_limit`) est
+                refusé comme au-delà de max_cost ; 0 pour l'ignorer.
+
+        """
+        self.sync_max_cost = sync_max_cost
+        self.max_cost = max_cost
+        self.async_timeout = async_timeout
+
+    @property
+    def absolute_limit(self) -> float:
+        """Coût maximal d'un calcul, même asynchrone (0 si aucune limite)."""
+        limits = [self.max_cost] if self.max_cost else []
+        if self.async_timeout > 0:
+            limits.append(sync_cost_limit(self.async_timeout))
+        return min(limits, default=0)
+
+    def check(self, count: int, engine: str, sweep_threshold: int,
+              sync: bool = True, timeout: float | None = None) -> None:
+        """Vérifie qu'une triangulation de count points est admise.
+
+        Args:
+            count: Le nombre de points annoncé par le header du PointSet.
+            engine: Le moteur de triangulation.
+            sweep_threshold: Voir `core.compute_triangulation`.
+            sync: True pour une réponse synchrone (limite synchrone).
+            timeout: Le temps restant à la requête synchrone, en secondes,
+                ou None si elle n'a pas d'échéance.
+
+        Raises:
+            TooExpensiveError: Si son coût dépasse `max_cost`, ou ne tient
+                pas dans `async_timeout`.
+            AsyncRequiredError: Si sync et son coût dépasse `sync_max_cost`
+                ou `sync_cost_limit(timeout)`.
+
+        """
+        cost = estimate_cost(count, engine, sweep_threshold)
+        limit = self.absolute_limit
+        if limit and cost > limit:
+            raise TooExpensiveError(count, cost, limit)
+        if not sync:
+            return
+        limits = [self.sync_max_cost] if self.sync_max_cost else []
+        if timeout is not None:
+            limits.append(sync_cost_limit(timeout))
+        if limits and cost > min(limits):
+            raise AsyncRequiredError(count, cost, min(limits))
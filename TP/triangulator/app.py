@@ -5,13 +5,34 @@ Il définit l'endpoint HTTP /triangulation/{pointSetId} et
 orchestre les appels aux autres modules (client, core, binary_utils).
 """
 
+import hashlib
+import json
 import os
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from urllib.error import HTTPError, URLError
 from uuid import UUID
 
-from flask import Flask, Response, jsonify
+from flask import Flask, Response, g, has_request_context, jsonify, request
 
-from . import binary_utils, core, manager_client
+from . import (
+    admission,
+    binary_utils,
+    cache,
+    core,
+    jobs,
+    manager_client,
+    metrics,
+    profiling,
+    singleflight,
+    store,
+    workers,
+)
+from .deadline import Deadline, DeadlineExceeded
+from .geometry import Mesh
 
 # Création de l'application Flask
 app = Flask(__name__)
@@ -22,74 +43,952 @@ POINT_SET_MANAGER_URL = os.environ.get(
     "POINT_SET_MANAGER_URL", "http://localhost:8080"
 )
 
+# Pool de connexions persistantes vers le PointSetManager (keep-alive),
+# partagé par toutes les requêtes
+MANAGER_POOL = manager_client.ConnectionPool(
+    size=int(os.environ.get(
+        "MANAGER_POOL_SIZE", manager_client.DEFAULT_POOL_SIZE
+    )),
+    idle_timeout=float(os.environ.get(
+        "MANAGER_POOL_IDLE_TIMEOUT", manager_client.DEFAULT_IDLE_TIMEOUT
+    )),
+)
+
+# Cache des PointSets déjà récupérés (immuables une fois enregistrés),
+# borné en octets : 64 Mo par défaut, 0 pour le désactiver
+POINTSET_CACHE = cache.ByteLRUCache(
+    int(os.environ.get("POINTSET_CACHE_BYTES", 64 * 1024 * 1024))
+)
+
+# Cache des réponses 'Triangles' déjà sérialisées, par PointSet et options
+# de calcul : 128 Mo par défaut, 0 pour le désactiver
+RESULT_CACHE = cache.ByteLRUCache(
+    int(os.environ.get("RESULT_CACHE_BYTES", 128 * 1024 * 1024))
+)
+
+# Stockage disque optionnel des réponses sérialisées, qui survit aux
+# redémarrages : activé si TRIANGULATION_STORE_DIR est défini (1 Go max
+# par défaut)
+TRIANGULATION_STORE = (
+    store.TriangulationStore(
+        os.environ["TRIANGULATION_STORE_DIR"],
+        int(os.environ.get("TRIANGULATION_STORE_BYTES", 1024 ** 3)),
+    )
+    if os.environ.get("TRIANGULATION_STORE_DIR") else None
+)
+
+# Calculs en cours, partagés entre requêtes concurrentes identiques
+FLIGHTS = singleflight.SingleFlight()
+
+# Nombre de sommets au-delà duquel un polygone non monotone passe par la
+# décomposition monotone par balayage plutôt que par l'Ear Clipping
+SWEEP_THRESHOLD = int(os.environ.get("SWEEP_THRESHOLD", core.SWEEP_THRESHOLD))
+
+# Pool de processus pour les calculs de triangulation : TRIANGULATOR_WORKERS
+# processus (0 par défaut : calcul sur le thread de la requête). Au-delà de
+# TRIANGULATOR_MAX_PENDING calculs en cours ou en attente (0 : sans limite),
+# les nouvelles requêtes reçoivent aussitôt un 503 avec Retry-After
+COMPUTE_POOL = workers.ComputePool(
+    workers=int(os.environ.get("TRIANGULATOR_WORKERS", 0)),
+    max_pending=int(os.environ.get("TRIANGULATOR_MAX_PENDING", 64)),
+)
+
+# Délai (en secondes) suggéré aux clients refusés par saturation
+RETRY_AFTER_SECONDS = int(os.environ.get("RETRY_AFTER_SECONDS", 1))
+
+# Tâches de triangulation asynchrones (POST /triangulation/{id}/jobs),
+# exécutées par JOB_WORKERS threads et conservées JOB_TTL secondes. Une
+# tâche est abandonnée (TIMEOUT) après JOB_TIMEOUT secondes de calcul
+# (une heure par défaut, 0 pour aucune limite). Au-delà
+# de JOB_MAX_PENDING tâches non terminées (0 : sans limite), les nouvelles
+# reçoivent un 503 avec Retry-After ; une tâche non terminée pour le même
+# résultat est reprise plutôt que dupliquée
+JOB_TIMEOUT = float(os.environ.get("JOB_TIMEOUT", 3600))
+JOBS = jobs.JobManager(
+    workers=int(os.environ.get("JOB_WORKERS", jobs.DEFAULT_WORKERS)),
+    ttl=float(os.environ.get("JOB_TTL", jobs.DEFAULT_TTL)),
+    max_pending=int(os.environ.get("JOB_MAX_PENDING", jobs.DEFAULT_MAX_PENDING)),
+)
+# Résultats des tâches terminées, par ETag, en attente de GET /jobs/{id}/result :
+# 256 Mo par défaut. Un résultat évincé (ou lu sur disque) est relu depuis
+# les caches, ou recalculé comme pour GET /triangulation/{id}
+JOB_RESULTS = cache.ByteLRUCache(
+    int(os.environ.get("JOB_RESULT_BYTES", 256 * 1024 * 1024))
+)
+
+# Contrôle d'admission d'après le nombre de points (header du PointSet) :
+# un calcul qui ne tiendrait pas dans le délai de la requête (voir
+# `admission.sync_cost_limit`), ou au-delà de ADMISSION_SYNC_MAX_COST si
+# cette limite est fixée, fait rediriger GET /triangulation/{id} vers une
+# tâche asynchrone ; au-delà de ADMISSION_MAX_COST, ou s'il ne tiendrait
+# pas dans JOB_TIMEOUT, la requête est refusée (413). Voir
+# `admission.estimate_cost` ; 0 désactive une limite
+ADMISSION = admission.AdmissionPolicy(
+    sync_max_cost=float(os.environ.get("ADMISSION_SYNC_MAX_COST", 0)),
+    max_cost=float(os.environ.get(
+        "ADMISSION_MAX_COST", admission.DEFAULT_MAX_COST
+    )),
+    async_timeout=JOB_TIMEOUT,
+)
+
+# Triangulation par lots (POST /triangulation/batch) : nombre maximal
+# d'identifiants par requête, et de PointSets traités en parallèle (les
+# calculs ne s'exécutent sur plusieurs cœurs qu'avec TRIANGULATOR_WORKERS > 0)
+MAX_BATCH_SIZE = int(os.environ.get("MAX_BATCH_SIZE", 1000))
+BATCH_WORKERS = int(os.environ.get("BATCH_WORKERS", 16))
+
+# Taille maximale d'un PointSet envoyé directement (POST /triangulation),
+# en octets : 64 Mo par défaut
+MAX_UPLOAD_BYTES = int(os.environ.get("MAX_UPLOAD_BYTES", 64 * 1024 * 1024))
+
+# Taille de réponse au-delà de laquelle le résultat est sérialisé en flux
+# (par tranches, en Transfer-Encoding: chunked) plutôt qu'en un seul bloc :
+# 16 Mo par défaut
+STREAM_THRESHOLD_BYTES = int(
+    os.environ.get("STREAM_THRESHOLD_BYTES", 16 * 1024 * 1024)
+)
+
+# Délai d'une requête synchrone, en secondes, partagé par la récupération,
+# le décodage, le calcul et la sérialisation (0 pour désactiver). Le client
+# peut le choisir avec l'en-tête X-Request-Timeout, dans la limite de
+# MAX_REQUEST_TIMEOUT ; les tâches asynchrones n'en ont pas
+REQUEST_TIMEOUT = float(os.environ.get("REQUEST_TIMEOUT", 30))
+MAX_REQUEST_TIMEOUT = float(os.environ.get("MAX_REQUEST_TIMEOUT", 120))
+TIMEOUT_HEADER = "X-Request-Timeout"
+
+# Métriques exposées par GET /metrics : durée de chaque étape du pipeline
+# et de la requête entière, erreurs par code, accès aux caches et volumes
+FETCH_SECONDS = metrics.REGISTRY.histogram(
+    "triangulator_fetch_seconds",
+    "Durée de l'appel au PointSetManager (décodage incrémental compris).",
+)
+DECODE_SECONDS = metrics.REGISTRY.histogram(
+    "triangulator_decode_seconds",
+    "Durée du décodage d'un PointSet en cache, ou envoyé directement "
+    "(réception comprise).",
+)
+COMPUTE_SECONDS = metrics.REGISTRY.histogram(
+    "triangulator_compute_seconds",
+    "Durée du calcul de la triangulation (attente du pool comprise).",
+)
+SERIALIZE_SECONDS = metrics.REGISTRY.histogram(
+    "triangulator_serialize_seconds",
+    "Durée de la sérialisation du résultat (hors envoi en flux).",
+)
+REQUEST_SECONDS = metrics.REGISTRY.histogram(
+    "triangulator_request_seconds",
+    "Durée d'une requête de triangulation (hors envoi du corps).",
+)
+ERRORS = metrics.REGISTRY.counter(
+    "triangulator_errors_total", "Erreurs du pipeline, par code.", label="code"
+)
+CACHE_HITS = metrics.REGISTRY.counter(
+    "triangulator_cache_hits_total",
+    "Lectures servies par un cache (pointset, result, store).",
+    label="cache",
+)
+INPUT_VERTICES = metrics.REGISTRY.counter(
+    "triangulator_input_vertices_total",
+    "Sommets en entrée des triangulations calculées.",
+)
+OUTPUT_TRIANGLES = metrics.REGISTRY.counter(
+    "triangulator_output_triangles_total",
+    "Triangles produits par les triangulations calculées.",
+)
+STORE_ERRORS = metrics.REGISTRY.counter(
+    "triangulator_store_errors_total",
+    "Résultats non écrits sur disque (disque plein, droits...), servis "
+    "quand même.",
+)
+# Requêtes dont la durée totale est mesurée (REQUEST_SECONDS) et détaillée
+# par étape dans l'en-tête Server-Timing de la réponse
+_TIMED_ENDPOINTS = frozenset({"get_triangulation", "post_triangulation"})
+
+# Profilage échantillonné (cProfile) des requêtes de triangulation, écrit
+# dans PROFILE_DIR (désactivé sans) : une requête sur PROFILE_EVERY (0 pour
+# aucune), plus celles qui portent l'en-tête X-Debug-Profile
+PROFILER = profiling.SamplingProfiler(
+    os.environ.get("PROFILE_DIR") or None,
+    int(os.environ.get("PROFILE_EVERY", 0)),
+)
+PROFILE_HEADER = "X-Debug-Profile"
+
+
+def _result_etag(point_set_id: UUID, engine: str, sweep_threshold: int) -> str:
+    """Renvoie l'ETag (fort) d'une triangulation.
+
+    Le résultat ne dépend que du PointSet (immuable), du moteur, de ses
+    options et de la version des algorithmes : l'ETag se déduit donc de
+    ces seules valeurs, sans avoir à calculer ni lire le résultat.
+    """
+    key = f"{point_set_id}|{engine}|{sweep_threshold}|{core.ALGORITHM_VERSION}"
+    return hashlib.sha256(key.encode()).hexdigest()[:32]
+
+
+def _triangles_response(chunks: Iterable[bytes], path: str | None,
+                        etag: str | None, length: int | None = None) -> Response:
+    """Construit la réponse 200 binaire (morceaux, taille, en-têtes).
+
+    `length` est obligatoire si `chunks` est un itérateur (lecture disque).
+    Sans `etag` (PointSet envoyé directement), pas d'en-tête ETag. Une
+    réponse sérialisée en flux est envoyée sans Content-Length, donc en
+    Transfer-Encoding: chunked.
+    """
+    response = Response(
+        chunks, status=200, mimetype="application/octet-stream"
+    )
+    if not isinstance(chunks, binary_utils.TrianglesStream):
+        if length is None:
+            length = _chunks_length(chunks)
+        response.headers["Content-Length"] = str(length)
+    # Chemin de calcul emprunté (convex, monotone, earclipping...)
+    if path is not None:
+        response.headers["X-Triangulation-Path"] = path
+    if etag is not None:
+        response.set_etag(etag)
+    return response
+
+
+def _invalid_engine(engine: str):
+    """Renvoie la réponse 400 si le moteur est inconnu, sinon None."""
+    if engine in core.ENGINES:
+        return None
+    return jsonify({
+        "code": "INVALID_ENGINE",
+        "message": f"Moteur inconnu: {engine}. "
+                   f"Valeurs possibles: {', '.join(core.ENGINES)}."
+    }), 400
+
+
+def _request_deadline() -> Deadline | None:
+    """Renvoie l'échéance de la requête courante (None si désactivée).
+
+    Raises:
+        ValueError: Si l'en-tête X-Request-Timeout n'est pas un nombre de
+            secondes strictement positif.
+
+    """
+    header = request.headers.get(TIMEOUT_HEADER)
+    if header is None:
+        return Deadline(REQUEST_TIMEOUT) if REQUEST_TIMEOUT > 0 else None
+    timeout = float(header)
+    if not timeout > 0:  # rejette aussi NaN
+        raise ValueError(header)
+    if MAX_REQUEST_TIMEOUT > 0:
+        timeout = min(timeout, MAX_REQUEST_TIMEOUT)
+    return Deadline(timeout)
+
+
+def _invalid_timeout():
+    """Renvoie la réponse 400 d'un en-tête X-Request-Timeout invalide."""
+    return jsonify({
+        "code": "INVALID_TIMEOUT",
+        "message": f"En-tête {TIMEOUT_HEADER} invalide: "
+                   f"{request.headers.get(TIMEOUT_HEADER)} (nombre de "
+                   "secondes strictement positif attendu)."
+    }), 400
+
+
+def _deadline_steps(on_step: Callable[[str], None] | None,
+                    deadline: Deadline | None) -> Callable[[str], None]:
+    """Renvoie le suivi d'étapes : vérifie l'échéance, puis appelle on_step."""
+    def step(name: str) -> None:
+        if deadline is not None:
+            deadline.check()
+        if on_step is not None:
+            on_step(name)
+    return step
+
+
+@app.before_request
+def _start_request_timer() -> None:
+    """Commence la mesure (et peut-être le profilage) d'une triangulation."""
+    if request.endpoint in _TIMED_ENDPOINTS:
+        g.request_start = time.perf_counter()
+        g.timings = metrics.start_timings()
+        g.profile = PROFILER.start(forced=PROFILE_HEADER in request.headers)
+
+
+@app.after_request
+def _observe_request_time(response: Response) -> Response:
+    """Enregistre la durée d'une triangulation et ajoute Server-Timing."""
+    start = g.get("request_start")
+    if start is not None:
+        total = time.perf_counter() - start
+        REQUEST_SECONDS.observe(total)
+        response.headers["Server-Timing"] = _server_timing(g.timings, total)
+    return response
+
+
+@app.teardown_request
+def _stop_request_timer(error: BaseException | None) -> None:
+    """Arrête le relevé des étapes, et le profilage de la requête."""
+    if g.get("request_start") is None:
+        return
+    metrics.stop_timings()
+    profile = g.get("profile")
+    if profile is not None:
+        name = str((request.view_args or {}).get("pointSetId", "upload"))
+        PROFILER.stop(profile, name, g.get("vertex_count"))
+
+
+def _server_timing(timings: dict[str, float], total: float) -> str:
+    """Renvoie l'en-tête Server-Timing : étapes puis total, en ms."""
+    stages = [*timings.items(), ("total", total)]
+    return ", ".join(
+        f"{name};dur={duration * 1000:.2f}" for name, duration in stages
+    )
+
+
+@app.route("/metrics", methods=["GET"])
+def get_metrics():
+    """Renvoie les métriques du service au format texte de Prometheus."""
+    return Response(metrics.REGISTRY.render(), content_type=metrics.CONTENT_TYPE)
+
+
 @app.route("/triangulation/<uuid:pointSetId>", methods=["GET"])
 def get_triangulation(pointSetId: UUID):
     """Endpoint principal pour demander une triangulation.
 
     Prend un UUID, contacte le PointSetManager, calcule la triangulation
     et renvoie le résultat binaire.
+
+    Le paramètre de requête optionnel `engine` choisit le moteur de
+    triangulation ("polygon" par défaut, "sweep" pour forcer la
+    décomposition monotone par balayage, ou "delaunay" pour un nuage
+    de points non ordonné).
+
+    Les réponses portent un ETag fort ; une requête dont l'en-tête
+    If-None-Match le contient reçoit un 304 sans aucun calcul ni appel
+    au PointSetManager. Les résultats déjà sérialisés sont resservis
+    depuis un cache mémoire.
+
+    Un PointSet trop coûteux pour une réponse synchrone (d'après son
+    nombre de points, lu avant le reste du téléchargement) est confié à
+    une tâche asynchrone : la réponse est alors celle de
+    POST /triangulation/{id}/jobs (202).
+
+    Le délai de la requête (REQUEST_TIMEOUT, ou l'en-tête
+    X-Request-Timeout) couvre toutes les étapes ; une fois écoulé, le
+    calcul est abandonné et la réponse est un 504.
+
+    L'en-tête de réponse Server-Timing donne la durée de chaque étape
+    exécutée pour cette requête (fetch, decode, compute, serialize) et le
+    total, en millisecondes.
     """
-    # Convertir l'UUID en string pour l'URL et les logs
-    point_set_id_str = str(pointSetId)
-    # print(f"Endpoint get_triangulation appelé avec l'ID: {point_set_id_str}")
-    
+    # print(f"Endpoint get_triangulation appelé avec l'ID: {pointSetId}")
+
+    # Valider le moteur avant tout appel réseau (Cas 400)
+    engine = request.args.get("engine", core.DEFAULT_ENGINE)
+    invalid = _invalid_engine(engine)
+    if invalid is not None:
+        return invalid
+    try:
+        deadline = _request_deadline()
+    except ValueError:
+        return _invalid_timeout()
+
+    # Le client a déjà ce résultat (Cas 304)
+    etag = _result_etag(pointSetId, engine, SWEEP_THRESHOLD)
+    if request.if_none_match.contains_weak(etag):
+        not_modified = Response(status=304)
+        not_modified.set_etag(etag)
+        return not_modified
+
+    return _triangulation_response(pointSetId, engine, etag, deadline)
+
+
+def _triangulation_response(pointSetId: UUID, engine: str, etag: str,
+                            deadline: Deadline | None):
+    """Renvoie le résultat (200), la tâche qui le calcule (202) ou l'erreur."""
     try:
-        # Étape 1: Appeler le PointSetManager pour récupérer les données binaires
-        pointset_bytes = manager_client.fetch_pointset_from_manager(
-            POINT_SET_MANAGER_URL, pointSetId
+        chunks, path, length = _load_result(
+            pointSetId, engine, etag, deadline=deadline
         )
+        return _triangles_response(chunks, path, etag, length=length)
+    except admission.AsyncRequiredError:
+        return _submit_job(pointSetId, engine)
+    except Exception as e:
+        return _error_response(e, str(pointSetId))
+
 
-        # Étape 2: Désérialiser les données binaires en liste de points
-        points = binary_utils.binary_to_pointset(pointset_bytes)
+@app.route("/triangulation", methods=["POST"])
+def post_triangulation():
+    """Triangule un PointSet envoyé directement dans le corps de la requête.
+
+    Évite l'aller-retour par le PointSetManager : le corps est un PointSet
+    binaire (application/octet-stream) d'au plus MAX_UPLOAD_BYTES octets,
+    décodé au fil de sa réception (voir `binary_utils.PointSetDecoder`). Le
+    paramètre `engine` et l'en-tête X-Request-Timeout sont les mêmes que
+    pour GET /triangulation/{id}. Le résultat n'est pas mis en cache.
+    """
+    engine = request.args.get("engine", core.DEFAULT_ENGINE)
+    invalid = _invalid_engine(engine)
+    if invalid is not None:
+        return invalid
+    try:
+        deadline = _request_deadline()
+    except ValueError:
+        return _invalid_timeout()
+
+    if request.mimetype != "application/octet-stream":
+        return jsonify({
+            "code": "UNSUPPORTED_MEDIA_TYPE",
+            "message": "Le corps doit être un PointSet binaire "
+                       "(application/octet-stream)."
+        }), 415
+
+    if (request.content_length or 0) > MAX_UPLOAD_BYTES:
+        return _upload_too_large()
+
+    try:
+        decoder = binary_utils.PointSetDecoder(
+            max_bytes=MAX_UPLOAD_BYTES,
+            admit=_admission_check(engine, deadline=deadline),
+        )
+        with DECODE_SECONDS.time("decode"):
+            mesh = Mesh(
+                decoder.readfrom(request.stream, request.content_length)
+            )
+        chunks, path = _triangulate_points(
+            decoder, mesh, engine,
+            _deadline_steps(None, deadline), deadline,
+        )
+        return _triangles_response(chunks, path, None)
+    except binary_utils.PointSetTooLargeError:
+        # Taille annoncée par le header : rejeté avant de lire les points
+        return _upload_too_large()
+    except binary_utils.BinaryFormatError as e:
+        # Données envoyées par le client lui-même : erreur du client
+        ERRORS.inc(label_value="INVALID_BINARY_DATA")
+        return jsonify({
+            "code": "INVALID_BINARY_DATA",
+            "message": f"PointSet binaire invalide: {e}"
+        }), 400
+    except Exception as e:
+        return _error_response(e, "(envoyé)")
 
-        # Étape 3: Calculer la triangulation
-        vertices, triangles = core.compute_triangulation(points)
 
-        # Étape 4: Sérialiser le résultat en format binaire 'Triangles'
-        response_bytes = binary_utils.triangles_to_binary(vertices, triangles)
+def _upload_too_large():
+    """Renvoie la réponse 413 d'un PointSet envoyé trop volumineux."""
+    ERRORS.inc(label_value="PAYLOAD_TOO_LARGE")
+    return jsonify({
+        "code": "PAYLOAD_TOO_LARGE",
+        "message": f"PointSet de plus de {MAX_UPLOAD_BYTES} octets."
+    }), 413
 
-        # Étape 5: Renvoyer la réponse avec le bon type MIME
-        return Response(response_bytes, status=200, mimetype="application/octet-stream")
 
-    except HTTPError as e:
+def _admission_check(engine: str, sync: bool = True,
+                     deadline: Deadline | None = None) -> Callable[[int], None]:
+    """Renvoie le contrôle d'admission à appliquer au nombre de points.
+
+    En synchrone, la limite dépend du temps restant à `deadline` au
+    moment du contrôle.
+    """
+    def check(count: int) -> None:
+        timeout = deadline.remaining() if deadline is not None else None
+        ADMISSION.check(count, engine, SWEEP_THRESHOLD, sync, timeout)
+
+    return check
+
+
+def _load_result(pointSetId: UUID, engine: str, etag: str,
+                 on_step: Callable[[str], None] | None = None,
+                 sync: bool = True, deadline: Deadline | None = None,
+                 ) -> tuple[Iterable[bytes], str | None, int]:
+    """Renvoie le résultat sérialisé : cache mémoire, disque, ou calcul.
+
+    Un calcul n'est lancé qu'après le contrôle d'admission (limite
+    synchrone si sync, sinon limite absolue seule). Les requêtes
+    identiques qui attendent un calcul en cours en partagent l'issue,
+    chacune jusqu'à sa propre échéance `deadline` : un calcul abandonné
+    ou refusé en synchrone à cause de l'échéance (plus courte) de la
+    requête qui l'a lancé est relancé pour celles qui ont encore du temps
+    (voir `SingleFlight.do`).
+
+    Returns:
+        Les morceaux de la réponse 'Triangles' (itérateur à usage unique
+        s'ils sont lus sur disque), le chemin de calcul et la taille.
+
+    Raises:
+        AdmissionError: Si le PointSet est trop coûteux.
+        DeadlineExceeded: Si `deadline` passe avant la fin du calcul.
+        Exception: Les erreurs de `_run_pipeline`.
+
+    """
+    # Résultat déjà calculé et sérialisé
+    result_key = (pointSetId, engine, SWEEP_THRESHOLD)
+    cached = RESULT_CACHE.get(result_key)
+    if cached is not None:
+        CACHE_HITS.inc(label_value="result")
+        chunks, path = cached
+        return chunks, path, _chunks_length(chunks)
+
+    # Résultat présent sur disque : servi depuis le fichier projeté
+    if TRIANGULATION_STORE is not None:
+        stored = TRIANGULATION_STORE.get(etag)
+        if stored is not None:
+            CACHE_HITS.inc(label_value="store")
+            return stored.iter_chunks(), stored.path, len(stored)
+
+    # Un seul calcul par résultat à la fois : les requêtes concurrentes
+    # identiques attendent celui en cours et en partagent l'issue (par
+    # mode : un refus synchrone ne doit pas atteindre une tâche)
+    chunks, path = FLIGHTS.do(
+        (result_key, sync),
+        lambda: _run_pipeline(
+            pointSetId, engine, etag, on_step,
+            _admission_check(engine, sync, deadline), deadline,
+        ),
+        deadline,
+        retry_on=(DeadlineExceeded, admission.AsyncRequiredError),
+    )
+    return chunks, path, _chunks_length(chunks)
+
+
+def _run_pipeline(pointSetId: UUID, engine: str, etag: str,
+                  on_step: Callable[[str], None] | None = None,
+                  admit: Callable[[int], None] | None = None,
+                  deadline: Deadline | None = None,
+                  ) -> tuple[Iterable[bytes], str | None]:
+    """Récupère, désérialise, triangule et sérialise un PointSet.
+
+    Le résultat est ajouté au cache mémoire (et au stockage disque s'il
+    est activé ; un échec d'écriture est compté dans STORE_ERRORS, sans
+    faire échouer la requête). `on_step`, s'il est donné, est appelé au début de chaque
+    étape avec son nom (voir `jobs.STEPS`). `admit`, s'il est donné, est
+    appelé avec le nombre de points dès la lecture du header. `deadline`,
+    si elle est donnée, est vérifiée au début de chaque étape, borne les
+    timeouts de l'appel au PointSetManager et interrompt le calcul.
+
+    Returns:
+        Les morceaux de la réponse 'Triangles' et le chemin de calcul.
+
+    Raises:
+        HTTPError, URLError: En cas d'échec de l'appel au PointSetManager.
+        BinaryFormatError: Si le PointSet reçu est mal formé.
+        PoolSaturatedError: Si le pool de calcul est saturé.
+        AdmissionError: Exception levée par `admit`.
+        DeadlineExceeded: Si l'échéance passe.
+
+    """
+    # Étape 1: Récupérer les données binaires, depuis le cache ou en
+    # appelant le PointSetManager
+    # (le PointSet reçu est décodé au fil de sa réception)
+    step = _deadline_steps(on_step, deadline)
+    step("fetch")
+    decoder = binary_utils.PointSetDecoder(admit=admit)
+    pointset_bytes = POINTSET_CACHE.get(pointSetId)
+    if pointset_bytes is not None:
+        CACHE_HITS.inc(label_value="pointset")
+    else:
+        try:
+            with FETCH_SECONDS.time("fetch"):
+                pointset_bytes = manager_client.fetch_pointset_from_manager(
+                    POINT_SET_MANAGER_URL, pointSetId, pool=MANAGER_POOL,
+                    decoder=decoder,
+                    timeout=(
+                        deadline.remaining() if deadline is not None else None
+                    ),
+                )
+        except URLError:
+            # Timeout du socket dû à l'échéance de la requête, et non à
+            # une panne du PointSetManager
+            if deadline is not None:
+                deadline.check()
+            raise
+        POINTSET_CACHE.put(pointSetId, pointset_bytes)
+
+    # Étape 2: Désérialiser les données binaires en un `Mesh` (lecture en
+    # bloc, sans tuple par point), sauf si c'est déjà fait pendant la
+    # réception
+    step("decode")
+    if decoder.coords is not None:
+        mesh = Mesh(decoder.coords)
+    else:
+        with DECODE_SECONDS.time("decode"):
+            mesh = binary_utils.binary_to_mesh(pointset_bytes)
+        # PointSet déjà en cache : contrôle d'admission avant le calcul
+        if admit is not None:
+            admit(mesh.vertex_count)
+
+    # Étapes 3 et 4: Trianguler et sérialiser
+    chunks, path = _triangulate_points(
+        pointset_bytes, mesh, engine, step, deadline
+    )
+
+    # Étape 5: Mettre le résultat en cache
+    RESULT_CACHE.put(
+        (pointSetId, engine, SWEEP_THRESHOLD), (chunks, path),
+        size=_chunks_length(chunks),
+    )
+    if TRIANGULATION_STORE is not None:
+        try:
+            TRIANGULATION_STORE.put(etag, chunks, path)
+        except OSError:
+            # Le disque n'est qu'un cache : le résultat calculé est
+            # renvoyé quand même
+            STORE_ERRORS.inc()
+    return chunks, path
+
+
+@app.route("/triangulation/<uuid:pointSetId>/jobs", methods=["POST"])
+def create_triangulation_job(pointSetId: UUID):
+    """Soumet une triangulation asynchrone et renvoie aussitôt son job.
+
+    Pour les PointSets dont le calcul dépasse le délai HTTP : la réponse
+    202 contient l'identifiant de la tâche, à suivre via GET /jobs/{id}.
+    Le paramètre `engine` est le même que pour GET /triangulation/{id}.
+    """
+    engine = request.args.get("engine", core.DEFAULT_ENGINE)
+    invalid = _invalid_engine(engine)
+    if invalid is not None:
+        return invalid
+    return _submit_job(pointSetId, engine)
+
+
+def _submit_job(pointSetId: UUID, engine: str):
+    """Crée une tâche de triangulation ; renvoie la réponse 202.
+
+    Une tâche non terminée pour le même résultat (même ETag) est renvoyée
+    telle quelle ; si trop de tâches sont en attente, la réponse est un 503.
+    """
+    etag = _result_etag(pointSetId, engine, SWEEP_THRESHOLD)
+
+    def compute(job: jobs.Job) -> str | None:
+        # Délai compté à partir du début du calcul, pas de la soumission
+        deadline = Deadline(JOB_TIMEOUT) if JOB_TIMEOUT > 0 else None
+        chunks, path, length = _load_result(
+            pointSetId, engine, etag, job.set_step, sync=False,
+            deadline=deadline,
+        )
+        # Résultat sur disque : relu depuis le fichier à la demande, sans
+        # copie en mémoire
+        if not isinstance(chunks, Iterator):
+            JOB_RESULTS.put(etag, (chunks, path), size=length)
+        return path
+
+    try:
+        job = JOBS.submit(pointSetId, engine, compute, key=etag)
+    except jobs.JobQueueFullError as e:
+        return _error_response(e, str(pointSetId))
+    response = jsonify(job.to_dict())
+    response.headers["Location"] = f"/jobs/{job.id}"
+    return response, 202
+
+
+@app.route("/jobs/<uuid:jobId>", methods=["GET"])
+def get_job(jobId: UUID):
+    """Renvoie l'état et l'avancement d'une tâche de triangulation.
+
+    Une tâche échouée porte l'erreur (code et message) qu'aurait
+    renvoyée GET /triangulation/{id}.
+    """
+    job = JOBS.get(jobId)
+    if job is None:
+        return _job_not_found(jobId)
+    body = job.to_dict()
+    if job.status == jobs.FAILED:
+        body["error"], _ = _error_payload(job.error, str(job.point_set_id))
+    return jsonify(body), 200
+
+
+@app.route("/jobs/<uuid:jobId>/result", methods=["GET"])
+def get_job_result(jobId: UUID):
+    """Renvoie le résultat binaire 'Triangles' d'une tâche terminée.
+
+    409 si la tâche n'est pas terminée ; si elle a échoué, l'erreur et le
+    statut qu'aurait renvoyés GET /triangulation/{id}. Un résultat qui
+    n'est plus en mémoire (voir JOB_RESULTS) est relu depuis les caches
+    ou le disque, ou recalculé : la réponse est alors celle de
+    GET /triangulation/{id}, 202 compris.
+    """
+    try:
+        deadline = _request_deadline()
+    except ValueError:
+        return _invalid_timeout()
+    job = JOBS.get(jobId)
+    if job is None:
+        return _job_not_found(jobId)
+    if job.status == jobs.FAILED:
+        payload, status = _error_payload(job.error, str(job.point_set_id))
+        return jsonify(payload), status
+    if job.status != jobs.DONE:
+        return jsonify({
+            "code": "JOB_NOT_FINISHED",
+            "message": f"Tâche {jobId} en cours ({job.status})."
+        }), 409
+    etag = _result_etag(job.point_set_id, job.engine, SWEEP_THRESHOLD)
+    kept = JOB_RESULTS.get(etag)
+    if kept is not None:
+        chunks, path = kept
+        return _triangles_response(chunks, path, etag)
+    return _triangulation_response(
+        job.point_set_id, job.engine, etag, deadline
+    )
+
+
+@app.route("/triangulation/batch", methods=["POST"])
+def batch_triangulation():
+    """Triangule une liste de PointSets en une seule requête.
+
+    Le corps est un tableau JSON d'UUID (au plus MAX_BATCH_SIZE). Les
+    PointSets sont récupérés et triangulés en parallèle (BATCH_WORKERS
+    à la fois), et les résultats sont renvoyés en flux, dans l'ordre de
+    la requête, au format binaire par lots (voir
+    `binary_utils.batch_frame_header`).
+
+    Les calculs passent par le pool de calcul (COMPUTE_POOL) : ils ne
+    sont répartis sur plusieurs cœurs que si TRIANGULATOR_WORKERS > 0.
+    Sans processus (par défaut), seules les récupérations se recouvrent ;
+    les calculs, en Python pur, s'exécutent l'un après l'autre sous le GIL.
+
+    Chaque élément porte son propre statut : 200 et les données
+    'Triangles', ou le statut et le corps d'erreur JSON qu'aurait
+    renvoyés GET /triangulation/{id}. Le délai de la requête vaut pour
+    le lot entier : les éléments encore en cours à l'échéance sont en 504.
+    """
+    engine = request.args.get("engine", core.DEFAULT_ENGINE)
+    invalid = _invalid_engine(engine)
+    if invalid is not None:
+        return invalid
+    try:
+        deadline = _request_deadline()
+    except ValueError:
+        return _invalid_timeout()
+
+    ids = request.get_json(silent=True)
+    try:
+        if (not isinstance(ids, list) or len(ids) > MAX_BATCH_SIZE
+                or not all(isinstance(i, str) for i in ids)):
+            raise ValueError
+        point_set_ids = [UUID(i) for i in ids]
+    except ValueError:
+        return jsonify({
+            "code": "INVALID_BATCH",
+            "message": "Le corps doit être un tableau JSON d'au plus "
+                       f"{MAX_BATCH_SIZE} UUID de PointSets."
+        }), 400
+
+    return Response(
+        _batch_frames(point_set_ids, engine, deadline),
+        status=200, mimetype="application/octet-stream",
+    )
+
+
+def _batch_item(pointSetId: UUID, engine: str, deadline: Deadline | None,
+                ) -> tuple[int, Iterable[bytes], int]:
+    """Traite un élément d'un lot : statut, morceaux et taille de sa réponse."""
+    etag = _result_etag(pointSetId, engine, SWEEP_THRESHOLD)
+    try:
+        chunks, _, length = _load_result(
+            pointSetId, engine, etag, deadline=deadline
+        )
+        return 200, chunks, length
+    except Exception as e:
+        payload, status = _error_payload(e, str(pointSetId))
+        ERRORS.inc(label_value=payload["code"])
+        body = json.dumps(payload).encode()
+        return status, [body], len(body)
+
+
+def _batch_frames(point_set_ids: list[UUID], engine: str,
+                  deadline: Deadline | None = None) -> Iterator[bytes]:
+    """Génère la réponse d'un lot, cadre par cadre, dans l'ordre.
+
+    Le nombre d'éléments d'abord, puis le cadre de chaque élément dès
+    que lui et ceux qui le précèdent sont prêts. Au plus
+    2 * BATCH_WORKERS éléments sont soumis d'avance : si le client se
+    déconnecte, les éléments pas encore commencés sont annulés, et le
+    générateur rend la main sans attendre ceux en cours.
+    """
+    yield binary_utils.batch_header(len(point_set_ids))
+    if not point_set_ids:
+        return
+    workers = min(BATCH_WORKERS, len(point_set_ids))
+    executor = ThreadPoolExecutor(workers)
+    try:
+        remaining = iter(point_set_ids)
+        pending = deque(
+            (point_set_id, executor.submit(
+                _batch_item, point_set_id, engine, deadline
+            ))
+            for point_set_id in islice(remaining, 2 * workers)
+        )
+        while pending:
+            point_set_id, future = pending.popleft()
+            status, chunks, length = future.result()
+            following = next(remaining, None)
+            if following is not None:
+                pending.append((following, executor.submit(
+                    _batch_item, following, engine, deadline
+                )))
+            yield binary_utils.batch_frame_header(point_set_id, status, length)
+            yield from chunks
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _job_not_found(job_id: UUID):
+    """Renvoie la réponse 404 d'une tâche inconnue ou expirée."""
+    return jsonify({
+        "code": "JOB_NOT_FOUND",
+        "message": f"Tâche {job_id} inconnue ou expirée."
+    }), 404
+
+
+def _chunks_length(chunks: Iterable[bytes]) -> int:
+    """Taille totale des morceaux d'une réponse (sans sérialiser un flux)."""
+    if isinstance(chunks, binary_utils.TrianglesStream):
+        return len(chunks)
+    return sum(map(len, chunks))
+
+
+def _triangulate_points(pointset_bytes: bytes | bytearray
+                        | binary_utils.PointSetDecoder,
+                        mesh: Mesh, engine: str,
+                        step: Callable[[str], None] = lambda name: None,
+                        deadline: Deadline | None = None,
+                        ) -> tuple[Iterable[bytes], str | None]:
+    """Triangule un PointSet désérialisé et sérialise le résultat.
+
+    Args:
+        pointset_bytes: Le PointSet binaire (repris pour la partie
+            Vertices), ou le `PointSetDecoder` qui l'a lu : il n'est alors
+            reconstitué que si la partie Vertices est reprise.
+        mesh: Ses sommets (voir `binary_utils.binary_to_mesh`).
+        engine: Le moteur de triangulation.
+        step: Appelé au début de chaque étape avec son nom.
+        deadline: Échéance de la requête, transmise au calcul.
+
+    Returns:
+        Les morceaux de la réponse 'Triangles' (liste de bytes, ou
+        `TrianglesStream` au-delà de STREAM_THRESHOLD_BYTES) et le chemin
+        de calcul.
+
+    """
+    # Calculer la triangulation dans le pool de calcul (`Mesh` en entrée
+    # comme en sortie)
+    step("triangulate")
+    with COMPUTE_SECONDS.time("compute"):
+        result, path = COMPUTE_POOL.triangulate(
+            mesh, engine, SWEEP_THRESHOLD, deadline
+        )
+    INPUT_VERTICES.inc(mesh.vertex_count)
+    if has_request_context():
+        # Nom du fichier de profilage de la requête (voir PROFILER)
+        g.vertex_count = mesh.vertex_count
+    OUTPUT_TRIANGLES.inc(result.triangle_count)
+
+    # Sérialiser le résultat en format binaire 'Triangles'
+    step("serialize")
+    with SERIALIZE_SECONDS.time("serialize"):
+        size = binary_utils.triangles_binary_size(
+            result.vertex_count, result.triangle_count
+        )
+        if size > STREAM_THRESHOLD_BYTES:
+            # Grande réponse : seule la géométrie compacte est gardée, les
+            # bytes sont produits par tranches au moment de l'envoi
+            chunks = binary_utils.TrianglesStream(
+                result.vertices, result.triangles
+            )
+        elif result.vertices is mesh.vertices:
+            # Aucun doublon retiré : la partie Vertices est octet pour
+            # octet celle du PointSet reçu, seuls les indices sont encodés
+            if isinstance(pointset_bytes, binary_utils.PointSetDecoder):
+                pointset_bytes = pointset_bytes.data
+            chunks = [
+                binary_utils.vertices_section(
+                    pointset_bytes, mesh.vertex_count
+                ),
+                binary_utils.triangles_section_to_binary(result.triangles),
+            ]
+        else:
+            chunks = [binary_utils.mesh_to_binary(result)]
+    return chunks, path
+
+
+def _error_response(e: Exception, point_set_id_str: str):
+    """Renvoie la réponse d'erreur JSON d'une exception du pipeline."""
+    payload, status = _error_payload(e, point_set_id_str)
+    ERRORS.inc(label_value=payload["code"])
+    response = jsonify(payload)
+    if isinstance(e, (workers.PoolSaturatedError, jobs.JobQueueFullError)):
+        response.headers["Retry-After"] = str(RETRY_AFTER_SECONDS)
+    return response, status
+
+
+def _error_payload(e: Exception, point_set_id_str: str) -> tuple[dict, int]:
+    """Traduit une exception du pipeline en corps d'erreur JSON et statut."""
+    if isinstance(e, HTTPError):
         # Gestion des erreurs renvoyées par le PointSetManager (404, 500, 503...)
         if e.code == 404:
-            return jsonify({
+            return {
                 "code": "POINTSET_NOT_FOUND",
                 "message": f"PointSet {point_set_id_str} non trouvé."
-            }), 404
+            }, 404
         elif e.code == 503:
-            return jsonify({
+            return {
                 "code": "MANAGER_ERROR",
                 "message": "Le PointSetManager est indisponible."
-            }), 503
+            }, 503
         else:
             # Autres erreurs HTTP (500 du manager, etc.) traitées comme erreur manager
-            return jsonify({
+            return {
                 "code": "MANAGER_ERROR",
                 "message": f"Erreur du PointSetManager: {e.reason}"
-            }), 503
+            }, 503
 
-    except URLError as e:
+    if isinstance(e, URLError):
         # Gestion des pannes de connexion (Manager éteint, DNS, timeout, etc.)
-        return jsonify({
+        return {
             "code": "MANAGER_UNAVAILABLE",
             "message": f"Impossible de contacter le PointSetManager: {e.reason}"
-        }), 503
+        }, 503
 
-    except binary_utils.BinaryFormatError as e:
+    if isinstance(e, (workers.PoolSaturatedError, jobs.JobQueueFullError)):
+        # Trop de calculs en cours : le client doit réessayer plus tard
+        return {
+            "code": "OVERLOADED",
+            "message": f"Service saturé, réessayer plus tard: {e}"
+        }, 503
+
+    if isinstance(e, DeadlineExceeded):
+        # Délai de la requête écoulé : calcul abandonné
+        return {
+            "code": "TIMEOUT",
+            "message": f"Triangulation du PointSet {point_set_id_str} "
+                       f"abandonnée: {e}"
+        }, 504
+
+    if isinstance(e, admission.TooExpensiveError):
+        return {
+            "code": "POINTSET_TOO_LARGE",
+            "message": f"PointSet {point_set_id_str} trop coûteux: {e}"
+        }, 413
+
+    if isinstance(e, admission.AsyncRequiredError):
+        # Seulement pour les lots et les envois directs : GET passe par
+        # une tâche asynchrone
+        return {
+            "code": "ASYNC_REQUIRED",
+            "message": f"PointSet {point_set_id_str} trop coûteux pour une "
+                       f"réponse synchrone, utiliser "
+                       f"POST /triangulation/{{id}}/jobs: {e}"
+        }, 413
+
+    if isinstance(e, binary_utils.BinaryFormatError):
         # Gestion des données corrompues reçues du Manager (Cas 500)
-        return jsonify({
+        return {
             "code": "INVALID_BINARY_DATA",
             "message": f"Données binaires reçues invalides: {e}"
-        }), 500
+        }, 500
 
-    except Exception as e:
-        # Gestion générique des erreurs internes (ex: bug dans l'algo core.py)
-        return jsonify({
-            "code": "INTERNAL_ERROR",
-            "message": f"Erreur interne inattendue: {e}"
-        }), 500
+    # Gestion générique des erreurs internes (ex: bug dans l'algo core.py)
+    return {
+        "code": "INTERNAL_ERROR",
+        "message": f"Erreur interne inattendue: {e}"
+    }, 500
 
 # Point d'entrée pour lancer le serveur en mode debug
 if __name__ == "__main__":
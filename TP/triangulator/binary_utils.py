@@ -1,81 +1,261 @@
 """Module Utilitaires Binaires - (Dé)Sérialisation.
 
-Ce module gère la conversion entre les objets Python (listes de points)
-et la représentation binaire compacte définie dans les spécifications.
+Ce module gère la conversion entre les objets Python (`Mesh`, ou listes
+de points) et la représentation binaire compacte définie dans les
+spécifications.
 """
 
 import struct
+import sys
+from array import array
+from collections.abc import Callable, Iterator
+from itertools import chain, islice
+from uuid import UUID
 
-# Type hints
-Point = tuple[float, float]
-Triangle = tuple[int, int, int]
+from .geometry import INDEX_TYPECODE, Mesh, Point, Triangle
+
+# Le format binaire est big-endian : les tableaux natifs doivent être
+# retournés octet par octet sur les machines little-endian
+_NATIVE_IS_NETWORK = sys.byteorder == "big"
+
+# En-tête de comptage (N ou T) : unsigned int 32 bits big-endian
+_COUNT = struct.Struct("!I")
+
+# En-tête d'un élément de lot : UUID (16 bytes), statut HTTP (unsigned
+# short) et taille des données (unsigned int), big-endian
+_FRAME = struct.Struct("!16sHI")
+
+# Taille des tranches produites par la sérialisation en flux
+CHUNK_SIZE = 256 * 1024
 
 class BinaryFormatError(Exception):
     """Exception personnalisée pour les erreurs de parsing binaire."""
 
     pass
 
-def binary_to_pointset(data: bytes) -> list[Point]:
-    """Désérialise un PointSet binaire en une liste de points.
+class PointSetTooLargeError(BinaryFormatError):
+    """Le PointSet annoncé par son header dépasse la taille autorisée."""
 
-    Format d'entrée:
-    - 4 bytes (unsigned long): Nombre de points (N)
-    - N * 8 bytes:
-        - 4 bytes (float): Coordonnée X
-        - 4 bytes (float): Coordonnée Y
+    pass
+
+def binary_to_coords(data: bytes | bytearray | memoryview) -> array:
+    """Désérialise un PointSet binaire en un tableau plat de coordonnées.
+
+    Les coordonnées sont lues en une seule opération sur une `memoryview`
+    du buffer (aucune tranche intermédiaire, aucun tuple par point) puis
+    remises dans l'ordre natif des octets.
 
     Args:
         data: Les données binaires brutes reçues du PointSetManager.
 
     Returns:
-        Une liste de tuples (x, y).
+        Un `array('f')` [x0, y0, x1, y1, ...] de 2 * N flottants.
 
     Raises:
         BinaryFormatError: Si les données sont mal formées ou incomplètes.
 
     """
+    view = memoryview(data)
+
     # 1. Vérifier la taille minimale pour le header (4 bytes)
-    if len(data) < 4:
+    if len(view) < 4:
         raise BinaryFormatError(
             "Données trop courtes pour contenir le nombre de points."
         )
 
     # 2. Lire le nombre de points (N)
     # '!I' = Network (Big-Endian), unsigned int
-    try:
-        count = struct.unpack("!I", data[:4])[0]
-    except struct.error as e:
-        raise BinaryFormatError(
-            f"Erreur lors de la lecture du header: {e}"
-        ) from e
+    count = _COUNT.unpack_from(view)[0]
 
     # 3. Vérifier la taille totale attendue
     # Chaque point fait 8 bytes (4 bytes float X + 4 bytes float Y)
     expected_size = 4 + (count * 8)
-    if len(data) < expected_size:
+    if len(view) < expected_size:
         raise BinaryFormatError(
             f"Données incomplètes. Attendu: {expected_size} bytes, "
-            f"Reçu: {len(data)} bytes."
+            f"Reçu: {len(view)} bytes."
         )
 
-    # 4. Lire les points
-    points: list[Point] = []
-    offset = 4
-    for _ in range(count):
-        # '!ff' = 2 floats (X, Y)
-        try:
-            x, y = struct.unpack("!ff", data[offset : offset + 8])
-            points.append((x, y))
-            offset += 8
-        except struct.error as e:
+    # 4. Lire tous les points d'un bloc
+    coords = array("f")
+    coords.frombytes(view[4:expected_size])
+    if not _NATIVE_IS_NETWORK:
+        coords.byteswap()
+    return coords
+
+
+class PointSetDecoder:
+    """Décodeur incrémental d'un PointSet lu depuis un flux (réponse HTTP).
+
+    Le header est lu d'abord : il donne la taille exacte du PointSet. Le
+    reste est lu par `readinto` dans un tampon de `chunk_size` octets, et
+    chaque tranche reçue est aussitôt décodée à la suite de `coords` :
+    téléchargement et décodage se chevauchent, et un PointSet tronqué est
+    rejeté dès que c'est détectable (Content-Length trop court pour le
+    nombre de points annoncé, ou fin de flux prématurée). Rien n'est
+    alloué d'après le header seul, qui n'est pas fiable : la mémoire
+    grandit avec les octets effectivement reçus.
+
+    Après `readfrom`, `coords` contient les coordonnées à plat, comme
+    `binary_to_coords` (les octets surnuméraires éventuels ne sont pas
+    consommés). Le PointSet binaire lui-même n'est pas gardé pendant la
+    lecture : `data` le reconstitue à la demande.
+    """
+
+    def __init__(self, max_bytes: int | None = None,
+                 chunk_size: int = CHUNK_SIZE,
+                 admit: Callable[[int], None] | None = None) -> None:
+        """Crée un décodeur.
+
+        Args:
+            max_bytes: Taille maximale acceptée du PointSet, ou None.
+            chunk_size: Taille maximale d'une lecture (multiple de 4).
+            admit: Appelé avec le nombre de points dès la lecture du
+                header, avant tout le reste ; peut lever une exception
+                pour abandonner la lecture (contrôle d'admission).
+
+        """
+        self.max_bytes = max_bytes
+        self.admit = admit
+        self.chunk_size = chunk_size
+        self.coords: array | None = None
+        self._data: bytes | None = None
+
+    @property
+    def data(self) -> bytes | None:
+        """Le PointSet binaire lu (None avant `readfrom`).
+
+        Reconstitué une fois, à la première demande, depuis `coords` (les
+        octets des flottants sont recopiés tels quels, sans conversion) :
+        un `bytes` de la taille exacte du PointSet.
+        """
+        if self._data is None and self.coords is not None:
+            swapped = self.coords
+            if not _NATIVE_IS_NETWORK:
+                swapped = array("f", self.coords)
+                swapped.byteswap()
+            self._data = b"".join(
+                (_COUNT.pack(len(self.coords) // 2), swapped)
+            )
+        return self._data
+
+    def readfrom(self, stream, content_length: int | None = None) -> array:
+        """Lit et décode un PointSet depuis stream (méthode `readinto`).
+
+        Args:
+            stream: Le flux à lire (réponse HTTP, corps de requête...).
+            content_length: Taille annoncée du flux, si elle est connue.
+
+        Returns:
+            Les coordonnées [x0, y0, x1, y1, ...] (array('f')).
+
+        Raises:
+            PointSetTooLargeError: Si le header annonce plus de max_bytes.
+            BinaryFormatError: Si le flux est plus court qu'annoncé.
+
+        """
+        header = bytearray(4)
+        if _readinto_exact(stream, memoryview(header)) < 4:
             raise BinaryFormatError(
-                f"Erreur lors de la lecture d'un point: {e}"
-            ) from e
+                "Données trop courtes pour contenir le nombre de points."
+            )
+        count = _COUNT.unpack(header)[0]
+        if self.admit is not None:
+            self.admit(count)
+        size = 4 + 8 * count
+        if self.max_bytes is not None and size > self.max_bytes:
+            raise PointSetTooLargeError(
+                f"PointSet de {size} bytes (maximum: {self.max_bytes})."
+            )
+        if content_length is not None and content_length < size:
+            raise BinaryFormatError(
+                f"Données incomplètes. Attendu: {size} bytes, "
+                f"Annoncé: {content_length} bytes."
+            )
+
+        self.coords = array("f")
+        self._data = None
+        buffer = bytearray(min(self.chunk_size, size - 4))
+        view = memoryview(buffer)
+        filled = 4
+        # Octets d'un flottant incomplet, gardés en tête du tampon
+        pending = 0
+        while filled < size:
+            read = stream.readinto(
+                view[pending:min(len(buffer), pending + size - filled)]
+            )
+            if not read:
+                raise BinaryFormatError(
+                    f"Données incomplètes. Attendu: {size} bytes, "
+                    f"Reçu: {filled} bytes."
+                )
+            filled += read
+            # Décode les flottants complets reçus par cette lecture
+            end = pending + read
+            pending = end % 4
+            self._decode(view[:end - pending])
+            buffer[:pending] = buffer[end - pending:end]
+        return self.coords
+
+    def _decode(self, piece: memoryview) -> None:
+        # Ajoute les flottants big-endian de piece à la suite de coords
+        if not piece:
+            return
+        values = array("f")
+        values.frombytes(piece)
+        if not _NATIVE_IS_NETWORK:
+            values.byteswap()
+        self.coords.extend(values)
+
+
+def _readinto_exact(stream, view: memoryview) -> int:
+    """Remplit view depuis stream ; renvoie le nombre d'octets lus."""
+    filled = 0
+    while filled < len(view):
+        read = stream.readinto(view[filled:])
+        if not read:
+            break
+        filled += read
+    return filled
+
+
+def binary_to_mesh(data: bytes | bytearray | memoryview) -> Mesh:
+    """Désérialise un PointSet binaire en un `Mesh` (sans triangles).
+
+    Voir `binary_to_coords` : les coordonnées sont lues en bloc, et le
+    tableau est repris tel quel par le `Mesh`.
+
+    Raises:
+        BinaryFormatError: Si les données sont mal formées ou incomplètes.
+
+    """
+    return Mesh(binary_to_coords(data))
+
+
+def binary_to_pointset(data: bytes) -> list[Point]:
+    """Désérialise un PointSet binaire en une liste de points.
 
-    return points
+    Format d'entrée:
+    - 4 bytes (unsigned long): Nombre de points (N)
+    - N * 8 bytes:
+        - 4 bytes (float): Coordonnée X
+        - 4 bytes (float): Coordonnée Y
 
+    Args:
+        data: Les données binaires brutes reçues du PointSetManager.
 
-def triangles_to_binary(vertices: list[Point], triangles: list[Triangle]) -> bytes:
+    Returns:
+        Une liste de tuples (x, y).
+
+    Raises:
+        BinaryFormatError: Si les données sont mal formées ou incomplètes.
+
+    """
+    return binary_to_mesh(data).points()
+
+
+def triangles_to_binary(vertices: list[Point] | array,
+                        triangles: list[Triangle] | array) -> bytes:
     """Sérialise une liste de vertices et de triangles en 'Triangles' binaire.
 
     Format de sortie:
@@ -86,31 +266,269 @@ def triangles_to_binary(vertices: list[Point], triangles: list[Triangle]) -> byt
     - 4 bytes (unsigned long): Nombre de triangles (T)
     - T * 12 bytes: (unsigned long I1, unsigned long I2, unsigned long I3)
 
+    La taille exacte est calculée d'avance : les deux parties sont écrites
+    en bloc (tableaux `array` retournés en big-endian) dans un unique
+    `bytearray` préalloué, sans objet intermédiaire par élément.
+
     Args:
-        vertices: La liste des points (vertices).
-        triangles: La liste des triangles (tuples d'indices).
+        vertices: La liste des points (vertices), ou un tableau plat
+            [x0, y0, x1, y1, ...] (voir `binary_to_coords`).
+        triangles: La liste des triangles (tuples d'indices), ou un
+            tableau plat d'indices [i0, j0, k0, i1, ...].
 
     Returns:
         Les données binaires brutes à envoyer au client.
 
     """
-    chunks = []
+    if isinstance(vertices, array):
+        vertex_count = len(vertices) // 2
+        coords = vertices if vertices.typecode == "f" else array("f", vertices)
+    else:
+        vertex_count = len(vertices)
+        coords = array("f", chain.from_iterable(vertices))
+    if not _NATIVE_IS_NETWORK:
+        if coords is vertices:
+            coords = array("f", coords)  # ne pas modifier l'appelant
+        coords.byteswap()
+
+    triangles_offset = 4 + 8 * vertex_count
+    buffer = bytearray(triangles_offset + 4 + 12 * _triangle_count(triangles))
 
     # --- Partie 1 : Vertices ---
-    # Nombre de points
-    chunks.append(struct.pack("!I", len(vertices)))
-    
-    # Points
-    for x, y in vertices:
-        chunks.append(struct.pack("!ff", x, y))
+    _COUNT.pack_into(buffer, 0, vertex_count)
+    memoryview(buffer)[4:triangles_offset] = memoryview(coords).cast("B")
 
     # --- Partie 2 : Triangles ---
-    # Nombre de triangles
-    chunks.append(struct.pack("!I", len(triangles)))
-    
-    # Triangles (3 indices par triangle)
-    for i1, i2, i3 in triangles:
-        # '!III' = 3 unsigned ints
-        chunks.append(struct.pack("!III", i1, i2, i3))
-
-    return b"".join(chunks)
\ No newline at end of file
+    _write_triangles(buffer, triangles_offset, triangles)
+
+    # Les serveurs WSGI n'acceptent que des `bytes` (pas de bytearray)
+    return bytes(buffer)
+
+
+def mesh_to_binary(mesh: Mesh) -> bytes:
+    """Sérialise un `Mesh` en 'Triangles' binaire (voir `triangles_to_binary`)."""
+    return triangles_to_binary(mesh.vertices, mesh.triangles)
+
+
+def triangles_section_to_binary(triangles: list[Triangle] | array) -> bytes:
+    """Sérialise la seule partie 2 (Triangles) du format 'Triangles'.
+
+    La partie 1 étant identique au format PointSet, l'appelant peut la
+    reprendre telle quelle (voir `vertices_section`) et n'encoder que
+    les indices.
+
+    Args:
+        triangles: La liste des triangles (tuples d'indices), ou un
+            tableau plat d'indices.
+
+    Returns:
+        Le compte T suivi des T * 12 bytes d'indices.
+
+    """
+    buffer = bytearray(4 + 12 * _triangle_count(triangles))
+    _write_triangles(buffer, 0, triangles)
+    return bytes(buffer)
+
+
+def triangles_binary_size(vertex_count: int, triangle_count: int) -> int:
+    """Renvoie la taille exacte, en bytes, d'une réponse 'Triangles'."""
+    return 4 + 8 * vertex_count + 4 + 12 * triangle_count
+
+
+def iter_triangles_binary(vertices: list[Point] | array,
+                          triangles: list[Triangle] | array,
+                          chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Sérialise en flux, par tranches, le même contenu que `triangles_to_binary`.
+
+    Les comptes N et T étant connus d'avance, la réponse est produite au
+    fil de l'eau : seule une tranche de `chunk_size` bytes (et sa portion
+    de tableau) existe à la fois, jamais la réponse entière.
+
+    Args:
+        vertices: Les vertices (liste de points ou tableau plat).
+        triangles: Les triangles (liste de tuples ou tableau plat).
+        chunk_size: Taille de chaque tranche (la dernière peut être plus
+            courte), multiple de 4.
+
+    Yields:
+        Les tranches de la réponse, dans l'ordre.
+
+    """
+    if isinstance(vertices, array):
+        vertex_count = len(vertices) // 2
+        coords = vertices
+    else:
+        vertex_count = len(vertices)
+        coords = chain.from_iterable(vertices)
+    if isinstance(triangles, array):
+        indices = triangles
+    else:
+        indices = chain.from_iterable(triangles)
+
+    # Chaque tranche est faite de valeurs entières de 4 bytes (comptes,
+    # flottants, indices) : on les encode par paquets de chunk_size / 4
+    per_chunk = chunk_size // 4
+    buffer = bytearray()
+    for part in chain(
+        (_COUNT.pack(vertex_count),),
+        _iter_packed(coords, "f", per_chunk),
+        (_COUNT.pack(_triangle_count(triangles)),),
+        _iter_packed(indices, INDEX_TYPECODE, per_chunk),
+    ):
+        buffer += part
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer[:chunk_size])
+            del buffer[:chunk_size]
+    if buffer:
+        yield bytes(buffer)
+
+
+def _iter_packed(values, typecode: str, per_chunk: int) -> Iterator[memoryview]:
+    """Encode des valeurs en big-endian, par paquets de per_chunk valeurs."""
+    if isinstance(values, array):
+        slices = (values[i:i + per_chunk]
+                  for i in range(0, len(values), per_chunk))
+    else:
+        values = iter(values)
+        slices = iter(
+            lambda: array(typecode, islice(values, per_chunk)), array(typecode)
+        )
+    for piece in slices:
+        if piece.typecode != typecode:
+            piece = array(typecode, piece)
+        if not _NATIVE_IS_NETWORK:
+            piece.byteswap()
+        yield memoryview(piece).cast("B")
+
+
+class TrianglesStream:
+    """Réponse 'Triangles' sérialisée à la demande (voir `iter_triangles_binary`).
+
+    Garde la géométrie compacte et produit une nouvelle série de tranches
+    à chaque itération : elle peut être servie plusieurs fois (cache,
+    requêtes regroupées) sans jamais exister entière sous forme de bytes.
+    """
+
+    __slots__ = ("vertices", "triangles", "chunk_size", "_size")
+
+    def __init__(self, vertices: list[Point] | array,
+                 triangles: list[Triangle] | array,
+                 chunk_size: int = CHUNK_SIZE) -> None:
+        """Enregistre la géométrie à sérialiser."""
+        self.vertices = vertices
+        self.triangles = triangles
+        self.chunk_size = chunk_size
+        vertex_count = (len(vertices) // 2 if isinstance(vertices, array)
+                        else len(vertices))
+        self._size = triangles_binary_size(
+            vertex_count, _triangle_count(triangles)
+        )
+
+    def __len__(self) -> int:
+        """Taille totale de la réponse, en bytes."""
+        return self._size
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Produit les tranches de la réponse."""
+        return iter_triangles_binary(
+            self.vertices, self.triangles, self.chunk_size
+        )
+
+
+def vertices_section(data: bytes | bytearray | memoryview,
+                     count: int) -> bytes:
+    """Renvoie la partie 1 (Vertices) prise telle quelle dans un PointSet.
+
+    Les octets ne sont jamais réencodés. Ils ne sont pas copiés non plus
+    si `data` est un `bytes` sans octets surnuméraires (PointSet reçu en
+    bloc, ou `PointSetDecoder.data`) ; sinon, la partie est recopiée d'un
+    bloc : le corps d'une réponse WSGI doit être fait de `bytes`, une vue
+    sur un tampon ne conviendrait pas.
+
+    Args:
+        data: Les données binaires du PointSet (déjà validées).
+        count: Le nombre de points annoncé par son header.
+
+    Returns:
+        Les 4 + count * 8 premiers bytes.
+
+    """
+    size = 4 + 8 * count
+    if len(data) == size and isinstance(data, bytes):
+        return data
+    return bytes(memoryview(data)[:size])
+
+
+def _triangle_count(triangles: list[Triangle] | array) -> int:
+    """Nombre de triangles d'une liste de tuples ou d'un tableau plat."""
+    if isinstance(triangles, array):
+        return len(triangles) // 3
+    return len(triangles)
+
+
+def _write_triangles(buffer: bytearray, offset: int,
+                     triangles: list[Triangle] | array) -> None:
+    """Écrit le compte puis les indices des triangles à partir d'offset."""
+    count = _triangle_count(triangles)
+    if isinstance(triangles, array):
+        # Copie en bloc (l'appelant garde son tableau dans l'ordre natif)
+        indices = array(INDEX_TYPECODE, triangles)
+    else:
+        indices = array(INDEX_TYPECODE, chain.from_iterable(triangles))
+    if not _NATIVE_IS_NETWORK:
+        indices.byteswap()
+    _COUNT.pack_into(buffer, offset, count)
+    memoryview(buffer)[offset + 4:offset + 4 + 12 * count] = (
+        memoryview(indices).cast("B")
+    )
+
+
+def batch_header(count: int) -> bytes:
+    """Sérialise l'en-tête d'une réponse par lots (nombre d'éléments).
+
+    Format d'une réponse par lots:
+    - 4 bytes (unsigned long): Nombre d'éléments (B)
+    - B éléments, chacun composé de:
+      - 16 bytes: UUID du PointSet
+      - 2 bytes (unsigned short): Statut HTTP de l'élément
+      - 4 bytes (unsigned long): Taille L des données
+      - L bytes: 'Triangles' si le statut est 200, sinon l'erreur JSON
+    """
+    return _COUNT.pack(count)
+
+
+def batch_frame_header(point_set_id: UUID, status: int, length: int) -> bytes:
+    """Sérialise l'en-tête d'un élément de lot (voir `batch_header`)."""
+    return _FRAME.pack(point_set_id.bytes, status, length)
+
+
+def binary_to_batch(data: bytes) -> list[tuple[UUID, int, bytes]]:
+    """Désérialise une réponse par lots (voir `batch_header`).
+
+    Args:
+        data: La réponse complète.
+
+    Returns:
+        La liste des éléments (UUID, statut, données), dans l'ordre.
+
+    Raises:
+        BinaryFormatError: Si la réponse est tronquée ou trop longue.
+
+    """
+    if len(data) < 4:
+        raise BinaryFormatError("Données trop courtes pour lire le header.")
+    (count,) = _COUNT.unpack_from(data, 0)
+    items = []
+    offset = 4
+    for _ in range(count):
+        if len(data) < offset + _FRAME.size:
+            raise BinaryFormatError("Élément de lot tronqué.")
+        raw_id, status, length = _FRAME.unpack_from(data, offset)
+        offset += _FRAME.size
+        if len(data) < offset + length:
+            raise BinaryFormatError("Données d'élément de lot tronquées.")
+        items.append((UUID(bytes=raw_id), status, bytes(data[offset:offset + length])))
+        offset += length
+    if offset != len(data):
+        raise BinaryFormatError("Octets surnuméraires après le dernier élément.")
+    return items
\ No newline at end of file
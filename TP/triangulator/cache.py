@@ -0,0 +1,96 @@
+"""Module Cache - Cache LRU borné en octets.
+
+Les PointSets sont identifiés par un UUID et ne changent plus une fois
+enregistrés par le PointSetManager : leur contenu binaire peut donc être
+gardé en mémoire et resservi sans nouvel appel réseau. Le cache est borné
+par la taille totale des valeurs (en octets) plutôt que par un nombre
+d'entrées, les PointSets pouvant aller de quelques octets à plusieurs Mo.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class ByteLRUCache:
+    """Cache LRU thread-safe dont la taille est bornée en octets.
+
+    Chaque valeur compte pour `len(valeur)` octets (bytes ou équivalent),
+    ou pour la taille explicite donnée à `put`.
+    À l'insertion, les entrées les moins récemment utilisées sont évincées
+    jusqu'à repasser sous `max_bytes` ; une valeur plus grande que le
+    budget entier n'est pas mise en cache.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """Crée un cache vide de `max_bytes` octets au plus (0 = désactivé)."""
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """Renvoie la valeur associée à key (et la marque récente), ou None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, size: int | None = None) -> None:
+        """Insère ou remplace une valeur, en évinçant les plus anciennes.
+
+        Args:
+            key: La clé (hashable).
+            value: La valeur à garder.
+            size: Sa taille en octets ; par défaut `len(value)`.
+
+        """
+        if size is None:
+            size = len(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= previous[1]
+            while self.current_bytes + size > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+            self._entries[key] = (value, size)
+            self.current_bytes += size
+
+    def clear(self) -> None:
+        """Vide le cache et remet les compteurs à zéro."""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        """Renvoie les compteurs (hits, misses, evictions) et l'occupation."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def __len__(self) -> int:
+        """Nombre d'entrées en cache."""
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Présence d'une clé, sans effet sur l'ordre LRU ni les compteurs."""
+        return key in self._entries
@@ -2,15 +2,81 @@
 
 Ce module contient l'algorithme de triangulation principal utilisant
 la méthode Ear Clipping, qui fonctionne pour les polygones convexes et concaves.
+Un second moteur (Delaunay, module `delaunay`) traite l'entrée comme un
+nuage de points non ordonné.
+
+Les prédicats géométriques existent en deux versions : une version
+scalaire en Python pur, et une version vectorisée (NumPy) qui traite
+des tableaux entiers en une seule opération. La seconde est utilisée
+automatiquement si NumPy est installé et que les tableaux sont assez
+grands pour amortir la conversion.
 """
 
-# Type hints pour la clarté
-Point = tuple[float, float]
-Triangle = tuple[int, int, int]
+import bisect
+from array import array
+from collections.abc import Iterable, Sequence
+from itertools import chain
+from typing import Any
+
+from .deadline import CHECK_EVERY, Deadline
+from .delaunay import delaunay_triangulation
+from .geometry import COORD_TYPECODE, INDEX_TYPECODE, Mesh, Point, Triangle
+from .spatial_index import MortonIndex
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel : repli sur le Python pur
+    np = None
 
 # Tolérance pour les comparaisons flottantes
 EPSILON = 1e-9
 
+# Au-delà de ce nombre de sommets (et de sommets réflexes), le test de
+# contenance des oreilles passe par l'index spatial de Morton
+SPATIAL_INDEX_THRESHOLD = 80
+
+# En dessous de ce nombre d'éléments, la boucle Python est plus rapide
+# que la conversion vers NumPy
+VECTORIZE_THRESHOLD = 64
+
+# Moteurs de triangulation disponibles :
+# - "polygon" : les points sont les sommets ordonnés d'un polygone simple
+# - "sweep" : idem, forcé sur la décomposition monotone par balayage
+# - "delaunay" : les points forment un nuage non ordonné
+ENGINE_POLYGON = "polygon"
+ENGINE_SWEEP = "sweep"
+ENGINE_DELAUNAY = "delaunay"
+ENGINES = (ENGINE_POLYGON, ENGINE_SWEEP, ENGINE_DELAUNAY)
+DEFAULT_ENGINE = ENGINE_POLYGON
+
+# Version des algorithmes de triangulation : à incrémenter à chaque
+# modification qui change les triangles produits pour une même entrée
+# (elle entre dans l'ETag des réponses mises en cache)
+ALGORITHM_VERSION = 2
+
+# Au-delà de ce nombre de sommets, le moteur "polygon" préfère la
+# décomposition monotone par balayage (O(n log n)) à l'Ear Clipping.
+# Mesuré : le balayage est ~2x plus rapide dès 1000 sommets (étoiles,
+# peignes) ; en dessous, les deux restent sous quelques millisecondes.
+SWEEP_THRESHOLD = 1000
+
+# Chemins de calcul effectivement empruntés (rapportés à l'appelant)
+PATH_DEGENERATE = "degenerate"
+PATH_CONVEX = "convex"
+PATH_MONOTONE = "monotone"
+PATH_EAR_CLIPPING = "earclipping"
+PATH_SWEEP = "sweep"
+PATH_DELAUNAY = "delaunay"
+PATHS = (PATH_DEGENERATE, PATH_CONVEX, PATH_MONOTONE,
+         PATH_EAR_CLIPPING, PATH_SWEEP, PATH_DELAUNAY)
+
+# Types de sommets pour le balayage (décomposition monotone)
+_SWEEP_REGULAR = 0
+_SWEEP_START = 1
+_SWEEP_END = 2
+_SWEEP_SPLIT = 3
+_SWEEP_MERGE = 4
+
 
 def _cross_product_2d(o: Point, a: Point, b: Point) -> float:
     """Compute the 2D cross product (OA x OB).
@@ -24,6 +90,26 @@ def _cross_product_2d(o: Point, a: Point, b: Point) -> float:
     return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
 
 
+def _use_numpy(size: int) -> bool:
+    """Vérifie si le chemin vectorisé est disponible et rentable."""
+    return np is not None and size >= VECTORIZE_THRESHOLD
+
+
+def _as_array(vertices: Sequence[Point] | Any) -> Any:
+    """Convertit les sommets en tableau NumPy (n, 2), sans copie si possible."""
+    if isinstance(vertices, np.ndarray):
+        return vertices
+    if isinstance(vertices, array):
+        # Tableau plat [x0, y0, ...] : lecture directe du buffer
+        return np.frombuffer(
+            vertices, dtype=vertices.typecode
+        ).astype(np.float64).reshape(-1, 2)
+    # fromiter sur la liste aplatie est ~2x plus rapide que np.array(list)
+    return np.fromiter(
+        chain.from_iterable(vertices), dtype=np.float64, count=2 * len(vertices)
+    ).reshape(-1, 2)
+
+
 def _is_collinear(p1: Point, p2: Point, p3: Point) -> bool:
     """Vérifie si 3 points sont alignés en calculant l'aire du triangle formé.
 
@@ -32,6 +118,27 @@ def _is_collinear(p1: Point, p2: Point, p3: Point) -> bool:
     return abs(_cross_product_2d(p1, p2, p3)) < EPSILON
 
 
+def _all_collinear(points: Sequence[Point]) -> bool:
+    """Vérifie si tous les points sont alignés avec les deux premiers.
+
+    Version vectorisée : un seul produit vectoriel sur tout le tableau.
+    """
+    n = len(points)
+    if n < 3:
+        return True
+
+    if _use_numpy(n):
+        coords = _as_array(points)
+        cross = _cross_product_2d(
+            coords[0], coords[1], (coords[2:, 0], coords[2:, 1])
+        )
+        return bool(np.all(np.abs(cross) < EPSILON))
+
+    return all(
+        _is_collinear(points[0], points[1], points[i]) for i in range(2, n)
+    )
+
+
 def _polygon_area_signed(vertices: list[Point]) -> float:
     """Compute the signed area of a polygon using the shoelace formula.
 
@@ -43,6 +150,11 @@ def _polygon_area_signed(vertices: list[Point]) -> float:
     n = len(vertices)
     if n < 3:
         return 0.0
+    if _use_numpy(n):
+        coords = _as_array(vertices)
+        x = coords[:, 0]
+        y = coords[:, 1]
+        return float(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y)) / 2.0
     area = 0.0
     for i in range(n):
         j = (i + 1) % n
@@ -67,6 +179,23 @@ def _is_point_in_triangle(p: Point, t1: Point, t2: Point, t3: Point) -> bool:
     return not (has_neg and has_pos)
 
 
+def _any_point_in_triangle(coords: Any, t1: Point, t2: Point,
+                           t3: Point) -> bool:
+    """Version vectorisée de `_is_point_in_triangle` sur un tableau (k, 2).
+
+    Renvoie True si au moins un des points est dans le triangle.
+    """
+    p = (coords[:, 0], coords[:, 1])
+    d1 = _cross_product_2d(p, t1, t2)
+    d2 = _cross_product_2d(p, t2, t3)
+    d3 = _cross_product_2d(p, t3, t1)
+
+    has_neg = (d1 < -EPSILON) | (d2 < -EPSILON) | (d3 < -EPSILON)
+    has_pos = (d1 > EPSILON) | (d2 > EPSILON) | (d3 > EPSILON)
+
+    return bool(np.any(~(has_neg & has_pos)))
+
+
 def _is_convex_vertex(prev_pt: Point, curr_pt: Point, next_pt: Point,
                       clockwise: bool) -> bool:
     """Vérifie si le sommet courant forme un angle convexe.
@@ -84,147 +213,771 @@ def _is_convex_vertex(prev_pt: Point, curr_pt: Point, next_pt: Point,
     return cross > EPSILON  # Convexe si virage à gauche
 
 
-def _is_ear(polygon_indices: list[int], vertices: list[Point],
-            idx: int, clockwise: bool) -> bool:
-    """Vérifie si le sommet à l'index idx est une "oreille" du polygone.
+def _convex_flags(vertices: Sequence[Point], clockwise: bool) -> list[bool]:
+    """Classe tous les sommets du polygone (convexe ou non) en une passe.
+
+    Version vectorisée : les voisins sont obtenus par décalage circulaire.
+    """
+    n = len(vertices)
+    if _use_numpy(n):
+        coords = _as_array(vertices)
+        prev_c = np.roll(coords, 1, axis=0)
+        next_c = np.roll(coords, -1, axis=0)
+        cross = _cross_product_2d(
+            (prev_c[:, 0], prev_c[:, 1]),
+            (coords[:, 0], coords[:, 1]),
+            (next_c[:, 0], next_c[:, 1]),
+        )
+        flags = cross < -EPSILON if clockwise else cross > EPSILON
+        return flags.tolist()
+
+    return [
+        _is_convex_vertex(vertices[i - 1], vertices[i],
+                          vertices[(i + 1) % n], clockwise)
+        for i in range(n)
+    ]
+
+
+def _is_ear(vertices: list[Point], prev: list[int], nxt: list[int],
+            reflex: set[int], idx: int, clockwise: bool,
+            index: MortonIndex | None = None,
+            coords: Any = None) -> bool:
+    """Vérifie si le sommet idx est une "oreille" du polygone chaîné.
 
     Une oreille est un triangle formé par 3 sommets consécutifs qui:
     1. Forme un angle convexe
     2. Ne contient aucun autre sommet du polygone
 
-    """
-    n = len(polygon_indices)
-    if n < 3:
-        return False
+    Seuls les sommets réflexes (non convexes) peuvent se trouver dans une
+    oreille candidate : le test de contenance ne parcourt donc que `reflex`.
+    Si un index spatial est fourni et que les sommets réflexes sont
+    nombreux, seuls ceux de la boîte englobante de l'oreille sont testés.
+    Si le tableau NumPy des sommets est fourni et que les candidats sont
+    nombreux, ils sont testés en une seule opération vectorisée.
 
-    # Indices dans la liste polygon_indices
-    prev_idx = (idx - 1) % n
-    next_idx = (idx + 1) % n
+    """
+    prev_idx = prev[idx]
+    next_idx = nxt[idx]
 
     # Points réels
-    prev_pt = vertices[polygon_indices[prev_idx]]
-    curr_pt = vertices[polygon_indices[idx]]
-    next_pt = vertices[polygon_indices[next_idx]]
+    prev_pt = vertices[prev_idx]
+    curr_pt = vertices[idx]
+    next_pt = vertices[next_idx]
 
     # 1. Vérifier que c'est un sommet convexe
     if not _is_convex_vertex(prev_pt, curr_pt, next_pt, clockwise):
         return False
 
-    # 2. Vérifier qu'aucun autre sommet n'est dans le triangle
-    for i, vi in enumerate(polygon_indices):
-        if i in (prev_idx, idx, next_idx):
+    # 2. Vérifier qu'aucun sommet réflexe n'est dans le triangle
+    candidates: Iterable[int] = reflex
+    if index is not None and len(reflex) > SPATIAL_INDEX_THRESHOLD:
+        candidates = (
+            vi for vi in index.query(
+                idx,
+                min(prev_pt[0], curr_pt[0], next_pt[0]) - EPSILON,
+                min(prev_pt[1], curr_pt[1], next_pt[1]) - EPSILON,
+                max(prev_pt[0], curr_pt[0], next_pt[0]) + EPSILON,
+                max(prev_pt[1], curr_pt[1], next_pt[1]) + EPSILON,
+            )
+            if vi in reflex
+        )
+
+    if coords is not None:
+        candidates = [vi for vi in candidates if vi not in (prev_idx, next_idx)]
+        if len(candidates) >= VECTORIZE_THRESHOLD:
+            return not _any_point_in_triangle(
+                coords[candidates], prev_pt, curr_pt, next_pt
+            )
+
+    for vi in candidates:
+        if vi in (prev_idx, next_idx):
             continue
-        test_pt = vertices[vi]
-        if _is_point_in_triangle(test_pt, prev_pt, curr_pt, next_pt):
+        if _is_point_in_triangle(vertices[vi], prev_pt, curr_pt, next_pt):
             return False
 
     return True
 
 
-def _ear_clipping(vertices: list[Point]) -> list[Triangle]:
+def _ear_clipping(vertices: list[Point], coords: Any = None,
+                  deadline: Deadline | None = None) -> list[Triangle]:
     """Triangule un polygone simple avec l'algorithme Ear Clipping.
 
     Fonctionne pour les polygones convexes ET concaves.
 
+    Le polygone est représenté par une liste circulaire doublement chaînée
+    (tableaux `prev` / `nxt`) : retirer une oreille est en O(1), et seuls
+    les deux voisins de l'oreille retirée sont réévalués. L'ensemble des
+    sommets réflexes est maintenu au fil des découpes.
+
     Args:
         vertices: Liste des sommets du polygone dans l'ordre.
+        coords: Les mêmes sommets en tableau NumPy (n, 2), s'il a déjà
+            été construit par l'appelant.
+        deadline: Échéance vérifiée à chaque étape de la boucle
+            principale, ou None.
 
     Returns:
         Liste des triangles (tuples d'indices).
 
+    Raises:
+        DeadlineExceeded: Si l'échéance passe pendant le calcul.
+
     """
     n = len(vertices)
     if n < 3:
         return []
 
-    # Créer une liste d'indices de travail
-    polygon_indices = list(range(n))
+    # Liste circulaire doublement chaînée des sommets restants
+    prev = [n - 1, *range(n - 1)]
+    nxt = [*range(1, n), 0]
     triangles: list[Triangle] = []
 
+    # Tableau NumPy des sommets, partagé par les prédicats vectorisés
+    if coords is None and _use_numpy(n):
+        coords = _as_array(vertices)
+    source = vertices if coords is None else coords
+
     # Déterminer l'orientation du polygone (horaire ou anti-horaire)
-    clockwise = _polygon_area_signed(vertices) < 0
-
-    # Boucle principale - on retire les oreilles une par une
-    max_iterations = n * n  # Sécurité contre boucle infinie
-    iteration = 0
-
-    while len(polygon_indices) > 3 and iteration < max_iterations:
-        iteration += 1
-        ear_found = False
-
-        for i in range(len(polygon_indices)):
-            if _is_ear(polygon_indices, vertices, i, clockwise):
-                # Trouver les indices des 3 sommets
-                n_current = len(polygon_indices)
-                prev_idx = (i - 1) % n_current
-                next_idx = (i + 1) % n_current
-
-                # Ajouter le triangle (avec les indices originaux)
-                v_prev = polygon_indices[prev_idx]
-                v_curr = polygon_indices[i]
-                v_next = polygon_indices[next_idx]
-                triangles.append((v_prev, v_curr, v_next))
-
-                # Retirer le sommet courant du polygone
-                polygon_indices.pop(i)
-                ear_found = True
-                break
-
-        if not ear_found:
+    clockwise = _polygon_area_signed(source) < 0
+
+    # Index spatial des sommets restants (inutile sur les petits polygones)
+    index = MortonIndex(vertices) if n > SPATIAL_INDEX_THRESHOLD else None
+
+    # Sommets réflexes (ou plats) : les seuls candidats au test de contenance
+    reflex = {
+        i for i, convex in enumerate(_convex_flags(source, clockwise))
+        if not convex
+    }
+
+    def update_reflex(i: int) -> None:
+        if _is_convex_vertex(
+            vertices[prev[i]], vertices[i], vertices[nxt[i]], clockwise
+        ):
+            reflex.discard(i)
+        else:
+            reflex.add(i)
+
+    # Boucle principale - on parcourt l'anneau en retirant les oreilles.
+    # `stop` marque le sommet où un tour complet sans découpe se termine.
+    remaining = n
+    ear = 0
+    stop = ear
+    while remaining > 3:
+        # À chaque étape : un `_is_ear` peut coûter bien plus que l'horloge
+        # (requêtes sur l'index d'un nuage de points)
+        if deadline is not None:
+            deadline.check()
+        prev_idx = prev[ear]
+        next_idx = nxt[ear]
+
+        if _is_ear(vertices, prev, nxt, reflex, ear, clockwise, index, coords):
+            # Ajouter le triangle (avec les indices originaux)
+            triangles.append((prev_idx, ear, next_idx))
+
+            # Retirer le sommet courant de l'anneau
+            nxt[prev_idx] = next_idx
+            prev[next_idx] = prev_idx
+            remaining -= 1
+            if index is not None:
+                index.remove(ear)
+
+            # Seuls les deux voisins changent d'angle
+            update_reflex(prev_idx)
+            update_reflex(next_idx)
+
+            ear = next_idx
+            stop = ear
+            continue
+
+        ear = next_idx
+        if ear == stop:
             # Aucune oreille trouvée - polygone dégénéré ou erreur
             break
 
     # Ajouter le dernier triangle (les 3 sommets restants)
-    if len(polygon_indices) == 3:
-        triangles.append((
-            polygon_indices[0],
-            polygon_indices[1],
-            polygon_indices[2]
-        ))
+    if remaining == 3:
+        triangles.append((prev[ear], ear, nxt[ear]))
 
     return triangles
 
 
+def _count_local_maxima(vertices: Sequence[Point], axis: int) -> int:
+    """Compte les sommets localement maximaux selon un axe (0 = x, 1 = y).
+
+    Les égalités sont départagées par l'autre coordonnée (ordre
+    lexicographique), ce qui rend l'ordre strict sur des points distincts.
+    Un polygone simple est monotone selon l'axe perpendiculaire à `axis`
+    si et seulement s'il n'a qu'un seul maximum local.
+    """
+    n = len(vertices)
+    other = 1 - axis
+
+    if _use_numpy(n):
+        coords = _as_array(vertices)
+        major = coords[:, axis]
+        minor = coords[:, other]
+
+        def above(shift: int) -> Any:
+            major_s = np.roll(major, shift)
+            minor_s = np.roll(minor, shift)
+            return (major > major_s) | ((major == major_s) & (minor > minor_s))
+
+        return int(np.count_nonzero(above(1) & above(-1)))
+
+    keys = [(p[axis], p[other]) for p in vertices]
+    return sum(
+        1 for i in range(n)
+        if keys[i] > keys[i - 1] and keys[i] > keys[(i + 1) % n]
+    )
+
+
+def _fan_triangulation(n: int) -> list[Triangle]:
+    """Triangule un polygone convexe en éventail depuis le sommet 0."""
+    return [(0, i, i + 1) for i in range(1, n - 1)]
+
+
+def _is_valid_triangulation(vertices: list[Point], triangles: list[Triangle],
+                            clockwise: bool) -> bool:
+    """Vérifie en O(n) qu'une triangulation recouvre exactement le polygone.
+
+    Contrôles : n - 2 triangles, aucun plat ni retourné (tous orientés
+    comme le polygone), chaque arête du polygone bordant un triangle, et
+    aucune arête orientée partagée par deux triangles (qui se
+    chevaucheraient).
+    """
+    n = len(vertices)
+    if len(triangles) != n - 2:
+        return False
+    edges: set[tuple[int, int]] = set()
+    for a, b, c in triangles:
+        cross = _cross_product_2d(vertices[a], vertices[b], vertices[c])
+        if (-cross if clockwise else cross) <= EPSILON:
+            return False
+        for edge in ((a, b), (b, c), (c, a)):
+            if edge in edges:
+                return False
+            edges.add(edge)
+    return all((i, (i + 1) % n) in edges for i in range(n))
+
+
+def _monotone_triangulation(vertices: list[Point], clockwise: bool,
+                            axis: int) -> list[Triangle]:
+    """Triangule un polygone monotone en temps linéaire (algorithme à pile).
+
+    Les sommets sont parcourus par ordre décroissant selon `axis` en
+    fusionnant les deux chaînes monotones ; une pile garde les sommets
+    pas encore reliés par une diagonale.
+
+    Args:
+        vertices: Liste des sommets du polygone dans l'ordre.
+        clockwise: True si le polygone est en ordre horaire.
+        axis: 1 pour un polygone y-monotone, 0 pour x-monotone.
+
+    Returns:
+        Liste des triangles (tuples d'indices), orientés comme le polygone.
+
+    """
+    n = len(vertices)
+    other = 1 - axis
+
+    def key(i: int) -> Point:
+        return vertices[i][axis], vertices[i][other]
+
+    top = max(range(n), key=key)
+    bottom = min(range(n), key=key)
+
+    # Les deux chaînes, du sommet haut vers le sommet bas (exclus) :
+    # +1 = dans le sens du polygone, -1 = dans le sens inverse
+    forward: list[int] = []
+    i = (top + 1) % n
+    while i != bottom:
+        forward.append(i)
+        i = (i + 1) % n
+    backward: list[int] = []
+    i = (top - 1) % n
+    while i != bottom:
+        backward.append(i)
+        i = (i - 1) % n
+
+    side = [0] * n
+    for i in forward:
+        side[i] = 1
+    for i in backward:
+        side[i] = -1
+
+    # Fusion des deux chaînes déjà triées (décroissantes)
+    order = [top]
+    a = b = 0
+    while a < len(forward) or b < len(backward):
+        if b == len(backward) or (
+            a < len(forward) and key(forward[a]) > key(backward[b])
+        ):
+            order.append(forward[a])
+            a += 1
+        else:
+            order.append(backward[b])
+            b += 1
+    order.append(bottom)
+
+    triangles: list[Triangle] = []
+
+    def add(v0: int, v1: int, v2: int) -> None:
+        # Orienter le triangle comme le polygone
+        cross = _cross_product_2d(vertices[v0], vertices[v1], vertices[v2])
+        if (cross < 0) != clockwise:
+            v1, v2 = v2, v1
+        triangles.append((v0, v1, v2))
+
+    def reflex_at(v: int, last: int, prev: int) -> bool:
+        # Le sommet `last` est-il rentrant vu depuis v ? (ordre du polygone)
+        # Test exact, sans EPSILON : un sommet aligné compte comme rentrant
+        # et reste sur la pile (le découper donnerait un triangle plat)
+        if side[v] == 1:
+            cross = _cross_product_2d(vertices[prev], vertices[last], vertices[v])
+        else:
+            cross = _cross_product_2d(vertices[v], vertices[last], vertices[prev])
+        return cross >= 0 if clockwise else cross <= 0
+
+    stack = [order[0], order[1]]
+    for v in order[2:-1]:
+        if side[v] != side[stack[-1]]:
+            # Chaîne opposée : relier v à tous les sommets de la pile
+            previous = stack[-1]
+            while len(stack) > 1:
+                last = stack.pop()
+                add(v, last, stack[-1])
+            stack = [previous, v]
+        else:
+            # Même chaîne : découper tant que la diagonale est intérieure
+            last = stack.pop()
+            while stack and not reflex_at(v, last, stack[-1]):
+                add(v, last, stack[-1])
+                last = stack.pop()
+            stack.append(last)
+            stack.append(v)
+
+    # Le sommet bas ferme tous les triangles restants
+    while len(stack) > 1:
+        last = stack.pop()
+        add(bottom, last, stack[-1])
+
+    return triangles
+
+
+def _monotone_diagonals(vertices: list[Point],
+                        deadline: Deadline | None = None,
+                        ) -> list[tuple[int, int]]:
+    """Renvoie les diagonales découpant un polygone en pièces y-monotones.
+
+    Balayage de haut en bas (ordre lexicographique (y, x) décroissant).
+    La structure de statut contient les arêtes ayant l'intérieur du
+    polygone à leur droite, triées par abscisse sur la ligne de balayage ;
+    chacune garde son "helper", le dernier sommet rencontré dont elle est
+    l'arête gauche. Les sommets "split" et "merge" sont reliés par une
+    diagonale à un helper, ce qui supprime les points non monotones.
+
+    Args:
+        vertices: Sommets du polygone en ordre anti-horaire. L'arête i
+            relie le sommet i au sommet i + 1.
+        deadline: Échéance vérifiée pendant le balayage, ou None.
+
+    Returns:
+        La liste des diagonales (paires d'indices de sommets).
+
+    Raises:
+        ValueError: Si le statut devient incohérent (polygone non simple :
+            nuage de points, anneau auto-intersectant).
+        DeadlineExceeded: Si l'échéance passe pendant le balayage.
+
+    """
+    n = len(vertices)
+
+    def above(a: int, b: int) -> bool:
+        pa = vertices[a]
+        pb = vertices[b]
+        return (pa[1], pa[0]) > (pb[1], pb[0])
+
+    # Classification des sommets
+    kinds = [_SWEEP_REGULAR] * n
+    for i in range(n):
+        prev_i = i - 1
+        next_i = (i + 1) % n
+        convex = _cross_product_2d(
+            vertices[prev_i], vertices[i], vertices[next_i]
+        ) > 0
+        prev_above = above(prev_i, i)
+        next_above = above(next_i, i)
+        if not prev_above and not next_above:
+            kinds[i] = _SWEEP_START if convex else _SWEEP_SPLIT
+        elif prev_above and next_above:
+            kinds[i] = _SWEEP_END if convex else _SWEEP_MERGE
+
+    sweep_y = 0.0
+
+    def x_at(edge: int) -> float:
+        # Abscisse de l'arête `edge` sur la ligne de balayage courante
+        x1, y1 = vertices[edge]
+        x2, y2 = vertices[(edge + 1) % n]
+        if y1 == y2:
+            return min(x1, x2)
+        return x1 + (sweep_y - y1) * (x2 - x1) / (y2 - y1)
+
+    # Statut : liste d'arêtes maintenue triée par bisection (l'ordre
+    # relatif des arêtes ne change pas entre deux événements)
+    status: list[int] = []
+    helper = [-1] * n
+    diagonals: list[tuple[int, int]] = []
+
+    def left_edge(v: int) -> int:
+        # Arête du statut immédiatement à gauche du sommet v
+        pos = bisect.bisect_right(status, vertices[v][0], key=x_at)
+        if pos == 0:
+            raise ValueError("Aucune arête à gauche du sommet (non simple)")
+        return status[pos - 1]
+
+    def connect_merge_helper(v: int, edge: int) -> None:
+        if kinds[helper[edge]] == _SWEEP_MERGE:
+            diagonals.append((v, helper[edge]))
+
+    events = sorted(range(n), key=lambda i: (vertices[i][1], vertices[i][0]),
+                    reverse=True)
+    for k, v in enumerate(events):
+        if deadline is not None and k % CHECK_EVERY == 0:
+            deadline.check()
+        sweep_y = vertices[v][1]
+        kind = kinds[v]
+        prev_edge = (v - 1) % n
+
+        if kind == _SWEEP_START:
+            bisect.insort(status, v, key=x_at)
+            helper[v] = v
+        elif kind == _SWEEP_END:
+            connect_merge_helper(v, prev_edge)
+            status.remove(prev_edge)
+        elif kind == _SWEEP_SPLIT:
+            left = left_edge(v)
+            diagonals.append((v, helper[left]))
+            helper[left] = v
+            bisect.insort(status, v, key=x_at)
+            helper[v] = v
+        elif kind == _SWEEP_MERGE:
+            connect_merge_helper(v, prev_edge)
+            status.remove(prev_edge)
+            left = left_edge(v)
+            connect_merge_helper(v, left)
+            helper[left] = v
+        elif above(prev_edge, v):
+            # Sommet régulier sur la chaîne gauche (intérieur à droite)
+            connect_merge_helper(v, prev_edge)
+            status.remove(prev_edge)
+            bisect.insort(status, v, key=x_at)
+            helper[v] = v
+        else:
+            # Sommet régulier sur la chaîne droite
+            left = left_edge(v)
+            connect_merge_helper(v, left)
+            helper[left] = v
+
+    return diagonals
+
+
+def _split_faces(vertices: list[Point],
+                 diagonals: list[tuple[int, int]]) -> list[list[int]]:
+    """Découpe un polygone anti-horaire le long de diagonales.
+
+    Chaque face est parcourue avec l'intérieur à gauche : en arrivant
+    sur un sommet par l'arête u -> v, on repart par la première arête
+    sortante rencontrée dans le sens horaire à partir de v -> u. Les
+    angles sont comparés par produits vectoriels (pas d'atan2), ce qui
+    reste exact pour des directions presque confondues.
+
+    Returns:
+        Les faces, chacune comme liste d'indices de sommets (anti-horaire).
+
+    """
+    n = len(vertices)
+    extra: dict[int, list[int]] = {}
+    for a, b in diagonals:
+        extra.setdefault(a, []).append(b)
+        extra.setdefault(b, []).append(a)
+
+    def next_vertex(u: int, v: int) -> int:
+        if v not in extra:
+            return (v + 1) % n
+        origin = vertices[v]
+        back = vertices[u]
+
+        def half(w: int) -> int:
+            # 0 : dans le demi-plan horaire de v -> u, 1 : opposé à v -> u,
+            # 2 : demi-plan anti-horaire, 3 : confondu avec v -> u
+            cross = _cross_product_2d(origin, back, vertices[w])
+            if cross < 0:
+                return 0
+            if cross > 0:
+                return 2
+            dot = ((back[0] - origin[0]) * (vertices[w][0] - origin[0])
+                   + (back[1] - origin[1]) * (vertices[w][1] - origin[1]))
+            return 3 if dot > 0 else 1
+
+        best = -1
+        for w in ((v + 1) % n, *extra[v]):
+            if w == u:
+                continue
+            if best == -1 or half(w) < half(best) or (
+                half(w) == half(best)
+                and _cross_product_2d(origin, vertices[w], vertices[best]) < 0
+            ):
+                best = w
+        return best
+
+    used: set[tuple[int, int]] = set()
+    starts = [(i, (i + 1) % n) for i in range(n)]
+    starts += [(a, b) for a, b in diagonals] + [(b, a) for a, b in diagonals]
+
+    faces: list[list[int]] = []
+    limit = n + 2 * len(diagonals)
+    for u, v in starts:
+        if (u, v) in used:
+            continue
+        face = [u]
+        used.add((u, v))
+        while v != face[0] and len(face) <= limit:
+            face.append(v)
+            u, v = v, next_vertex(u, v)
+            used.add((u, v))
+        faces.append(face)
+    return faces
+
+
+def _sweep_triangulation(vertices: list[Point], clockwise: bool,
+                         deadline: Deadline | None = None) -> list[Triangle]:
+    """Triangule un polygone simple par décomposition monotone, O(n log n).
+
+    Le polygone est découpé en pièces y-monotones par balayage
+    (`_monotone_diagonals`), puis chaque pièce est triangulée en temps
+    linéaire par `_monotone_triangulation`.
+
+    Args:
+        vertices: Liste des sommets du polygone dans l'ordre.
+        clockwise: True si le polygone est en ordre horaire.
+        deadline: Échéance vérifiée pendant le calcul, ou None.
+
+    Returns:
+        Liste des triangles (tuples d'indices), orientés comme le polygone,
+        ou None si le polygone ne peut pas être traité ainsi (polygone non
+        simple, sommet posé sur une arête) : l'appelant se rabat alors sur
+        l'Ear Clipping.
+
+    Raises:
+        DeadlineExceeded: Si l'échéance passe pendant le calcul.
+
+    """
+    n = len(vertices)
+    # Le balayage travaille sur le polygone en ordre anti-horaire
+    ring = list(range(n - 1, -1, -1)) if clockwise else list(range(n))
+    ccw = [vertices[i] for i in ring]
+
+    triangles: list[Triangle] = []
+    try:
+        for face in _split_faces(ccw, _monotone_diagonals(ccw, deadline)):
+            if deadline is not None:
+                deadline.check()
+            piece = [ccw[i] for i in face]
+            for a, b, c in _monotone_triangulation(piece, False, 1):
+                if clockwise:
+                    b, c = c, b
+                triangles.append((ring[face[a]], ring[face[b]], ring[face[c]]))
+    except (IndexError, ValueError):
+        # Statut ou faces incohérents : le polygone n'est pas simple
+        return None
+
+    if not _is_valid_triangulation(vertices, triangles, clockwise):
+        # Faces plates ou arêtes non couvertes (sommet posé sur une arête,
+        # polygone dégénéré à la précision près)
+        return None
+    return triangles
+
+
+def _triangulate_polygon(vertices: list[Point], coords: Any = None,
+                         sweep_threshold: int = SWEEP_THRESHOLD,
+                         deadline: Deadline | None = None,
+                         ) -> tuple[list[Triangle], str]:
+    """Pré-classe le polygone en O(n) puis choisit l'algorithme adapté.
+
+    - convexe : triangulation en éventail, O(n)
+    - x- ou y-monotone : algorithme à pile, O(n), résultat vérifié
+    - plus de `sweep_threshold` sommets : décomposition monotone par
+      balayage, O(n log n), résultat vérifié
+    - sinon : Ear Clipping général
+
+    Returns:
+        Les triangles et le chemin emprunté (voir `PATHS`).
+
+    """
+    source = vertices if coords is None else coords
+    clockwise = _polygon_area_signed(source) < 0
+
+    # Le résultat de l'algorithme à pile est vérifié : un polygone non
+    # simple (ou un sommet posé sur une arête) passe à l'algorithme suivant
+    if _count_local_maxima(source, 1) == 1:
+        # Un seul maximum en y : une seule "boucle", donc convexe si tous
+        # les sommets le sont (exclut les étoiles auto-intersectantes)
+        if all(_convex_flags(source, clockwise)):
+            return _fan_triangulation(len(vertices)), PATH_CONVEX
+        triangles = _monotone_triangulation(vertices, clockwise, 1)
+        if _is_valid_triangulation(vertices, triangles, clockwise):
+            return triangles, PATH_MONOTONE
+
+    if _count_local_maxima(source, 0) == 1:
+        triangles = _monotone_triangulation(vertices, clockwise, 0)
+        if _is_valid_triangulation(vertices, triangles, clockwise):
+            return triangles, PATH_MONOTONE
+
+    if len(vertices) > sweep_threshold:
+        triangles = _sweep_triangulation(vertices, clockwise, deadline)
+        if triangles is not None:
+            return triangles, PATH_SWEEP
+
+    return _ear_clipping(vertices, coords, deadline), PATH_EAR_CLIPPING
+
+
 def compute_triangulation(
-    points: list[Point]
+    points: Sequence[Point] | array | Mesh,
+    engine: str = DEFAULT_ENGINE,
+    info: dict[str, Any] | None = None,
+    sweep_threshold: int = SWEEP_THRESHOLD,
+    deadline: Deadline | None = None,
 ) -> tuple[list[Point], list[Triangle]]:
-    """Compute triangulation for a set of points using Ear Clipping.
-
-    Utilise l'algorithme Ear Clipping qui fonctionne pour les polygones
-    convexes ET concaves. Les points sont traités comme les sommets
-    d'un polygone simple (non auto-intersectant).
+    """Compute triangulation for a set of points using the chosen engine.
+
+    Avec le moteur "polygon" (par défaut), les points sont traités comme
+    les sommets d'un polygone simple (non auto-intersectant). Une
+    pré-classification en O(n) envoie les polygones convexes vers une
+    triangulation en éventail et les polygones monotones vers un
+    algorithme linéaire à pile ; les autres passent par l'Ear Clipping,
+    ou au-delà de `sweep_threshold` sommets par la décomposition monotone
+    par balayage. Le moteur "sweep" force cette dernière. Un résultat
+    incohérent (polygone non simple, ex. un nuage de points) se rabat sur
+    l'Ear Clipping. Avec le moteur "delaunay", les points sont traités
+    comme un nuage non ordonné.
 
     Gère les cas dégénérés (points alignés, doublons, moins de 3 points).
 
     Args:
-        points: Une liste de tuples (x, y) représentant les sommets du polygone.
+        points: Une liste de tuples (x, y) représentant les sommets du
+            polygone, un tableau plat [x0, y0, x1, y1, ...] tel que
+            renvoyé par `binary_utils.binary_to_coords`, ou un `Mesh`.
+        engine: Le moteur de triangulation (voir `ENGINES`).
+        info: Dictionnaire optionnel complété avec des informations sur le
+            calcul : "path" (le chemin emprunté, voir `PATHS`).
+        sweep_threshold: Nombre de sommets au-delà duquel le moteur
+            "polygon" utilise la décomposition monotone par balayage.
+        deadline: Échéance vérifiée régulièrement par les moteurs
+            (Ear Clipping, balayage, Delaunay), ou None pour aucune.
 
     Returns:
         Un tuple contenant:
         - La liste des vertices (les points utilisés, sans doublons).
         - La liste des triangles (tuples d'indices référençant les vertices).
 
+    Raises:
+        ValueError: Si le moteur demandé n'existe pas.
+        DeadlineExceeded: Si l'échéance passe pendant le calcul.
+
     """
+    if engine not in ENGINES:
+        raise ValueError(f"Moteur de triangulation inconnu: {engine}")
+
+    if isinstance(points, Mesh):
+        points = points.vertices
+    flat = None
+    if isinstance(points, array):
+        # Coordonnées à plat : regroupées deux à deux (boucle en C)
+        flat = points
+        it = iter(flat)
+        points = list(zip(it, it, strict=False))
+
     # 1. Nettoyage : Supprimer les doublons tout en gardant l'ordre
     unique_points = list(dict.fromkeys(points))
 
     n = len(unique_points)
+    if info is not None:
+        info["path"] = PATH_DEGENERATE
 
     # 2. Cas limites (moins de 3 points = pas de triangle)
     if n < 3:
         return unique_points, []
 
-    # 3. Vérification globale : Si tous les points sont colinéaires
-    all_collinear = True
-    for i in range(2, n):
-        if not _is_collinear(unique_points[0], unique_points[1], unique_points[i]):
-            all_collinear = False
-            break
+    # Conversion unique vers NumPy, partagée par les prédicats vectorisés
+    # (directement depuis le tableau plat s'il n'y avait aucun doublon)
+    coords = None
+    if _use_numpy(n):
+        coords = _as_array(
+            flat if flat is not None and 2 * n == len(flat) else unique_points
+        )
 
-    if all_collinear:
+    # 3. Vérification globale : Si tous les points sont colinéaires
+    if _all_collinear(unique_points if coords is None else coords):
         return unique_points, []
 
-    # 4. Appliquer l'algorithme Ear Clipping
-    triangles = _ear_clipping(unique_points)
+    # 4. Appliquer le moteur demandé
+    if engine == ENGINE_DELAUNAY:
+        triangles = delaunay_triangulation(unique_points, deadline)
+        path = PATH_DELAUNAY
+    elif engine == ENGINE_SWEEP:
+        clockwise = _polygon_area_signed(
+            unique_points if coords is None else coords
+        ) < 0
+        triangles = _sweep_triangulation(unique_points, clockwise, deadline)
+        path = PATH_SWEEP
+        if triangles is None:
+            triangles = _ear_clipping(unique_points, coords, deadline)
+            path = PATH_EAR_CLIPPING
+    else:
+        triangles, path = _triangulate_polygon(
+            unique_points, coords, sweep_threshold, deadline
+        )
+
+    if info is not None:
+        info["path"] = path
+
+    return unique_points, triangles
+
+
+def triangulate_mesh(
+    mesh: Mesh,
+    engine: str = DEFAULT_ENGINE,
+    sweep_threshold: int = SWEEP_THRESHOLD,
+    deadline: Deadline | None = None,
+) -> tuple[Mesh, str | None]:
+    """Triangule les sommets d'un `Mesh` et renvoie le résultat en `Mesh`.
+
+    Même calcul que `compute_triangulation`, entrée et sortie compactes.
+    Si aucun doublon n'est retiré, le résultat reprend le tableau de
+    sommets de l'entrée lui-même (`result.vertices is mesh.vertices`),
+    sans copie.
+
+    Args:
+        mesh: Les sommets à trianguler (ses triangles sont ignorés).
+        engine: Le moteur de triangulation (voir `ENGINES`).
+        sweep_threshold: Voir `compute_triangulation`.
+        deadline: Voir `compute_triangulation`.
 
-    return unique_points, triangles
\ No newline at end of file
+    Returns:
+        La triangulation et le chemin de calcul emprunté (voir `PATHS`).
+
+    Raises:
+        ValueError: Si le moteur demandé n'existe pas.
+        DeadlineExceeded: Si l'échéance passe pendant le calcul.
+
+    """
+    info: dict[str, Any] = {}
+    vertices, triangles = compute_triangulation(
+        mesh.vertices, engine=engine, info=info,
+        sweep_threshold=sweep_threshold, deadline=deadline,
+    )
+    coords = mesh.vertices
+    if len(vertices) != mesh.vertex_count:
+        coords = array(COORD_TYPECODE, chain.from_iterable(vertices))
+    indices = array(INDEX_TYPECODE, chain.from_iterable(triangles))
+    return Mesh(coords, indices), info.get("path")
\ No newline at end of file
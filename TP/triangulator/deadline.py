@@ -0,0 +1,45 @@
+"""Module Deadline - Budget de temps d'une requête, de bout en bout.
+
+Une même échéance est partagée par toutes les étapes d'une requête
+(récupération, décodage, calcul, sérialisation). Les moteurs de `core` la
+vérifient régulièrement dans leurs boucles et abandonnent le calcul
+(`DeadlineExceeded`) une fois le délai écoulé : un polygone pathologique
+ne peut plus occuper un worker bien après le départ du client.
+"""
+
+import time
+
+# Les boucles des moteurs ne consultent l'horloge qu'une itération sur
+# CHECK_EVERY, pour un surcoût négligeable (sauf l'Ear Clipping, dont une
+# étape peut à elle seule coûter des millisecondes)
+CHECK_EVERY = 1024
+
+
+class DeadlineExceeded(Exception):
+    """Le délai alloué à la requête est écoulé."""
+
+    pass
+
+
+class Deadline:
+    """Échéance absolue (horloge monotone), fixée à la création."""
+
+    __slots__ = ("timeout", "expires_at")
+
+    def __init__(self, timeout: float) -> None:
+        """Crée une échéance dans `timeout` secondes."""
+        self.timeout = timeout
+        self.expires_at = time.monotonic() + timeout
+
+    def remaining(self) -> float:
+        """Renvoie le temps restant en secondes (0 si écoulé)."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        """Indique si l'échéance est passée."""
+        return time.monotonic() >= self.expires_at
+
+    def check(self) -> None:
+        """Lève DeadlineExceeded si l'échéance est passée."""
+        if time.monotonic() >= self.expires_at:
+            raise DeadlineExceeded(f"Délai de {self.timeout:g} s dépassé.")
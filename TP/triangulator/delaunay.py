@@ -0,0 +1,327 @@
+"""Module Delaunay - Triangulation de nuages de points non ordonnés.
+
+Ce module implémente l'algorithme "sweep-hull" (balayage radial de
+l'enveloppe convexe, tel que popularisé par Delaunator) en O(n log n) :
+les points sont insérés par distance croissante à un triangle germe,
+chaque insertion ajoute des triangles sur la partie visible de
+l'enveloppe, puis les arêtes sont "légalisées" par retournements
+successifs jusqu'à respecter le critère du cercle vide.
+
+Contrairement à l'Ear Clipping de `core`, l'ordre des points n'a
+aucune importance : l'entrée est traitée comme un nuage de points.
+"""
+
+import math
+
+from .deadline import CHECK_EVERY, Deadline
+from .geometry import Point, Triangle
+
+# Tolérance pour écarter les points quasi confondus
+EPSILON = 2.0 ** -52
+
+
+def _orient(px: float, py: float, qx: float, qy: float,
+            rx: float, ry: float) -> bool:
+    """Renvoie True si le virage P->Q->R est anti-horaire."""
+    return (qy - py) * (rx - qx) - (qx - px) * (ry - qy) < 0
+
+
+def _in_circle(ax: float, ay: float, bx: float, by: float,
+               cx: float, cy: float, px: float, py: float) -> bool:
+    """Renvoie True si P est dans le cercle circonscrit à A-B-C."""
+    dx = ax - px
+    dy = ay - py
+    ex = bx - px
+    ey = by - py
+    fx = cx - px
+    fy = cy - py
+
+    ap = dx * dx + dy * dy
+    bp = ex * ex + ey * ey
+    cp = fx * fx + fy * fy
+
+    return (dx * (ey * cp - bp * fy)
+            - dy * (ex * cp - bp * fx)
+            + ap * (ex * fy - ey * fx)) < 0
+
+
+def _circumcenter_offset(ax: float, ay: float, bx: float, by: float,
+                         cx: float, cy: float) -> tuple[float, float] | None:
+    """Renvoie le centre du cercle circonscrit relativement à A.
+
+    Renvoie None si les trois points sont alignés.
+    """
+    dx = bx - ax
+    dy = by - ay
+    ex = cx - ax
+    ey = cy - ay
+
+    det = dx * ey - dy * ex
+    if det == 0:
+        return None
+
+    bl = dx * dx + dy * dy
+    cl = ex * ex + ey * ey
+    d = 0.5 / det
+    return (ey * bl - dy * cl) * d, (dx * cl - ex * bl) * d
+
+
+def _circumradius_sq(ax: float, ay: float, bx: float, by: float,
+                     cx: float, cy: float) -> float:
+    """Renvoie le carré du rayon circonscrit (inf si points alignés)."""
+    offset = _circumcenter_offset(ax, ay, bx, by, cx, cy)
+    if offset is None:
+        return math.inf
+    return offset[0] * offset[0] + offset[1] * offset[1]
+
+
+def _pseudo_angle(dx: float, dy: float) -> float:
+    """Renvoie une valeur croissante avec l'angle de (dx, dy), dans [0, 1]."""
+    if dx == 0 and dy == 0:
+        return 0.0
+    p = dx / (abs(dx) + abs(dy))
+    return (3 - p if dy > 0 else 1 + p) / 4
+
+
+def delaunay_triangulation(points: list[Point],
+                           deadline: Deadline | None = None) -> list[Triangle]:
+    """Triangule un nuage de points selon le critère de Delaunay.
+
+    Args:
+        points: Liste des points (x, y), dans un ordre quelconque et
+            sans doublons.
+        deadline: Échéance vérifiée pendant les insertions, ou None.
+
+    Returns:
+        Liste des triangles (tuples d'indices dans `points`). Vide si
+        les points sont tous alignés ou moins de 3.
+
+    Raises:
+        DeadlineExceeded: Si l'échéance passe pendant le calcul.
+
+    """
+    n = len(points)
+    if n < 3:
+        return []
+
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+
+    # 1. Germe : le point le plus proche du centre de la boîte englobante,
+    # son plus proche voisin, puis le point formant le plus petit cercle
+    cx = (min(xs) + max(xs)) / 2
+    cy = (min(ys) + max(ys)) / 2
+
+    i0 = min(range(n), key=lambda i: (xs[i] - cx) ** 2 + (ys[i] - cy) ** 2)
+    i0x, i0y = xs[i0], ys[i0]
+
+    i1 = -1
+    min_dist = math.inf
+    for i in range(n):
+        if i == i0:
+            continue
+        d = (xs[i] - i0x) ** 2 + (ys[i] - i0y) ** 2
+        if 0 < d < min_dist:
+            i1 = i
+            min_dist = d
+    if i1 == -1:
+        return []
+    i1x, i1y = xs[i1], ys[i1]
+
+    i2 = -1
+    min_radius = math.inf
+    for i in range(n):
+        if i in (i0, i1):
+            continue
+        r = _circumradius_sq(i0x, i0y, i1x, i1y, xs[i], ys[i])
+        if r < min_radius:
+            i2 = i
+            min_radius = r
+    if i2 == -1:
+        # Tous les points sont alignés : aucun triangle
+        return []
+    i2x, i2y = xs[i2], ys[i2]
+
+    if _orient(i0x, i0y, i1x, i1y, i2x, i2y):
+        i1, i2 = i2, i1
+        i1x, i1y, i2x, i2y = i2x, i2y, i1x, i1y
+
+    offset = _circumcenter_offset(i0x, i0y, i1x, i1y, i2x, i2y)
+    assert offset is not None  # germe non dégénéré (rayon fini)
+    ccx = i0x + offset[0]
+    ccy = i0y + offset[1]
+
+    # 2. Tri des points par distance au centre du germe
+    dists = [(xs[i] - ccx) ** 2 + (ys[i] - ccy) ** 2 for i in range(n)]
+    ids = sorted(range(n), key=dists.__getitem__)
+
+    # 3. Enveloppe convexe : liste circulaire + table de hachage angulaire
+    hash_size = max(math.ceil(math.sqrt(n)), 1)
+    hull_prev = [0] * n
+    hull_next = [0] * n
+    hull_tri = [0] * n
+    hull_hash = [-1] * hash_size
+
+    def hash_key(x: float, y: float) -> int:
+        return int(_pseudo_angle(x - ccx, y - ccy) * hash_size) % hash_size
+
+    hull_next[i0] = hull_prev[i2] = i1
+    hull_next[i1] = hull_prev[i0] = i2
+    hull_next[i2] = hull_prev[i1] = i0
+    hull_tri[i0] = 0
+    hull_tri[i1] = 1
+    hull_tri[i2] = 2
+    hull_hash[hash_key(i0x, i0y)] = i0
+    hull_hash[hash_key(i1x, i1y)] = i1
+    hull_hash[hash_key(i2x, i2y)] = i2
+
+    # Triangles à plat (3 sommets consécutifs) et demi-arêtes opposées
+    triangles: list[int] = []
+    halfedges: list[int] = []
+    edge_stack: list[int] = []
+
+    def link(a: int, b: int) -> None:
+        halfedges[a] = b
+        if b != -1:
+            halfedges[b] = a
+
+    def add_triangle(v0: int, v1: int, v2: int,
+                     a: int, b: int, c: int) -> int:
+        t = len(triangles)
+        triangles.extend((v0, v1, v2))
+        halfedges.extend((-1, -1, -1))
+        link(t, a)
+        link(t + 1, b)
+        link(t + 2, c)
+        return t
+
+    def legalize(a: int) -> int:
+        # Retourne les arêtes illégales (critère du cercle vide)
+        # jusqu'à stabilisation, avec une pile explicite
+        while True:
+            b = halfedges[a]
+            a0 = a - a % 3
+            ar = a0 + (a + 2) % 3
+
+            if b == -1:
+                # Arête de l'enveloppe convexe
+                if not edge_stack:
+                    return ar
+                a = edge_stack.pop()
+                continue
+
+            b0 = b - b % 3
+            al = a0 + (a + 1) % 3
+            bl = b0 + (b + 2) % 3
+
+            p0 = triangles[ar]
+            pr = triangles[a]
+            pl = triangles[al]
+            p1 = triangles[bl]
+
+            if _in_circle(xs[p0], ys[p0], xs[pr], ys[pr],
+                          xs[pl], ys[pl], xs[p1], ys[p1]):
+                triangles[a] = p1
+                triangles[b] = p0
+
+                hbl = halfedges[bl]
+                if hbl == -1:
+                    # Arête retournée de l'autre côté de l'enveloppe (rare)
+                    e = hull_start
+                    while True:
+                        if hull_tri[e] == bl:
+                            hull_tri[e] = a
+                            break
+                        e = hull_prev[e]
+                        if e == hull_start:
+                            break
+
+                link(a, hbl)
+                link(b, halfedges[ar])
+                link(ar, bl)
+                edge_stack.append(b0 + (b + 1) % 3)
+            else:
+                if not edge_stack:
+                    return ar
+                a = edge_stack.pop()
+
+    hull_start = i0
+    add_triangle(i0, i1, i2, -1, -1, -1)
+
+    # 4. Insertion des points un à un
+    xp = yp = math.nan
+    for k, i in enumerate(ids):
+        if deadline is not None and k % CHECK_EVERY == 0:
+            deadline.check()
+        x = xs[i]
+        y = ys[i]
+
+        # Ignorer les points quasi confondus avec le précédent
+        if k > 0 and abs(x - xp) <= EPSILON and abs(y - yp) <= EPSILON:
+            continue
+        xp = x
+        yp = y
+
+        if i in (i0, i1, i2):
+            continue
+
+        # Trouver une arête visible de l'enveloppe grâce au hachage
+        start = 0
+        key = hash_key(x, y)
+        for j in range(hash_size):
+            start = hull_hash[(key + j) % hash_size]
+            if start != -1 and start != hull_next[start]:
+                break
+
+        start = hull_prev[start]
+        e = start
+        while True:
+            q = hull_next[e]
+            if _orient(x, y, xs[e], ys[e], xs[q], ys[q]):
+                break
+            e = q
+            if e == start:
+                e = -1
+                break
+        if e == -1:
+            # Point sur l'enveloppe (quasi doublon) : ignoré
+            continue
+
+        # Ajouter le premier triangle depuis le point
+        t = add_triangle(e, i, hull_next[e], -1, -1, hull_tri[e])
+        hull_tri[i] = legalize(t + 2)
+        hull_tri[e] = t
+
+        # Avancer sur l'enveloppe en ajoutant des triangles
+        nxt = hull_next[e]
+        while True:
+            q = hull_next[nxt]
+            if not _orient(x, y, xs[nxt], ys[nxt], xs[q], ys[q]):
+                break
+            t = add_triangle(nxt, i, q, hull_tri[i], -1, hull_tri[nxt])
+            hull_tri[i] = legalize(t + 2)
+            hull_next[nxt] = nxt  # marqué comme retiré
+            nxt = q
+
+        # Reculer depuis le début de l'arête visible
+        if e == start:
+            while True:
+                q = hull_prev[e]
+                if not _orient(x, y, xs[q], ys[q], xs[e], ys[e]):
+                    break
+                t = add_triangle(q, i, e, -1, hull_tri[e], hull_tri[q])
+                legalize(t + 2)
+                hull_tri[q] = t
+                hull_next[e] = e  # marqué comme retiré
+                e = q
+
+        # Mettre à jour l'enveloppe
+        hull_start = hull_prev[i] = e
+        hull_next[e] = hull_prev[nxt] = i
+        hull_next[i] = nxt
+
+        hull_hash[hash_key(x, y)] = i
+        hull_hash[hash_key(xs[e], ys[e])] = e
+
+    return list(zip(triangles[0::3], triangles[1::3], triangles[2::3],
+                    strict=True))
@@ -0,0 +1,98 @@
+"""Module Geometry - Types géométriques partagés et conteneur compact.
+
+`Point` et `Triangle` (tuples) sont les types des algorithmes de `core`.
+Entre les étapes du pipeline (décodage, calcul dans le pool de processus,
+sérialisation), la géométrie circule dans un `Mesh` : deux tableaux plats,
+les coordonnées [x0, y0, x1, y1, ...] en flottants 32 bits et les indices
+[i0, j0, k0, i1, ...] en entiers non signés 32 bits. Un point y coûte
+8 octets et un triangle 12, contre plus de 70 pour un tuple, sans aucun
+objet Python par élément à suivre pour le ramasse-miettes.
+
+Les coordonnées sont rangées comme dans la partie Vertices du format
+binaire : décodage et sérialisation se font en bloc, entre le tampon reçu
+(ou envoyé) et le tableau. `from_tuples`, `points` et `triangle_tuples`
+font le lien avec les listes de tuples.
+"""
+
+from array import array
+from collections.abc import Iterable
+from itertools import chain
+
+# Type hints pour la clarté
+Point = tuple[float, float]
+Triangle = tuple[int, int, int]
+
+# Codes de type `array` des coordonnées (flottant 32 bits, comme le format
+# binaire) et des indices (entier non signé sur 32 bits)
+COORD_TYPECODE = "f"
+INDEX_TYPECODE = "I" if array("I").itemsize == 4 else "L"
+
+
+class Mesh:
+    """Sommets et triangles en tableaux plats (un PointSet n'a pas de triangle).
+
+    Les tableaux sont gardés tels quels, sans copie : deux `Mesh` peuvent
+    partager le même tableau de sommets (ex. une triangulation sans
+    doublon retiré et le PointSet dont elle est issue).
+    """
+
+    __slots__ = ("vertices", "triangles")
+
+    def __init__(self, vertices: array | None = None,
+                 triangles: array | None = None) -> None:
+        """Enveloppe des tableaux plats, sans les copier.
+
+        Args:
+            vertices: Les coordonnées [x0, y0, ...] (array('f')).
+            triangles: Les indices [i0, j0, k0, ...] (array d'entiers
+                32 bits) ; aucun par défaut.
+
+        """
+        self.vertices = array(COORD_TYPECODE) if vertices is None else vertices
+        self.triangles = (
+            array(INDEX_TYPECODE) if triangles is None else triangles
+        )
+
+    @classmethod
+    def from_tuples(cls, points: Iterable[Point],
+                    triangles: Iterable[Triangle] = ()) -> "Mesh":
+        """Construit un `Mesh` depuis des listes de tuples (adaptateur)."""
+        return cls(
+            array(COORD_TYPECODE, chain.from_iterable(points)),
+            array(INDEX_TYPECODE, chain.from_iterable(triangles)),
+        )
+
+    @property
+    def vertex_count(self) -> int:
+        """Nombre de sommets."""
+        return len(self.vertices) // 2
+
+    @property
+    def triangle_count(self) -> int:
+        """Nombre de triangles."""
+        return len(self.triangles) // 3
+
+    def points(self) -> list[Point]:
+        """Renvoie les sommets en liste de tuples (x, y) (adaptateur)."""
+        # Regroupe les coordonnées deux à deux (boucle en C, via zip)
+        it = iter(self.vertices)
+        return list(zip(it, it, strict=False))
+
+    def triangle_tuples(self) -> list[Triangle]:
+        """Renvoie les triangles en liste de tuples d'indices (adaptateur)."""
+        it = iter(self.triangles)
+        return list(zip(it, it, it, strict=False))
+
+    def __eq__(self, other: object) -> bool:
+        """Égalité des sommets et des triangles."""
+        if not isinstance(other, Mesh):
+            return NotImplemented
+        return (self.vertices == other.vertices
+                and self.triangles == other.triangles)
+
+    __hash__ = None  # modifiable : pas de hash
+
+    def __repr__(self) -> str:
+        """Résumé (nombre de sommets et de triangles)."""
+        return (f"Mesh(sommets={self.vertex_count}, "
+                f"triangles={self.triangle_count})")
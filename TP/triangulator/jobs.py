@@ -0,0 +1,187 @@
+"""Module Jobs - Triangulations asynchrones (tâches en arrière-plan).
+
+Certains PointSets demandent plus de temps de calcul que le délai HTTP
+du répartiteur de charge. Une tâche (job) est soumise puis exécutée par
+un pool de threads en arrière-plan ; le client interroge son état et
+récupère le résultat plus tard. Les tâches terminées sont conservées
+`ttl` secondes, puis oubliées.
+
+Le nombre de tâches non terminées est borné (`JobQueueFullError` au-delà),
+et une tâche soumise avec la même clé qu'une tâche non terminée est
+confondue avec elle : répéter une requête ne multiplie pas le travail.
+"""
+
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+# États d'une tâche
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+# Étapes du pipeline, dans l'ordre, pour le suivi de progression
+STEPS = ("fetch", "decode", "triangulate", "serialize")
+
+# Valeurs par défaut (threads d'exécution, durée de conservation en s,
+# nombre de tâches non terminées)
+DEFAULT_WORKERS = 2
+DEFAULT_TTL = 600.0
+DEFAULT_MAX_PENDING = 64
+
+
+class JobQueueFullError(Exception):
+    """Trop de tâches en cours ou en attente : la soumission est refusée."""
+
+    pass
+
+
+class Job:
+    """Une tâche de triangulation et son état courant."""
+
+    def __init__(self, point_set_id: Any, engine: str) -> None:
+        """Crée une tâche en attente, d'identifiant aléatoire."""
+        self.id = uuid.uuid4()
+        self.point_set_id = point_set_id
+        self.engine = engine
+        self.status = PENDING
+        self.step: str | None = None
+        self.result: Any = None
+        self.error: Exception | None = None
+        self.finished_at: float | None = None
+        self._finished = threading.Event()
+
+    def set_step(self, step: str) -> None:
+        """Enregistre l'étape du pipeline en cours (voir `STEPS`)."""
+        self.step = step
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Attend la fin de la tâche ; renvoie False si le délai expire."""
+        return self._finished.wait(timeout)
+
+    @property
+    def progress(self) -> float:
+        """Avancement entre 0 et 1, d'après l'étape en cours."""
+        if self.status in (DONE, FAILED):
+            return 1.0
+        if self.step is None:
+            return 0.0
+        return STEPS.index(self.step) / len(STEPS)
+
+    def to_dict(self) -> dict:
+        """Renvoie l'état de la tâche (corps JSON de GET /jobs/{id})."""
+        return {
+            "jobId": str(self.id),
+            "pointSetId": str(self.point_set_id),
+            "engine": self.engine,
+            "status": self.status,
+            "step": self.step,
+            "progress": round(self.progress, 2),
+        }
+
+
+class JobManager:
+    """Exécute les tâches en arrière-plan et les conserve (thread-safe)."""
+
+    def __init__(self, workers: int = DEFAULT_WORKERS,
+                 ttl: float = DEFAULT_TTL,
+                 max_pending: int = DEFAULT_MAX_PENDING) -> None:
+        """Crée le gestionnaire.
+
+        Args:
+            workers: Nombre de tâches exécutées en parallèle.
+            ttl: Durée de conservation d'une tâche terminée, en secondes.
+            max_pending: Nombre maximal de tâches non terminées (en cours
+                ou en attente) ; 0 pour ne pas le limiter.
+
+        """
+        self.ttl = ttl
+        self.max_pending = max_pending
+        self._jobs: dict[uuid.UUID, Job] = {}
+        # Tâches non terminées, par clé de soumission
+        self._active: dict[Any, Job] = {}
+        self._unfinished = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            workers, thread_name_prefix="triangulation-job"
+        )
+
+    def submit(self, point_set_id: Any, engine: str,
+               fn: Callable[[Job], Any], key: Any = None) -> Job:
+        """Crée une tâche et planifie son exécution.
+
+        Args:
+            point_set_id: Le PointSet à trianguler.
+            engine: Le moteur de triangulation.
+            fn: Le calcul ; reçoit la tâche (pour `set_step`) et renvoie
+                son résultat.
+            key: Identifie le résultat calculé (ex. l'ETag) : si une tâche
+                non terminée a la même clé, elle est renvoyée au lieu d'en
+                créer une autre. None pour toujours créer une tâche.
+
+        Returns:
+            La tâche créée (encore en attente), ou celle de même clé.
+
+        Raises:
+            JobQueueFullError: Si `max_pending` tâches ne sont pas terminées.
+
+        """
+        with self._lock:
+            self._purge()
+            if key is not None and key in self._active:
+                return self._active[key]
+            if self.max_pending and self._unfinished >= self.max_pending:
+                raise JobQueueFullError(
+                    f"{self.max_pending} tâches déjà en cours ou en attente."
+                )
+            job = Job(point_set_id, engine)
+            self._jobs[job.id] = job
+            self._unfinished += 1
+            if key is not None:
+                self._active[key] = job
+        self._executor.submit(self._run, job, fn, key)
+        return job
+
+    def get(self, job_id: uuid.UUID) -> Job | None:
+        """Renvoie la tâche job_id, ou None si inconnue ou expirée."""
+        with self._lock:
+            self._purge()
+            return self._jobs.get(job_id)
+
+    def shutdown(self) -> None:
+        """Attend la fin des tâches en cours et arrête les threads."""
+        self._executor.shutdown()
+
+    def _run(self, job: Job, fn: Callable[[Job], Any], key: Any) -> None:
+        job.status = RUNNING
+        try:
+            job.result = fn(job)
+            job.status = DONE
+        except Exception as e:
+            job.error = e
+            job.status = FAILED
+        finally:
+            with self._lock:
+                self._unfinished -= 1
+                if key is not None and self._active.get(key) is job:
+                    del self._active[key]
+            job.finished_at = time.monotonic()
+            job._finished.set()
+
+    def _purge(self) -> None:
+        # Oublie les tâches terminées depuis plus de ttl (sous le verrou)
+        limit = time.monotonic() - self.ttl
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished_at is not None and job.finished_at < limit
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def __len__(self) -> int:
+        """Nombre de tâches conservées."""
+        return len(self._jobs)
@@ -4,22 +4,216 @@ Ce module gère la communication (requêtes HTTP) avec le service
 externe PointSetManager.
 """
 
+import http.client
+import threading
+import time
 import urllib.request
+from collections.abc import Callable
+from typing import Any
 from urllib.error import HTTPError, URLError  # noqa: F401
+from urllib.parse import urlsplit
 from uuid import UUID
 
+from . import metrics
+from .binary_utils import PointSetDecoder
+
+# Nombre de connexions inactives gardées par hôte, et durée (en secondes)
+# au-delà de laquelle une connexion inactive est fermée plutôt que reprise
+DEFAULT_POOL_SIZE = 8
+DEFAULT_IDLE_TIMEOUT = 30.0
+
+# Erreurs signalant une connexion réutilisée que le serveur a fermée entre
+# deux requêtes : la requête est rejouée une fois sur une connexion neuve
+_STALE_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+)
+
+# Échecs des appels au PointSetManager, par statut HTTP (ou "connection")
+MANAGER_ERRORS = metrics.REGISTRY.counter(
+    "triangulator_manager_errors_total",
+    "Échecs des appels au PointSetManager, par statut HTTP ou 'connection'.",
+    label="status",
+)
+
 
 class PointSetManagerError(Exception):
     """Exception de base pour les problèmes du client."""
 
     pass
 
-def fetch_pointset_from_manager(base_url: str, pointSetId: UUID) -> bytes:
+
+class ConnectionPool:
+    """Pool thread-safe de connexions HTTP persistantes (keep-alive).
+
+    Les connexions sont rangées par hôte (schéma, nom, port). Une requête
+    reprend la connexion inactive la plus récente de son hôte, ou en ouvre
+    une nouvelle ; la connexion est rendue au pool après lecture complète
+    de la réponse, sauf si le serveur a annoncé sa fermeture. Au plus
+    `size` connexions inactives sont gardées par hôte, et celles restées
+    inactives plus de `idle_timeout` secondes sont fermées.
+    """
+
+    def __init__(self, size: int = DEFAULT_POOL_SIZE,
+                 idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+                 timeout: float = 5.0) -> None:
+        """Crée un pool vide.
+
+        Args:
+            size: Nombre maximal de connexions inactives gardées par hôte.
+            idle_timeout: Durée d'inactivité (secondes) avant fermeture.
+            timeout: Timeout des sockets (connexion et lecture), en secondes.
+
+        """
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self._idle: dict[tuple[str, str, int],
+                         list[tuple[http.client.HTTPConnection, float]]] = {}
+        self._lock = threading.Lock()
+
+    def _connect(self, key: tuple[str, str, int]) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=self.timeout)
+        return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def _acquire(self, key: tuple[str, str, int],
+                 ) -> tuple[http.client.HTTPConnection, bool]:
+        # Renvoie une connexion et True si elle est réutilisée
+        now = time.monotonic()
+        expired: list[http.client.HTTPConnection] = []
+        conn = None
+        with self._lock:
+            idle = self._idle.get(key, [])
+            if idle:
+                # Les plus récentes sont en queue : si la dernière a expiré,
+                # toutes les autres aussi
+                candidate, last_used = idle.pop()
+                if now - last_used <= self.idle_timeout:
+                    conn = candidate
+                else:
+                    expired = [candidate, *(c for c, _ in idle)]
+                    idle.clear()
+        for stale in expired:
+            stale.close()
+        if conn is not None:
+            return conn, True
+        return self._connect(key), False
+
+    def _release(self, key: tuple[str, str, int],
+                 conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.size:
+                idle.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+    def get(self, url: str,
+            reader: Callable[[http.client.HTTPResponse], Any] | None = None,
+            timeout: float | None = None,
+            ) -> tuple[int, str, http.client.HTTPMessage, Any]:
+        """Envoie une requête GET et lit entièrement la réponse.
+
+        Args:
+            url: L'URL absolue à appeler (http ou https).
+            reader: Lit le corps d'une réponse 200 au fil de sa réception
+                (au lieu de `read()`) et renvoie ce qui tient lieu de corps.
+                Les octets qu'il laisse sont lus et ignorés ; s'il lève une
+                exception, la connexion est fermée et l'exception propagée.
+            timeout: Timeout des sockets pour cet appel, s'il est plus
+                court que celui du pool (temps restant à la requête).
+
+        Returns:
+            Le statut, la raison, les en-têtes et le corps de la réponse.
+
+        Raises:
+            URLError: S'il y a un problème de connexion (panne réseau,
+                timeout), y compris après la reprise sur socket périmée.
+
+        """
+        parts = urlsplit(url)
+        scheme = parts.scheme or "http"
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname or "", port)
+        path = parts.path or "/"
+        if parts.query:
+            path += f"?{parts.query}"
+
+        timeout = self.timeout if timeout is None else min(timeout, self.timeout)
+        conn, reused = self._acquire(key)
+        try:
+            try:
+                _set_timeout(conn, timeout)
+                conn.request("GET", path)
+                response = conn.getresponse()
+            except _STALE_ERRORS:
+                if not reused:
+                    raise
+                # Connexion fermée par le serveur pendant son inactivité :
+                # une seule nouvelle tentative, sur une connexion neuve
+                conn.close()
+                conn = self._connect(key)
+                _set_timeout(conn, timeout)
+                conn.request("GET", path)
+                response = conn.getresponse()
+            if response.status == 200 and reader is not None:
+                body = reader(response)
+                # Vider le reste pour pouvoir réutiliser la connexion
+                response.read()
+            else:
+                body = response.read()
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            raise URLError(e) from e
+        except BaseException:
+            # Réponse lue en partie (ex. PointSet rejeté) : connexion perdue
+            conn.close()
+            raise
+
+        if response.will_close:
+            conn.close()
+        else:
+            self._release(key, conn)
+        return response.status, response.reason, response.headers, body
+
+    def close(self) -> None:
+        """Ferme toutes les connexions inactives du pool."""
+        with self._lock:
+            idle = [c for conns in self._idle.values() for c, _ in conns]
+            self._idle.clear()
+        for conn in idle:
+            conn.close()
+
+
+def _set_timeout(conn: http.client.HTTPConnection, timeout: float) -> None:
+    # Le timeout d'une connexion n'est lu qu'à l'ouverture du socket : une
+    # connexion réutilisée doit aussi changer celui de son socket
+    conn.timeout = timeout
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout)
+
+
+def fetch_pointset_from_manager(base_url: str, pointSetId: UUID,
+                                pool: ConnectionPool | None = None,
+                                decoder: PointSetDecoder | None = None,
+                                timeout: float | None = None,
+                                ) -> bytes:
     """Appelle l'endpoint GET /pointset/{pointSetId} du PointSetManager.
 
     Args:
         base_url: L'URL de base du service PointSetManager (ex: "http://localhost:8080").
         pointSetId: L'UUID du PointSet à récupérer.
+        pool: Pool de connexions persistantes à utiliser. Sans pool, une
+            connexion est ouverte (urlopen) pour cet appel seulement.
+        decoder: Décodeur incrémental : s'il est donné, le PointSet est
+            décodé pendant sa réception (coordonnées dans `decoder.coords`).
+        timeout: Timeout des sockets, en secondes, s'il est inférieur aux
+            5 secondes par défaut (temps restant à la requête).
 
     Returns:
         Les données binaires brutes (le PointSet) en cas de succès (200 OK).
@@ -27,15 +221,35 @@ def fetch_pointset_from_manager(base_url: str, pointSetId: UUID) -> bytes:
     Raises:
         HTTPError: Si le manager renvoie une erreur 4xx ou 5xx.
         URLError: S'il y a un problème de connexion (panne réseau, timeout).
+        BinaryFormatError: Si le PointSet reçu est mal formé (avec decoder).
 
     """
     url_to_call = f"{base_url}/pointset/{pointSetId}"
-    
+
+    def read_body(response: http.client.HTTPResponse) -> bytes:
+        if decoder is None:
+            return response.read()
+        # `length` : octets restant à lire d'après Content-Length (None
+        # en Transfer-Encoding: chunked)
+        decoder.readfrom(response, response.length)
+        return decoder.data
+
     try:
+        if pool is not None:
+            status, reason, headers, body = pool.get(
+                url_to_call, reader=read_body, timeout=timeout
+            )
+            if status == 200:
+                return body
+            # Même contrat qu'urlopen : tout statut autre que 200 est une
+            # HTTPError (404, 503...)
+            raise HTTPError(url_to_call, status, reason, headers, None)
+
         # Timeout de 5 secondes pour ne pas bloquer indéfiniment
-        with urllib.request.urlopen(url_to_call, timeout=5) as response:
+        timeout = 5 if timeout is None else min(timeout, 5)
+        with urllib.request.urlopen(url_to_call, timeout=timeout) as response:
             if response.status == 200:
-                return response.read()
+                return read_body(response)
             else:
                 # Bien que urlopen lève généralement HTTPError pour les non-200,
                 # on gère explicitement les codes de succès inattendus (ex: 204).
@@ -50,10 +264,10 @@ def fetch_pointset_from_manager(base_url: str, pointSetId: UUID) -> bytes:
     except HTTPError as e:
         # On relance l'erreur pour qu'elle soit gérée par le contrôleur (app.py)
         # C'est important pour renvoyer le bon code (404, 503) au client final.
-        print(f"Erreur HTTP {e.code} en appelant {url_to_call}")
+        MANAGER_ERRORS.inc(label_value=str(e.code))
         raise e
         
     except URLError as e:
         # Erreur de connexion bas niveau (DNS, Refused, Timeout)
-        print(f"Erreur de connexion vers {url_to_call}: {e.reason}")
+        MANAGER_ERRORS.inc(label_value="connection")
         raise e
\ No newline at end of file
@@ -0,0 +1,235 @@
+"""Module Metrics - Métriques du service, au format texte de Prometheus.
+
+Histogrammes de durée (une par étape du pipeline, et par requête) et
+compteurs, exposés par GET /metrics. Enregistrer un échantillon ne coûte
+qu'une recherche dichotomique parmi les bornes et quelques additions sous
+un verrou : le texte n'est produit qu'à la lecture de /metrics.
+
+Les durées des étapes nommées sont aussi relevées pour la requête en
+cours (voir `start_timings`), pour l'en-tête Server-Timing.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextvars import ContextVar
+
+# Bornes par défaut des histogrammes de durée, en secondes (1 ms à 1 min)
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+# Type MIME du format texte d'exposition de Prometheus
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Un échantillon : suffixe du nom, étiquettes ('{...}' ou "") et valeur
+Sample = tuple[str, str, float]
+
+# Durées (en secondes) des étapes de la requête en cours, par nom ; None
+# hors d'une requête suivie (tâches, lots)
+_TIMINGS: ContextVar[dict[str, float] | None] = ContextVar(
+    "timings", default=None
+)
+
+
+def start_timings() -> dict[str, float]:
+    """Commence le relevé des étapes de la requête en cours et le renvoie."""
+    timings: dict[str, float] = {}
+    _TIMINGS.set(timings)
+    return timings
+
+
+def stop_timings() -> None:
+    """Arrête le relevé des étapes de la requête en cours."""
+    _TIMINGS.set(None)
+
+
+def _format_value(value: float) -> str:
+    """Renvoie le texte d'une valeur (ou d'une borne) d'échantillon."""
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+def _format_label(name: str, value: str) -> str:
+    """Renvoie le texte d'une étiquette (valeur échappée)."""
+    escaped = (
+        value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    )
+    return f'{{{name}="{escaped}"}}'
+
+
+class Counter:
+    """Compteur monotone, avec au plus une étiquette (un total par valeur)."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, label: str | None = None) -> None:
+        """Crée le compteur.
+
+        Args:
+            name: Le nom de la métrique (suffixé par convention de _total).
+            help: Sa description (ligne # HELP).
+            label: Le nom de son étiquette, ou None pour un total unique.
+
+        """
+        self.name = name
+        self.help = help
+        self.label = label
+        self._values: dict[str | None, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, label_value: str | None = None) -> None:
+        """Ajoute amount au total de label_value."""
+        with self._lock:
+            self._values[label_value] = self._values.get(label_value, 0) + amount
+
+    def value(self, label_value: str | None = None) -> float:
+        """Renvoie le total courant de label_value."""
+        return self._values.get(label_value, 0)
+
+    def samples(self) -> Iterator[Sample]:
+        """Renvoie les échantillons de la métrique (un par valeur)."""
+        with self._lock:
+            values = sorted(self._values.items(), key=lambda item: str(item[0]))
+        if self.label is None:
+            yield "", "", values[0][1] if values else 0
+            return
+        for label_value, total in values:
+            yield "", _format_label(self.label, str(label_value)), total
+
+
+class Histogram:
+    """Histogramme de valeurs (durées), réparties entre des bornes fixes."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str,
+                 buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """Crée l'histogramme.
+
+        Args:
+            name: Le nom de la métrique (ex. "triangulator_fetch_seconds").
+            help: Sa description (ligne # HELP).
+            buckets: Les bornes supérieures des classes ; la classe +Inf
+                est ajoutée d'office.
+
+        """
+        self.name = name
+        self.help = help
+        self._bounds = tuple(sorted(buckets))
+        # Effectif de chaque classe (non cumulé), la dernière étant +Inf
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Enregistre une valeur."""
+        # Première borne >= value (les bornes sont inclusives : le="...")
+        i = bisect_left(self._bounds, value)
+        with self._lock:
+            self._counts[i] += 1
+            self._sum += value
+
+    def time(self, stage: str | None = None) -> "Timer":
+        """Renvoie un gestionnaire de contexte qui enregistre sa durée.
+
+        Si stage est donné, la durée est aussi ajoutée à celle de cette
+        étape dans le relevé de la requête en cours (`start_timings`).
+        """
+        return Timer(self, stage)
+
+    @property
+    def count(self) -> int:
+        """Nombre de valeurs enregistrées."""
+        return sum(self._counts)
+
+    def samples(self) -> Iterator[Sample]:
+        """Renvoie les échantillons : classes cumulées, somme et effectif."""
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        cumulative = 0
+        for bound, count in zip(self._bounds + (float("inf"),), counts,
+                                strict=True):
+            cumulative += count
+            yield "_bucket", _format_label("le", _format_value(bound)), cumulative
+        yield "_sum", "", total
+        yield "_count", "", cumulative
+
+
+class Timer:
+    """Mesure la durée d'un bloc `with` et l'enregistre dans un histogramme."""
+
+    __slots__ = ("histogram", "stage", "start")
+
+    def __init__(self, histogram: Histogram, stage: str | None = None) -> None:
+        """Crée la mesure (démarrée à l'entrée dans le bloc)."""
+        self.histogram = histogram
+        self.stage = stage
+        self.start = 0.0
+
+    def __enter__(self) -> "Timer":
+        """Démarre la mesure."""
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Enregistre la durée, que le bloc ait réussi ou non."""
+        duration = time.perf_counter() - self.start
+        self.histogram.observe(duration)
+        if self.stage is not None:
+            timings = _TIMINGS.get()
+            if timings is not None:
+                timings[self.stage] = timings.get(self.stage, 0.0) + duration
+
+
+class Registry:
+    """Ensemble de métriques, rendu d'un bloc au format de Prometheus."""
+
+    def __init__(self) -> None:
+        """Crée un registre vide."""
+        self._metrics: dict[str, Counter | Histogram] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: Counter | Histogram) -> Counter | Histogram:
+        """Ajoute une métrique et la renvoie.
+
+        Raises:
+            ValueError: Si une métrique de même nom existe déjà.
+
+        """
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Métrique déjà enregistrée: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, label: str | None = None) -> Counter:
+        """Crée et enregistre un compteur (voir `Counter`)."""
+        return self.register(Counter(name, help, label))
+
+    def histogram(self, name: str, help: str,
+                  buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        """Crée et enregistre un histogramme (voir `Histogram`)."""
+        return self.register(Histogram(name, help, buckets))
+
+    def render(self) -> str:
+        """Renvoie toutes les métriques au format texte de Prometheus."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for suffix, labels, value in metric.samples():
+                lines.append(
+                    f"{metric.name}{suffix}{labels} {_format_value(value)}"
+                )
+        return "\n".join(lines) + "\n"
+
+
+# Registre du service, exposé par GET /metrics
+REGISTRY = Registry()
@@ -0,0 +1,88 @@
+"""Module Profiling - Profilage échantillonné (cProfile) des requêtes.
+
+Pour comprendre une requête lente en production sans redéployer : une
+requête sur `every` (ou une requête désignée explicitement) est exécutée
+sous `cProfile`, et ses statistiques sont écrites dans un répertoire
+local, un fichier .prof par requête (lisible avec `pstats` ou snakeviz).
+
+Une seule requête est profilée à la fois (un seul profileur actif par
+processus) ; seul le thread de la requête est mesuré : un calcul envoyé
+au pool de processus n'y apparaît que comme une attente.
+"""
+
+import cProfile
+import itertools
+import os
+import threading
+import time
+
+
+class SamplingProfiler:
+    """Profile une requête sur `every` et enregistre ses statistiques."""
+
+    def __init__(self, directory: str | None, every: int = 0) -> None:
+        """Crée le profileur.
+
+        Args:
+            directory: Le répertoire des fichiers .prof ; None pour
+                désactiver le profilage (même forcé).
+            every: Profile une requête sur every ; 0 pour ne profiler que
+                les requêtes forcées.
+
+        """
+        self.directory = directory
+        self.every = every
+        self._requests = itertools.count(1)
+        self._active = threading.Lock()
+
+    def start(self, forced: bool = False) -> cProfile.Profile | None:
+        """Démarre le profilage de la requête en cours, si elle est tirée.
+
+        Args:
+            forced: Profiler cette requête quel que soit l'échantillonnage.
+
+        Returns:
+            Le profil démarré (à passer à `stop`), ou None si la requête
+            n'est pas profilée.
+
+        """
+        if self.directory is None:
+            return None
+        sampled = self.every > 0 and next(self._requests) % self.every == 0
+        if not (forced or sampled):
+            return None
+        # Une autre requête est déjà profilée : celle-ci ne l'est pas
+        if not self._active.acquire(blocking=False):
+            return None
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Un autre profileur (hors de ce module) est déjà actif
+            self._active.release()
+            return None
+        return profile
+
+    def stop(self, profile: cProfile.Profile, name: str,
+             vertices: int | None) -> str:
+        """Arrête le profilage et écrit ses statistiques.
+
+        Args:
+            profile: Le profil renvoyé par `start`.
+            name: L'identifiant de la requête (ex. le pointSetId).
+            vertices: Le nombre de sommets triangulés, s'il est connu.
+
+        Returns:
+            Le chemin du fichier .prof écrit :
+            `<name>-<vertices>v-<horodatage en ns>.prof`.
+
+        """
+        profile.disable()
+        self._active.release()
+        count = "na" if vertices is None else str(vertices)
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(
+            self.directory, f"{name}-{count}v-{time.time_ns()}.prof"
+        )
+        profile.dump_stats(path)
+        return path
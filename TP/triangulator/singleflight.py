@@ -0,0 +1,105 @@
+"""Module SingleFlight - Regroupement des calculs concurrents identiques.
+
+Quand plusieurs requêtes demandent en même temps le même résultat (même
+PointSet, même moteur), une seule l'exécute ; les autres attendent la fin
+de ce calcul "en vol" et en partagent le résultat, ou l'exception levée.
+Chacun n'attend que jusqu'à sa propre échéance : un calcul abandonné à
+l'échéance de l'appelant qui l'a lancé est relancé pour ceux qui ont
+encore du temps.
+"""
+
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from .deadline import Deadline, DeadlineExceeded
+
+
+class _Call:
+    """Un calcul en vol : son résultat, ou son exception, une fois terminé."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Regroupe les appels concurrents portant sur une même clé (thread-safe).
+
+    Les appels successifs ne sont pas mis en cache : dès qu'un calcul est
+    terminé, le suivant pour la même clé relance la fonction.
+    """
+
+    def __init__(self) -> None:
+        """Crée un groupe sans calcul en vol."""
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        # Nombre d'appels servis par le calcul d'un autre appelant
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any],
+           deadline: Deadline | None = None,
+           retry_on: tuple[type[BaseException], ...] = (DeadlineExceeded,),
+           ) -> Any:
+        """Exécute fn pour key, ou attend le calcul déjà en vol pour key.
+
+        Args:
+            key: La clé identifiant le calcul.
+            fn: La fonction (sans argument) qui effectue le calcul.
+            deadline: L'échéance de cet appelant (celle que fn
+                respecte), qui borne aussi son attente d'un calcul lancé
+                par un autre ; None pour attendre sans limite.
+            retry_on: Les exceptions propres à l'échéance de l'appelant
+                qui a lancé le calcul : les autres appelants, s'il leur
+                reste du temps, relancent fn au lieu de les recevoir.
+
+        Returns:
+            Le résultat de fn, calculé par cet appel ou par un appel
+            concurrent de même clé.
+
+        Raises:
+            DeadlineExceeded: Si `deadline` passe avant la fin du calcul
+                d'un autre appelant (qui, lui, continue).
+            Exception: L'exception levée par fn, propagée à tous les
+                appelants qui ont partagé le calcul (sauf celles de
+                `retry_on`).
+
+        """
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if leader:
+                    call = self._calls[key] = _Call()
+                else:
+                    self.shared += 1
+            if leader:
+                break
+
+            timeout = deadline.remaining() if deadline is not None else None
+            if not call.done.wait(timeout):
+                raise DeadlineExceeded(
+                    f"Délai de {deadline.timeout:g} s dépassé."
+                )
+            if call.error is None:
+                return call.result
+            # Échéance de l'appelant qui a lancé le calcul, pas la nôtre :
+            # relancer le calcul (ou attendre celui d'un autre appelant)
+            if not isinstance(call.error, retry_on) or (
+                deadline is not None and deadline.expired()
+            ):
+                raise call.error
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
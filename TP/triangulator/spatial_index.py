@@ -0,0 +1,103 @@
+"""Module Index Spatial - Ordre de Morton (Z-order) des sommets.
+
+Ce module fournit un index spatial léger, dans l'esprit d'earcut :
+chaque sommet reçoit un code de Morton (entrelacement des bits de ses
+coordonnées quantifiées), puis les sommets sont chaînés dans l'ordre de
+ce code. Les sommets d'une boîte englobante sont alors contigus dans la
+chaîne entre les codes de ses coins min et max, ce qui permet à `core`
+de ne tester que les sommets proches d'une oreille candidate.
+"""
+
+from collections.abc import Iterator
+
+from .geometry import Point
+
+# Les coordonnées sont quantifiées sur 15 bits (comme earcut)
+_Z_RANGE = 32767
+
+
+def _interleave(v: int) -> int:
+    """Étale les 16 bits de poids faible de v sur les bits pairs."""
+    v = (v | (v << 8)) & 0x00FF00FF
+    v = (v | (v << 4)) & 0x0F0F0F0F
+    v = (v | (v << 2)) & 0x33333333
+    return (v | (v << 1)) & 0x55555555
+
+
+class MortonIndex:
+    """Chaîne des sommets triée par code de Morton.
+
+    L'index est construit une fois en O(n log n). Retirer un sommet
+    (oreille découpée) est en O(1), et une requête par boîte englobante
+    ne parcourt que la portion de chaîne comprise entre les codes des
+    coins de la boîte.
+    """
+
+    __slots__ = ("_xs", "_ys", "_z", "_prev_z", "_next_z",
+                 "_min_x", "_min_y", "_inv_size")
+
+    def __init__(self, vertices: list[Point]) -> None:
+        """Construit l'index pour les sommets donnés."""
+        n = len(vertices)
+        self._xs = [p[0] for p in vertices]
+        self._ys = [p[1] for p in vertices]
+
+        self._min_x = min(self._xs) if n else 0.0
+        self._min_y = min(self._ys) if n else 0.0
+        size = max(
+            max(self._xs) - self._min_x, max(self._ys) - self._min_y
+        ) if n else 0.0
+        self._inv_size = _Z_RANGE / size if size > 0 else 0.0
+
+        self._z = [self.z_order(x, y) for x, y in vertices]
+
+        # Chaîne doublement liée dans l'ordre des codes (-1 = extrémité)
+        order = sorted(range(n), key=self._z.__getitem__)
+        self._prev_z = [-1] * n
+        self._next_z = [-1] * n
+        for a, b in zip(order, order[1:], strict=False):
+            self._next_z[a] = b
+            self._prev_z[b] = a
+
+    def z_order(self, x: float, y: float) -> int:
+        """Renvoie le code de Morton d'un point (borné à la grille)."""
+        qx = min(max(int((x - self._min_x) * self._inv_size), 0), _Z_RANGE)
+        qy = min(max(int((y - self._min_y) * self._inv_size), 0), _Z_RANGE)
+        return _interleave(qx) | (_interleave(qy) << 1)
+
+    def remove(self, i: int) -> None:
+        """Retire le sommet i de la chaîne."""
+        p = self._prev_z[i]
+        n = self._next_z[i]
+        if p != -1:
+            self._next_z[p] = n
+        if n != -1:
+            self._prev_z[n] = p
+        self._prev_z[i] = self._next_z[i] = -1
+
+    def query(self, start: int, min_x: float, min_y: float,
+              max_x: float, max_y: float) -> Iterator[int]:
+        """Itère sur les sommets de la boîte englobante donnée.
+
+        Le parcours part du sommet `start` (qui doit être dans la boîte et
+        encore indexé) et s'étend dans les deux sens de la chaîne tant que
+        les codes restent dans l'intervalle [z(min), z(max)]. Le sommet
+        `start` lui-même n'est pas renvoyé.
+        """
+        xs = self._xs
+        ys = self._ys
+        z = self._z
+        min_z = self.z_order(min_x, min_y)
+        max_z = self.z_order(max_x, max_y)
+
+        j = self._next_z[start]
+        while j != -1 and z[j] <= max_z:
+            if min_x <= xs[j] <= max_x and min_y <= ys[j] <= max_y:
+                yield j
+            j = self._next_z[j]
+
+        j = self._prev_z[start]
+        while j != -1 and z[j] >= min_z:
+            if min_x <= xs[j] <= max_x and min_y <= ys[j] <= max_y:
+                yield j
+            j = self._prev_z[j]
@@ -0,0 +1,151 @@
+"""Module Store - Stockage disque persistant des triangulations.
+
+Les caches mémoire de `app` sont perdus à chaque redémarrage. Ce module
+conserve les réponses 'Triangles' déjà sérialisées dans un répertoire
+local, un fichier par résultat, pour qu'elles survivent aux déploiements.
+
+- Écritures atomiques : fichier temporaire dans le même répertoire, puis
+  `os.replace` ; un lecteur ne voit jamais de fichier à moitié écrit.
+- Taille bornée : au-delà de `max_bytes`, les fichiers les moins
+  récemment lus (date de modification, rafraîchie à chaque lecture) sont
+  supprimés.
+- Lecture par `mmap` : le contenu est servi par tranches depuis le
+  fichier projeté en mémoire, sans être copié en entier dans le tas.
+"""
+
+import contextlib
+import mmap
+import os
+import tempfile
+import threading
+from collections.abc import Iterable, Iterator
+
+# Extension des fichiers de résultat, et des fichiers en cours d'écriture
+_SUFFIX = ".tri"
+_TMP_SUFFIX = ".tmp"
+
+# Taille des tranches envoyées au serveur WSGI depuis le fichier projeté
+CHUNK_SIZE = 256 * 1024
+
+
+class StoredTriangulation:
+    """Résultat lu depuis le disque, projeté en mémoire (mmap).
+
+    Le fichier commence par un octet de longueur et le chemin de calcul
+    (ASCII), suivis des données 'Triangles' à renvoyer telles quelles.
+    """
+
+    __slots__ = ("path", "_map", "_offset")
+
+    def __init__(self, mapped: mmap.mmap) -> None:
+        """Décode l'en-tête du fichier projeté."""
+        length = mapped[0]
+        self.path = mapped[1:1 + length].decode("ascii") or None
+        self._map = mapped
+        self._offset = 1 + length
+
+    def __len__(self) -> int:
+        """Taille des données 'Triangles' (sans l'en-tête)."""
+        return len(self._map) - self._offset
+
+    def iter_chunks(self, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        """Itère sur les données par tranches, puis libère la projection."""
+        try:
+            for start in range(self._offset, len(self._map), chunk_size):
+                yield self._map[start:start + chunk_size]
+        finally:
+            self._map.close()
+
+    def close(self) -> None:
+        """Libère la projection sans lire les données."""
+        self._map.close()
+
+
+class TriangulationStore:
+    """Répertoire de résultats sérialisés, borné en octets (thread-safe)."""
+
+    def __init__(self, directory: str, max_bytes: int) -> None:
+        """Ouvre (ou crée) le répertoire et recense les fichiers existants.
+
+        Args:
+            directory: Le répertoire de stockage.
+            max_bytes: Taille totale maximale des fichiers, en octets.
+
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+        self.current_bytes = 0
+        for entry in os.scandir(directory):
+            if entry.name.endswith(_TMP_SUFFIX):
+                # Écriture interrompue (arrêt brutal) : jamais publiée
+                os.unlink(entry.path)
+            elif entry.name.endswith(_SUFFIX):
+                self.current_bytes += entry.stat().st_size
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.directory, name + _SUFFIX)
+
+    def get(self, name: str) -> StoredTriangulation | None:
+        """Renvoie le résultat `name` projeté en mémoire, ou None."""
+        try:
+            with open(self._file(name), "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):
+            # Absent, ou évincé entre-temps (ValueError : fichier vide)
+            return None
+        # Marque le fichier comme récemment utilisé (pour l'éviction)
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(self._file(name))
+        return StoredTriangulation(mapped)
+
+    def put(self, name: str, chunks: Iterable[bytes],
+            path: str | None = None) -> None:
+        """Écrit atomiquement le résultat `name`, puis applique la borne.
+
+        Args:
+            name: Nom du résultat (sans extension, ex. son ETag).
+            chunks: Les morceaux des données 'Triangles'.
+            path: Le chemin de calcul, relu avec le résultat.
+
+        """
+        header = (path or "").encode("ascii")
+        fd, tmp_name = tempfile.mkstemp(suffix=_TMP_SUFFIX, dir=self.directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(bytes((len(header),)) + header)
+                for chunk in chunks:
+                    f.write(chunk)
+                size = f.tell()
+            if size > self.max_bytes:
+                os.unlink(tmp_name)
+                return
+            target = self._file(name)
+            with self._lock:
+                with contextlib.suppress(FileNotFoundError):
+                    self.current_bytes -= os.stat(target).st_size
+                os.replace(tmp_name, target)
+                self.current_bytes += size
+                self._evict()
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+
+    def _evict(self) -> None:
+        # Supprime les fichiers les plus anciens jusqu'à repasser sous la
+        # borne (appelé sous le verrou)
+        if self.current_bytes <= self.max_bytes:
+            return
+        entries = sorted(
+            (e for e in os.scandir(self.directory) if e.name.endswith(_SUFFIX)),
+            key=lambda e: e.stat().st_mtime_ns,
+        )
+        for entry in entries:
+            if self.current_bytes <= self.max_bytes:
+                break
+            size = entry.stat().st_size
+            os.unlink(entry.path)
+            self.current_bytes -= size
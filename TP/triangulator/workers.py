@@ -0,0 +1,133 @@
+"""Module Workers - Exécution des calculs de triangulation hors du thread HTTP.
+
+`core.compute_triangulation` est du Python pur : exécuté sur le thread de
+la requête, il garde le GIL et bloque toutes les autres requêtes du
+processus. Ce module l'envoie dans un pool de processus, en échangeant
+des `Mesh` (tableaux `array`, sérialisés comme des blocs d'octets) plutôt
+que des listes de tuples.
+
+Le nombre de calculs acceptés (en cours + en attente) peut être borné :
+au-delà, `ComputePool.triangulate` lève immédiatement `PoolSaturatedError`,
+que l'application traduit en 503 avec un en-tête Retry-After.
+"""
+
+import multiprocessing
+import threading
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from . import core
+from .deadline import Deadline, DeadlineExceeded
+from .geometry import Mesh
+
+
+class PoolSaturatedError(Exception):
+    """Trop de calculs en cours ou en attente : la requête est refusée."""
+
+    pass
+
+
+def triangulate_compact(
+    mesh: Mesh, engine: str, sweep_threshold: int,
+    timeout: float | None = None,
+) -> tuple[array | None, array, str | None]:
+    """Triangule les sommets d'un `Mesh` et renvoie des tableaux plats.
+
+    Exécutée dans un processus du pool (ou sur place sans pool).
+
+    Args:
+        mesh: Les sommets à trianguler.
+        engine: Le moteur de triangulation (voir `core.ENGINES`).
+        sweep_threshold: Voir `core.compute_triangulation`.
+        timeout: Temps restant à la requête en secondes, ou None ; une
+            échéance est recréée dans le processus à partir de ce délai.
+
+    Returns:
+        Les sommets à plat (None s'ils sont inchangés, c.-à-d. sans
+        doublon retiré, pour ne pas les renvoyer), les indices des
+        triangles à plat (array d'entiers 32 bits) et le chemin de calcul.
+
+    """
+    result, path = core.triangulate_mesh(
+        mesh, engine, sweep_threshold,
+        Deadline(timeout) if timeout is not None else None,
+    )
+    vertices = None if result.vertices is mesh.vertices else result.vertices
+    return vertices, result.triangles, path
+
+
+class ComputePool:
+    """Pool de processus de calcul, à file d'attente bornée (thread-safe)."""
+
+    def __init__(self, workers: int, max_pending: int) -> None:
+        """Crée le pool.
+
+        Args:
+            workers: Nombre de processus ; 0 pour calculer sur le thread
+                appelant (sans processus), avec la même borne.
+            max_pending: Nombre maximal de calculs acceptés à la fois
+                (en cours d'exécution + en attente d'un processus) ; 0
+                pour ne pas les limiter.
+
+        """
+        self.workers = workers
+        self.max_pending = max_pending
+        self._slots = threading.BoundedSemaphore(max_pending) if max_pending else None
+        self._executor = None
+        if workers > 0:
+            # "spawn" : pas de fork d'un processus multi-thread (Flask)
+            self._executor = ProcessPoolExecutor(
+                workers, mp_context=multiprocessing.get_context("spawn")
+            )
+
+    def triangulate(
+        self, mesh: Mesh, engine: str, sweep_threshold: int,
+        deadline: Deadline | None = None,
+    ) -> tuple[Mesh, str | None]:
+        """Exécute `triangulate_compact` dans le pool et attend son résultat.
+
+        Returns:
+            La triangulation (dont le tableau de sommets est celui de mesh
+            si aucun doublon n'est retiré) et le chemin de calcul.
+
+        Raises:
+            PoolSaturatedError: Si `max_pending` calculs sont déjà acceptés.
+            DeadlineExceeded: Si l'échéance passe avant la fin du calcul.
+
+        """
+        if self._slots is not None and not self._slots.acquire(blocking=False):
+            raise PoolSaturatedError(
+                f"{self.max_pending} calculs déjà en cours ou en attente."
+            )
+        timeout = deadline.remaining() if deadline is not None else None
+        try:
+            if self._executor is None:
+                vertices, triangles, path = triangulate_compact(
+                    mesh, engine, sweep_threshold, timeout
+                )
+            else:
+                future = self._executor.submit(
+                    triangulate_compact, mesh, engine, sweep_threshold, timeout
+                )
+                try:
+                    vertices, triangles, path = future.result(timeout)
+                except FutureTimeoutError:
+                    # Encore en attente : retiré de la file ; déjà lancé : le
+                    # processus abandonne de lui-même à la même échéance
+                    future.cancel()
+                    raise DeadlineExceeded(
+                        f"Délai de {deadline.timeout:g} s dépassé."
+                    ) from None
+        finally:
+            if self._slots is not None:
+                self._slots.release()
+        # Sommets inchangés (non renvoyés par le calcul) : ceux de l'entrée
+        if vertices is None:
+            vertices = mesh.vertices
+        return Mesh(vertices, triangles), path
+
+    def shutdown(self) -> None:
+        """Arrête les processus du pool."""
+        if self._executor is not None:
+            self._executor.shutdown()